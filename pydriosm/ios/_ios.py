@@ -22,7 +22,7 @@ from pyhelpers.text import find_similar_str
 from pydriosm.downloader import BBBikeDownloader, GeofabrikDownloader
 from pydriosm.ios.utils import get_default_layer_name, validate_schema_names, validate_table_name
 from pydriosm.reader import BBBikeReader, GeofabrikReader, PBFReadParse, SHPReadParse
-from pydriosm.utils import check_relpath, remove_osm_file
+from pydriosm.utils import check_relpath, remove_osm_file, sort_layer_data
 
 
 class PostgresOSM(PostgreSQL):
@@ -1025,30 +1025,37 @@ class PostgresOSM(PostgreSQL):
 
     def _import_pbf_layer_chunk_wisely(self, layer, layer_name, subregion_name_, number_of_chunks,
                                        expand, parse_geometry, parse_properties, parse_other_tags,
-                                       pickle_pbf_file, verbose, **kwargs):
+                                       pickle_pbf_file, verbose, max_chunk_memory=None, **kwargs):
         if verbose:
             print(f'\t"{layer_name}"', end=" ... ")
 
         features = [feat for feat in layer]
         count_of_features = len(features)
 
-        list_of_chunks = split_list(lst=features, num_of_sub=number_of_chunks)
+        def parse_chunk(chunk):
+            if expand:
+                lyr_dat = pd.DataFrame(f.ExportToJson(as_object=True) for f in chunk)
+            else:
+                lyr_dat = pd.DataFrame([f.ExportToJson() for f in chunk], columns=[layer_name])
 
-        del features
-        gc.collect()
+            return PBFReadParse.transform_pbf_layer_field(
+                layer_data=lyr_dat, layer_name=layer_name, parse_geometry=parse_geometry,
+                parse_properties=parse_properties, parse_other_tags=parse_other_tags)
 
-        layer_dat_list = []
-        try:
-            for chunk in list_of_chunks:  # Loop through all chunks
-                if expand:
-                    lyr_dat = pd.DataFrame(f.ExportToJson(as_object=True) for f in chunk)
-                else:
-                    lyr_dat = pd.DataFrame([f.ExportToJson() for f in chunk], columns=[layer_name])
+        if max_chunk_memory:  # The size of each chunk is adapted to the memory budget
+            list_of_layer_dat = PBFReadParse.iter_chunks_adaptively(
+                features=features, parse_chunk=parse_chunk, max_chunk_memory=max_chunk_memory)
 
-                layer_dat = PBFReadParse.transform_pbf_layer_field(
-                    layer_data=lyr_dat, layer_name=layer_name, parse_geometry=parse_geometry,
-                    parse_properties=parse_properties, parse_other_tags=parse_other_tags)
+        else:
+            list_of_chunks = split_list(lst=features, num_of_sub=number_of_chunks)
+            list_of_layer_dat = (parse_chunk(chunk) for chunk in list_of_chunks)
+
+            del features
+            gc.collect()
 
+        layer_dat_list = []
+        try:
+            for layer_dat in list_of_layer_dat:  # Loop through all chunks
                 import_args = {
                     'layer_data': layer_dat,
                     'table_name': subregion_name_,
@@ -1076,7 +1083,8 @@ class PostgresOSM(PostgreSQL):
     def _import_subregion_osm_pbf_chunk_wisely(self, subregion_name_, osm_file_format,
                                                path_to_osm_pbf, chunk_size_limit, expand,
                                                parse_geometry, parse_properties, parse_other_tags,
-                                               if_exists, pickle_pbf_file, verbose, **kwargs):
+                                               if_exists, pickle_pbf_file, verbose,
+                                               max_chunk_memory=None, **kwargs):
         # Reference: https://gdal.org/python/osgeo.ogr.Feature-class.html
 
         if verbose:
@@ -1106,7 +1114,7 @@ class PostgresOSM(PostgreSQL):
                     lyr_dat = PBFReadParse._read_pbf_layer_chunkwise(
                         layer, number_of_chunks=number_of_chunks, readable=True, expand=expand,
                         parse_geometry=parse_geometry, parse_properties=parse_properties,
-                        parse_other_tags=parse_other_tags)
+                        parse_other_tags=parse_other_tags, max_chunk_memory=max_chunk_memory)
 
                     if pickle_pbf_file:
                         layer_names.append(layer_name)
@@ -1123,7 +1131,8 @@ class PostgresOSM(PostgreSQL):
                 layer=layer, layer_name=layer_name, subregion_name_=subregion_name_,
                 number_of_chunks=number_of_chunks, expand=expand, parse_geometry=parse_geometry,
                 parse_properties=parse_properties, parse_other_tags=parse_other_tags,
-                pickle_pbf_file=pickle_pbf_file, verbose=verbose, **kwargs)
+                pickle_pbf_file=pickle_pbf_file, verbose=verbose,
+                max_chunk_memory=max_chunk_memory, **kwargs)
 
             if pickle_pbf_file:
                 layer_names.append(layer_name)
@@ -1146,7 +1155,8 @@ class PostgresOSM(PostgreSQL):
                                  if_exists='fail', chunk_size_limit=50, expand=False,
                                  parse_geometry=False, parse_properties=False,
                                  parse_other_tags=False, pickle_pbf_file=False, rm_pbf_file=False,
-                                 confirmation_required=True, verbose=False, **kwargs):
+                                 max_chunk_memory=None, confirmation_required=True, verbose=False,
+                                 **kwargs):
         """
         Import data of geographic (sub)region(s) that do not have (sub-)subregions into a database.
 
@@ -1182,6 +1192,12 @@ class PostgresOSM(PostgreSQL):
         :type pickle_pbf_file: bool
         :param rm_pbf_file: whether to delete the downloaded .osm.pbf file, defaults to ``False``
         :type rm_pbf_file: bool
+        :param max_chunk_memory: memory budget (in MB) for parsing each chunk of features,
+            e.g. ``500``, or ``'auto'`` for a quarter of the available memory, defaults to ``None``;
+            when specified, the data is imported chunk-wisely and the size of each chunk is adapted
+            to the budget (see the method :meth:`PBFReadParse.iter_chunks_adaptively()
+            <pydriosm.reader.PBFReadParse.iter_chunks_adaptively>`)
+        :type max_chunk_memory: int | float | str | None
         :param confirmation_required: whether to ask for confirmation to proceed,
             defaults to ``True``
         :type confirmation_required: bool
@@ -1368,11 +1384,12 @@ class PostgresOSM(PostgreSQL):
                     import_args.update(read_pbf_args)
 
                     file_size_in_mb = round(os.path.getsize(path_to_osm_pbf) / (1024 ** 2), 1)
-                    if file_size_in_mb <= chunk_size_limit:
+                    if file_size_in_mb <= chunk_size_limit and not max_chunk_memory:
                         import_args.update({'if_exists': if_exists})
                         self._import_subregion_osm_pbf(**import_args, **kwargs)
                     else:
-                        import_args.update({'if_exists': 'append'})
+                        import_args.update(
+                            {'if_exists': 'append', 'max_chunk_memory': max_chunk_memory})
                         self._import_subregion_osm_pbf_chunk_wisely(**import_args, **kwargs)
 
                     if rm_pbf_file:
@@ -1471,7 +1488,7 @@ class PostgresOSM(PostgreSQL):
         if sort_by:
             sort_by_ = [sort_by] if isinstance(sort_by, str) else copy.copy(sort_by)
             if all(x in layer_dat_.columns for x in sort_by_):
-                layer_dat_.sort_values(sort_by, ignore_index=True, inplace=True)
+                layer_dat_ = sort_layer_data(layer_dat_, by=sort_by_)
 
         return layer_dat_
 
@@ -3,12 +3,18 @@ Read the OSM data extracts in various file formats.
 """
 
 from .bbbike import BBBikeReader
+from .cache import LayerCache
 from .geofabrik import GeofabrikReader
+from .index import FeatureIndex, SpatialIndex, TagIndex
+from .lazy import LazyLayers
 from .parser import PBFReadParse, SHPReadParse, VarReadParse
+from .quantized import QuantizedGeometryArray, QuantizedGeometryDtype
+from .store import LayerStore
 from .transformer import Transformer
 
 __all__ = [
-    'GeofabrikReader', 'BBBikeReader',
-    'Transformer',
-    'PBFReadParse', 'SHPReadParse', 'VarReadParse'
+    'GeofabrikReader', 'BBBikeReader', 'LazyLayers',
+    'Transformer', 'QuantizedGeometryArray', 'QuantizedGeometryDtype',
+    'PBFReadParse', 'SHPReadParse', 'VarReadParse',
+    'LayerCache', 'LayerStore', 'FeatureIndex', 'TagIndex', 'SpatialIndex',
 ]
@@ -3,12 +3,19 @@ Base reader.
 """
 
 import collections
+import concurrent.futures
+import functools
 import glob
+import hashlib
 import itertools
+import json
+import multiprocessing
 import os
 import re
 import shutil
+import zipfile
 
+import pandas as pd
 from pyhelpers._cache import _format_err_msg
 from pyhelpers.dirs import cd, validate_dir
 from pyhelpers.ops import get_number_of_chunks
@@ -17,8 +24,11 @@ from pyhelpers.store import load_pickle, save_pickle
 from pyhelpers.text import find_similar_str
 
 from pydriosm.downloader import BBBikeDownloader, GeofabrikDownloader
+from pydriosm.reader.cache import LayerCache
+from pydriosm.reader.lazy import LazyLayers
 from pydriosm.reader.parser import PBFReadParse, SHPReadParse, VarReadParse
-from pydriosm.utils import check_relpath, remove_osm_file
+from pydriosm.utils import check_relpath, drop_duplicate_ids, get_available_memory, \
+    remove_osm_file
 
 
 class _Reader:
@@ -40,6 +50,12 @@ class _Reader:
     #: VarReadParse: Read/parse OSM data of various formats (other than PBF and Shapefile).
     VAR = VarReadParse
 
+    #: int: Approximate ratio of the memory used in parsing a PBF data file to the size of the file.
+    PBF_MEMORY_RATIO = 20
+    #: int: Approximate ratio of the memory used in reading a layer of shapefiles
+    #: to the size of its .shp and .dbf files.
+    SHP_MEMORY_RATIO = 10
+
     def __init__(self, downloader=None, data_dir=None, max_tmpfile_size=None):
         """
         :param downloader: class of a downloader, valid options include
@@ -337,8 +353,165 @@ class _Reader:
 
         return var_input_
 
-    def _read_osm_pbf(self, pbf_pathname, chunk_size_limit, readable, expand, pickle_it,
-                      path_to_pickle, ret_pickle_path, rm_pbf_file, verbose, **kwargs):
+    @staticmethod
+    def _hash_selection(**kwargs):
+        """
+        Make a short hash of the options by which features are selected.
+
+        :param kwargs: options such as ``tag_filter``, ``bbox``, ``mask`` and ``layer_attributes``
+        :return: the first eight characters of the MD5 hash of the specified options,
+            or an empty string if none is specified
+        :rtype: str
+
+        **Tests**::
+
+            >>> from pydriosm.reader._reader import _Reader
+
+            >>> _Reader._hash_selection(tag_filter=None, bbox=None)
+            ''
+            >>> _Reader._hash_selection(tag_filter={'highway': None})
+            '481e9a50'
+        """
+
+        selection = {
+            k: v for k, v in kwargs.items()
+            if not (v is None or isinstance(v, (str, dict, list)) and not v)}
+
+        if not selection:
+            return ''
+
+        # Geometries (e.g. `mask`) are represented by their WKT
+        selection_ = json.dumps(selection, sort_keys=True, default=str)
+
+        return hashlib.md5(selection_.encode('utf-8')).hexdigest()[:8]
+
+    @classmethod
+    def make_pbf_pkl_pathname(cls, pbf_pathname, readable, layer_names_, tag_filter=None,
+                              bbox=None, mask=None, layer_attributes=None, **parse_options):
+        """
+        Make a pathname of a pickle file for saving PBF data.
+
+        :param pbf_pathname: pathname of a PBF data file
+        :type pbf_pathname: str
+        :param readable: whether the PBF data is parsed
+        :type readable: bool
+        :param layer_names_: names of PBF layers; an empty list indicates all available layers
+        :type layer_names_: list
+        :param tag_filter: tags by which features are selected, defaults to ``None``;
+            see the parameter ``tag_filter`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type tag_filter: dict | str | None
+        :param bbox: bounding box within which features are selected, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param layer_attributes: tags to be reported as fields of the layers, defaults to ``None``
+        :type layer_attributes: dict | list | None
+        :param parse_options: [optional] options with which the data is parsed,
+            e.g. ``expand=True`` or ``parse_geometry=True``; those that are enabled
+            are hashed into the pathname (together with the selection of features),
+            so that data parsed with different options is not saved in the same file
+        :return: pathname of a pickle file for saving data of the specified PBF layers
+        :rtype: str
+
+        **Tests**::
+
+            >>> from pydriosm.reader._reader import _Reader
+
+            >>> _Reader.make_pbf_pkl_pathname("rutland-latest.osm.pbf", True, [])
+            'rutland-latest-pbf.pkl'
+
+            >>> _Reader.make_pbf_pkl_pathname("rutland-latest.osm.pbf", False, ['lines'])
+            'rutland-latest-lines-raw.pkl'
+
+            >>> _Reader.make_pbf_pkl_pathname(
+            ...     "rutland-latest.osm.pbf", True, ['lines'], tag_filter={'highway': None})
+            'rutland-latest-lines-481e9a50-pbf.pkl'
+
+            >>> _Reader.make_pbf_pkl_pathname(
+            ...     "rutland-latest.osm.pbf", True, [], bbox=(-0.76, 52.66, -0.70, 52.69))
+            'rutland-latest-1ffb4f67-pbf.pkl'
+
+            >>> _Reader.make_pbf_pkl_pathname(
+            ...     "rutland-latest.osm.pbf", True, [], expand=True, parse_geometry=False)
+            'rutland-latest-93f78533-pbf.pkl'
+        """
+
+        suffix = "-pbf.pkl" if readable else "-raw.pkl"
+
+        # Options that are not enabled (e.g. `parse_geometry=False`) leave the pathname unchanged
+        parse_options_ = {k: v for k, v in parse_options.items() if v}
+        selection_hash = cls._hash_selection(
+            tag_filter=tag_filter, bbox=bbox, mask=mask, layer_attributes=layer_attributes,
+            **parse_options_)
+        if selection_hash:
+            suffix = "-" + selection_hash + suffix
+
+        if layer_names_ and set(layer_names_) != set(cls.PBF.LAYER_GEOM.keys()):
+            suffix = "-" + "-".join(layer_names_) + suffix
+
+        path_to_pickle = pbf_pathname.replace(".osm.pbf", suffix)
+
+        return path_to_pickle
+
+    @classmethod
+    def make_cache_dir(cls, path_to_pickle, cache_format, **kwargs):
+        """
+        Make a pathname of a directory for caching data in a columnar format
+        (see :class:`~pydriosm.reader.cache.LayerCache`).
+
+        :param path_to_pickle: pathname of a pickle file for saving the data
+        :type path_to_pickle: str
+        :param cache_format: format of the cached data, e.g. ``'parquet'`` or ``'feather'``
+        :type cache_format: str
+        :param kwargs: options with which the data is read and parsed,
+            e.g. ``parse_geometry=True``
+        :return: pathname of a directory for caching the data
+        :rtype: str
+
+        **Tests**::
+
+            >>> from pydriosm.reader._reader import _Reader
+
+            >>> cache_dir = _Reader.make_cache_dir(
+            ...     "rutland-latest-pbf.pkl", 'parquet', readable=True, expand=True)
+            >>> cache_dir.startswith('rutland-latest-pbf-') and cache_dir.endswith('.parquet')
+            True
+        """
+
+        cache_key = LayerCache.make_cache_key(**kwargs)
+        cache_dir = os.path.splitext(path_to_pickle)[0] + f"-{cache_key}.{cache_format}"
+
+        return cache_dir
+
+    @staticmethod
+    def _is_cached(path_to_pickle, source_pathname):
+        if path_to_pickle.endswith(".pkl"):
+            return os.path.isfile(path_to_pickle)
+        return LayerCache(path_to_pickle).is_valid(source_pathname)
+
+    @staticmethod
+    def _load_cache(path_to_pickle, lazy=False, verbose=False):
+        if path_to_pickle.endswith(".pkl"):  # A pickle file can only be loaded as a whole
+            return load_pickle(path_to_pickle, verbose=verbose)
+
+        layer_cache = LayerCache(path_to_pickle)
+        if lazy:
+            return LazyLayers(
+                layer_cache.layer_names, lambda x: layer_cache.load(layer_names=x)[x])
+        return layer_cache.load()
+
+    @staticmethod
+    def _save_cache(data, path_to_pickle, source_pathname, verbose=False):
+        if path_to_pickle.endswith(".pkl"):
+            save_pickle(data, path_to_pickle, verbose=verbose)
+        else:
+            LayerCache(path_to_pickle).save(data, source_pathname=source_pathname, verbose=verbose)
+
+    @classmethod
+    def _read_osm_pbf(cls, pbf_pathname, chunk_size_limit, readable, expand, pickle_it,
+                      path_to_pickle, ret_pickle_path, rm_pbf_file, verbose, raise_error=False,
+                      **kwargs):
 
         if verbose:
             action_msg = "Parsing" if readable or expand else "Reading"
@@ -348,7 +521,7 @@ class _Reader:
             number_of_chunks = get_number_of_chunks(
                 file_or_obj=pbf_pathname, chunk_size_limit=chunk_size_limit)
 
-            data = self.PBF.read_pbf(
+            data = cls.PBF.read_pbf(
                 pbf_pathname=pbf_pathname, readable=readable, expand=expand,
                 number_of_chunks=number_of_chunks, **kwargs)
 
@@ -356,7 +529,7 @@ class _Reader:
                 print("Done.")
 
             if pickle_it and (readable or expand):
-                save_pickle(data, path_to_pickle, verbose=verbose)
+                cls._save_cache(data, path_to_pickle, pbf_pathname, verbose=verbose)
 
                 if ret_pickle_path:
                     data = data, path_to_pickle
@@ -365,16 +538,137 @@ class _Reader:
                 remove_osm_file(pbf_pathname, verbose=verbose)
 
         except Exception as e:
+            if raise_error:  # e.g. to be reported by the process that runs the worker
+                raise
+
             print(f"Failed. {_format_err_msg(e)}")
 
             data = None
 
         return data
 
+    @classmethod
+    def _read_osm_pbf_lazily(cls, pbf_pathname, chunk_size_limit, layer_names, **kwargs):
+        number_of_chunks = get_number_of_chunks(
+            file_or_obj=pbf_pathname, chunk_size_limit=chunk_size_limit)
+
+        def read_pbf_layer(layer_name):
+            return cls.PBF.read_pbf(
+                pbf_pathname=pbf_pathname, number_of_chunks=number_of_chunks,
+                layer_names=[layer_name], **kwargs)[layer_name]
+
+        layer_names_ = cls.PBF.validate_pbf_layer_names(layer_names if layer_names else 'all')
+
+        return LazyLayers(layer_names_, read_pbf_layer)
+
+    @classmethod
+    def _read_osm_pbf_file(cls, subregion_name, pbf_pathname, readable=False, expand=False,
+                           parse_geometry=False, parse_properties=False, parse_other_tags=False,
+                           update=False, download_pbf=None, pickle_it=False,
+                           ret_pickle_path=False, rm_pbf_file=False, chunk_size_limit=50,
+                           layer_names=None, tag_filter=None, bbox=None, mask=None,
+                           layer_attributes=None, cache_format='pickle', lazy=False,
+                           workers=None, max_chunk_memory=None, compact=False,
+                           geometry_format=None, verbose=False, raise_error=False, **kwargs):
+        """
+        Read a PBF (.osm.pbf) data file (or its cache) at a given path.
+
+        Unlike the method :meth:`~pydriosm.reader._reader._Reader.read_osm_pbf`, it needs no
+        instance of the reader (with its downloader), so that it can be run in a worker process.
+
+        :param subregion_name: name of the geographic (sub)region of the data file
+        :type subregion_name: str
+        :param pbf_pathname: pathname of the .osm.pbf data file
+        :type pbf_pathname: str
+        :param download_pbf: function that downloads (or updates) the data file,
+            defaults to ``None`` (i.e. the data file is not downloaded)
+        :type download_pbf: typing.Callable | None
+        :param raise_error: whether to raise the error that occurs in parsing the data file
+            (or ``FileNotFoundError`` if the data file is not available) rather than
+            to print it and return ``None``, defaults to ``False``
+        :type raise_error: bool
+        :param kwargs: other parameters of the method
+            :meth:`~pydriosm.reader._reader._Reader.read_osm_pbf`,
+            and [optional] parameters of the function `pyhelpers.settings.gdal_configurations()`_
+        :return: dictionary of the .osm.pbf data;
+            when ``ret_pickle_path=True``, return a tuple of the dictionary and
+            a path to the pickle file
+        :rtype: dict | LazyLayers | tuple | None
+
+        .. _`pyhelpers.settings.gdal_configurations()`:
+            https://pyhelpers.readthedocs.io/en/latest/_generated/
+            pyhelpers.settings.gdal_configurations.html
+        """
+
+        gdal_configurations(**kwargs)
+
+        layer_names_ = cls.PBF.validate_pbf_layer_names(layer_names)
+        parse_options = {
+            'expand': expand, 'parse_geometry': parse_geometry,
+            'parse_properties': parse_properties, 'parse_other_tags': parse_other_tags,
+            'compact': compact, 'geometry_format': geometry_format if compact else None}
+        if cache_format == 'pickle':
+            path_to_pickle = cls.make_pbf_pkl_pathname(
+                pbf_pathname=pbf_pathname, readable=readable, layer_names_=layer_names_,
+                tag_filter=tag_filter, bbox=bbox, mask=mask,
+                layer_attributes=layer_attributes, **parse_options)
+        else:  # The columnar cache is keyed by the options of parsing
+            path_to_pickle = cls.make_cache_dir(
+                cls.make_pbf_pkl_pathname(
+                    pbf_pathname=pbf_pathname, readable=readable,
+                    layer_names_=layer_names_, tag_filter=tag_filter, bbox=bbox, mask=mask,
+                    layer_attributes=layer_attributes),
+                cache_format, readable=readable, **parse_options)
+
+        if cls._is_cached(path_to_pickle, pbf_pathname) and not update:
+            osm_pbf_data = cls._load_cache(path_to_pickle, lazy=lazy)
+
+            if ret_pickle_path:
+                osm_pbf_data = osm_pbf_data, path_to_pickle
+
+        else:  # If the target file is not available, try downloading it:
+            if (not os.path.exists(pbf_pathname) or update) and download_pbf is not None:
+                download_pbf()
+
+            if os.path.isfile(pbf_pathname) and lazy:
+                osm_pbf_data = cls._read_osm_pbf_lazily(
+                    pbf_pathname=pbf_pathname, chunk_size_limit=chunk_size_limit,
+                    readable=readable, expand=expand, parse_geometry=parse_geometry,
+                    parse_properties=parse_properties, parse_other_tags=parse_other_tags,
+                    layer_names=layer_names_, tag_filter=tag_filter, bbox=bbox, mask=mask,
+                    layer_attributes=layer_attributes, workers=workers,
+                    max_chunk_memory=max_chunk_memory, compact=compact,
+                    geometry_format=geometry_format)
+
+            elif os.path.isfile(pbf_pathname):
+                osm_pbf_data = cls._read_osm_pbf(
+                    pbf_pathname=pbf_pathname, chunk_size_limit=chunk_size_limit,
+                    readable=readable, expand=expand, parse_geometry=parse_geometry,
+                    parse_properties=parse_properties, parse_other_tags=parse_other_tags,
+                    layer_names=layer_names_, tag_filter=tag_filter, bbox=bbox, mask=mask,
+                    layer_attributes=layer_attributes, workers=workers,
+                    max_chunk_memory=max_chunk_memory, compact=compact,
+                    geometry_format=geometry_format, pickle_it=pickle_it,
+                    path_to_pickle=path_to_pickle, ret_pickle_path=ret_pickle_path,
+                    rm_pbf_file=rm_pbf_file, verbose=verbose, raise_error=raise_error)
+
+            elif raise_error:
+                raise FileNotFoundError(f"The .osm.pbf file for \"{subregion_name}\" is not found.")
+
+            else:
+                osm_pbf_data = None
+                if verbose:
+                    print(f"The .osm.pbf file for \"{subregion_name}\" is not found.")
+
+        return osm_pbf_data
+
     def read_osm_pbf(self, subregion_name, data_dir=None, readable=False, expand=False,
                      parse_geometry=False, parse_properties=False, parse_other_tags=False,
                      update=False, download=True, pickle_it=False, ret_pickle_path=False,
-                     rm_pbf_file=False, chunk_size_limit=50, verbose=False, **kwargs):
+                     rm_pbf_file=False, chunk_size_limit=50, layer_names=None, tag_filter=None,
+                     bbox=None, mask=None, layer_attributes=None, cache_format='pickle',
+                     lazy=False, workers=None, max_chunk_memory=None, compact=False,
+                     geometry_format=None, verbose=False, **kwargs):
         """
         Read a PBF (.osm.pbf) data file of a geographic (sub)region.
 
@@ -414,6 +708,51 @@ class _Reader:
             if the size of the .osm.pbf file (in MB) is greater than ``chunk_size_limit``,
             it will be parsed in a chunk-wise way
         :type chunk_size_limit: int | None
+        :param layer_names: name of a PBF layer, e.g. 'lines', or names of multiple layers;
+            if ``None`` (default), all available layers
+        :type layer_names: str | list | None
+        :param tag_filter: tags by which features are selected before being parsed,
+            e.g. ``{'highway': None}``, defaults to ``None``; see the parameter ``tag_filter`` of
+            the method :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type tag_filter: dict | str | None
+        :param bbox: bounding box ``(min_x, min_y, max_x, max_y)`` within which
+            the features are selected before being parsed, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param layer_attributes: tags to be reported as fields of the layers,
+            e.g. ``{'lines': ['name', 'highway', 'maxspeed']}``, defaults to ``None``;
+            see the parameter ``layer_attributes`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type layer_attributes: dict | list | None
+        :param cache_format: format in which the parsed data is saved (when ``pickle_it=True``)
+            and from which it is loaded; options include ``'pickle'`` (default) for a single
+            pickle file, and ``'parquet'`` and ``'feather'`` for a columnar cache of the layers
+            (see :class:`~pydriosm.reader.cache.LayerCache`), which is keyed by all the options of
+            parsing and checked against the PBF data file
+        :type cache_format: str
+        :param lazy: whether to return a mapping that parses (or loads from a columnar cache)
+            each layer only when it is accessed (see :class:`~pydriosm.reader.lazy.LazyLayers`),
+            defaults to ``False``; when ``lazy=True``, the parsed data is not saved and
+            the .osm.pbf file is not deleted, whilst a pickle file is loaded as a whole
+        :type lazy: bool
+        :param workers: number of worker processes across which the features of each layer
+            are parsed, defaults to ``None``; see the parameter ``workers`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type workers: int | None
+        :param max_chunk_memory: memory budget (in MB) for parsing each chunk of features,
+            to which the size of the chunks is adapted (instead of ``chunk_size_limit``),
+            defaults to ``None``; see the parameter ``max_chunk_memory`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type max_chunk_memory: int | float | str | None
+        :param compact: whether to represent the parsed data with compact data types,
+            defaults to ``False``; see the parameter ``compact`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type compact: bool
+        :param geometry_format: (when ``compact=True``) format of the ``'geometry'`` column,
+            e.g. ``'quantized'``, defaults to ``None``; see the parameter ``geometry_format``
+            of the method :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type geometry_format: str | None
         :param verbose: whether to print relevant information in console as the function runs,
             defaults to ``False``
         :type verbose: bool | int
@@ -421,7 +760,7 @@ class _Reader:
             :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
         :return: dictionary of the .osm.pbf data;
             when ``pickle_it=True``, return a tuple of the dictionary and a path to the pickle file
-        :rtype: dict | tuple | None
+        :rtype: dict | LazyLayers | tuple | None
 
         .. _`shapely.geometry`:
             https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
@@ -435,45 +774,251 @@ class _Reader:
               and :meth:`BBBikeReader.read_osm_pbf()<pydriosm.reader.BBBikeReader.read_osm_pbf>`.
         """
 
-        kwargs.update({'max_tmpfile_size': self.max_tmpfile_size})
-        gdal_configurations(**kwargs)
-
         osm_file_format = ".osm.pbf"
 
         subregion_name_, _, _, path_to_osm_pbf = self.downloader.get_valid_download_info(
             subregion_name=subregion_name, osm_file_format=osm_file_format, download_dir=data_dir)
 
         if path_to_osm_pbf is not None:
-            suffix = "-pbf.pkl" if readable else "-raw.pkl"
-            path_to_pickle = path_to_osm_pbf.replace(osm_file_format, suffix)
+            if download:
+                download_pbf = functools.partial(
+                    self.downloader.download_osm_data, subregion_names=subregion_name,
+                    osm_file_format=osm_file_format, download_dir=data_dir, update=update,
+                    confirmation_required=False, verbose=verbose)
+            else:
+                download_pbf = None
+
+            osm_pbf_data = self._read_osm_pbf_file(
+                subregion_name=subregion_name_, pbf_pathname=path_to_osm_pbf, readable=readable,
+                expand=expand, parse_geometry=parse_geometry, parse_properties=parse_properties,
+                parse_other_tags=parse_other_tags, update=update, download_pbf=download_pbf,
+                pickle_it=pickle_it, ret_pickle_path=ret_pickle_path, rm_pbf_file=rm_pbf_file,
+                chunk_size_limit=chunk_size_limit, layer_names=layer_names, tag_filter=tag_filter,
+                bbox=bbox, mask=mask, layer_attributes=layer_attributes,
+                cache_format=cache_format, lazy=lazy, workers=workers,
+                max_chunk_memory=max_chunk_memory, compact=compact,
+                geometry_format=geometry_format, verbose=verbose,
+                max_tmpfile_size=self.max_tmpfile_size, **kwargs)
 
-            if os.path.isfile(path_to_pickle) and not update:
-                osm_pbf_data = load_pickle(path_to_pickle)
+            return osm_pbf_data
 
-                if ret_pickle_path:
-                    osm_pbf_data = osm_pbf_data, path_to_pickle
-
-            else:  # If the target file is not available, try downloading it:
-                if (not os.path.exists(path_to_osm_pbf) or update) and download:
-                    self.downloader.download_osm_data(
-                        subregion_names=subregion_name, osm_file_format=osm_file_format,
-                        download_dir=data_dir, update=update, confirmation_required=False,
-                        verbose=verbose)
-
-                if os.path.isfile(path_to_osm_pbf):
-                    osm_pbf_data = self._read_osm_pbf(
-                        pbf_pathname=path_to_osm_pbf, chunk_size_limit=chunk_size_limit,
-                        readable=readable, expand=expand, parse_geometry=parse_geometry,
-                        parse_properties=parse_properties, parse_other_tags=parse_other_tags,
-                        pickle_it=pickle_it, path_to_pickle=path_to_pickle,
-                        ret_pickle_path=ret_pickle_path, rm_pbf_file=rm_pbf_file, verbose=verbose)
+    @staticmethod
+    def _read_osm_pbf_to_cache(read_osm_pbf, subregion_name, **kwargs):
+        # Only the pathname of the cached data is sent back from a worker process
+        data = read_osm_pbf(subregion_name, pickle_it=True, ret_pickle_path=True, **kwargs)
 
-                else:
-                    osm_pbf_data = None
-                    if verbose:
-                        print(f"The {osm_file_format} file for \"{subregion_name_}\" is not found.")
+        return None if data is None else data[1]
 
-            return osm_pbf_data
+    @staticmethod
+    def _drop_duplicate_features(data, seen_ids):
+        # Drop the features (by layer and OSM ID) that have been seen in the data of other regions
+        n_dropped = 0
+
+        if isinstance(data, dict):
+            for layer_name, layer_data in data.items():
+                if isinstance(layer_data, pd.DataFrame) and 'id' in layer_data.columns:
+                    data[layer_name], n = drop_duplicate_ids(
+                        layer_data, seen_ids=seen_ids.setdefault(layer_name, set()), by='id')
+                    n_dropped += n
+
+        return data, n_dropped
+
+    def read_osm_pbf_many(self, subregion_names, data_dir=None, callback=None, workers=None,
+                          max_memory=None, update=False, download=True, drop_duplicates=True,
+                          verbose=False, **kwargs):
+        """
+        Read PBF (.osm.pbf) data files of multiple geographic (sub)regions
+        across a pool of worker processes.
+
+        The data files that are not available are downloaded first. Then the files are parsed
+        in worker processes, and each (sub)region's data is passed to ``callback`` (or saved as
+        a cache) as soon as it is ready, rather than all the data being held at once.
+        If a worker process is killed (e.g. for running out of memory),
+        ``BrokenProcessPool`` (of `concurrent.futures`_) is raised instead of waiting for its data.
+        If the data of any other (sub)region fails to be parsed (or is not available),
+        the failure is printed and the rest are parsed as usual, after which ``RuntimeError``
+        (from the error of the first failure) is raised for all the failures.
+
+        :param subregion_names: names of geographic (sub)regions (case-insensitive)
+        :type subregion_names: list
+        :param data_dir: directory where the .osm.pbf data files are located/saved;
+            if ``None``, the default local directory
+        :type data_dir: str | None
+        :param callback: function that takes the name of a (sub)region and its data,
+            which is called (in the main process) as the data of each (sub)region is ready,
+            defaults to ``None``
+        :type callback: typing.Callable | None
+        :param workers: number of worker processes, defaults to ``None``;
+            when ``workers=None``, it is one less than the number of CPUs
+        :type workers: int | None
+        :param max_memory: memory budget (in MB) for the data files being parsed at the same time,
+            each of which is estimated at ``PBF_MEMORY_RATIO`` times the size of the file,
+            defaults to ``None`` (i.e. no limit); a file is parsed anyway when no other is
+        :type max_memory: int | float | None
+        :param update: whether to update the data files and the caches, defaults to ``False``
+        :type update: bool
+        :param download: whether to download the data files that are not available,
+            defaults to ``True``
+        :type download: bool
+        :param drop_duplicates: whether to drop the features of a layer whose OSM IDs
+            (i.e. ``'id'``) have been seen in the data of the other (sub)regions,
+            defaults to ``True``; adjacent (sub)regions overlap at their borders, so that
+            some features are in the data of more than one (sub)region; it does not apply
+            to the caches when ``pickle_it=True`` (without ``callback``)
+        :type drop_duplicates: bool
+        :param verbose: whether to print relevant information in console as the function runs,
+            defaults to ``False``
+        :type verbose: bool | int
+        :param kwargs: [optional] parameters of the method
+            :meth:`GeofabrikReader.read_osm_pbf()<pydriosm.reader.GeofabrikReader.read_osm_pbf>`
+            or :meth:`BBBikeReader.read_osm_pbf()<pydriosm.reader.BBBikeReader.read_osm_pbf>`
+        :return: data (or, when ``pickle_it=True``, pathnames of the caches) of the (sub)regions,
+            with keys being the names of the (sub)regions;
+            ``None`` if ``callback`` is specified
+        :rtype: dict | None
+
+        .. _`concurrent.futures`:
+            https://docs.python.org/3/library/concurrent.futures.html
+
+        **Examples**::
+
+            >>> from pydriosm.reader import GeofabrikReader
+            >>> from pyhelpers.dirs import delete_dir
+
+            >>> gfr = GeofabrikReader()
+
+            >>> subrgn_names = ['rutland', 'leicestershire']
+            >>> dat_dir = "tests\\osm_data"
+
+            >>> # Process the data of each subregion as soon as it is parsed
+            >>> def count_lines(subregion_name, data):
+            ...     print(subregion_name, len(data['lines']))
+
+            >>> gfr.read_osm_pbf_many(
+            ...     subrgn_names, dat_dir, callback=count_lines, workers=2, max_memory=4000,
+            ...     drop_duplicates=False, expand=True, layer_names='lines')
+            Rutland 9229
+            Leicestershire 107453
+
+            >>> # Save the parsed data as caches, without returning the data itself
+            >>> pbf_caches = gfr.read_osm_pbf_many(
+            ...     subrgn_names, dat_dir, workers=2, expand=True, layer_names='lines',
+            ...     pickle_it=True, cache_format='parquet')
+            >>> list(pbf_caches.keys())
+            ['Rutland', 'Leicestershire']
+
+            >>> # Delete the example data and the test data directory
+            >>> delete_dir(dat_dir, confirmation_required=False)
+        """
+
+        osm_file_format = ".osm.pbf"
+
+        pbf_pathnames = collections.OrderedDict()
+        for subregion_name in subregion_names:
+            subregion_name_, _, _, path_to_osm_pbf = self.downloader.get_valid_download_info(
+                subregion_name=subregion_name, osm_file_format=osm_file_format,
+                download_dir=data_dir)
+            pbf_pathnames[subregion_name_] = path_to_osm_pbf
+
+        if download:
+            subregion_names_ = [
+                k for k, v in pbf_pathnames.items() if update or not os.path.isfile(v)]
+            if subregion_names_:
+                self.downloader.download_osm_data(
+                    subregion_names=subregion_names_, osm_file_format=osm_file_format,
+                    download_dir=data_dir, update=update, confirmation_required=False,
+                    verbose=verbose)
+
+        # Only the class (rather than the reader, with its downloader) is sent to the workers
+        read_args = {
+            'update': update, 'verbose': False, 'raise_error': True,
+            'max_tmpfile_size': self.max_tmpfile_size}
+        read_args.update(kwargs)
+
+        if callback is None and kwargs.get('pickle_it', False):
+            del read_args['pickle_it']
+            read_args.pop('ret_pickle_path', None)
+            read_func = functools.partial(self._read_osm_pbf_to_cache, self._read_osm_pbf_file)
+        else:
+            read_func = self._read_osm_pbf_file
+
+        # Estimated memory (in MB) for parsing each data file
+        pending = collections.deque(
+            (k, os.path.getsize(v) / 2 ** 20 * self.PBF_MEMORY_RATIO if os.path.isfile(v) else 0)
+            for k, v in pbf_pathnames.items())
+
+        workers_ = max(1, os.cpu_count() - 1) if workers is None else workers
+        max_memory_ = float('inf') if max_memory is None else max_memory
+
+        results, failures, running, memory_in_use = {}, {}, {}, 0
+        # Only the OSM IDs of each layer (rather than its features) are kept for deduplication
+        seen_ids, n_dropped = {}, 0
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers_) as executor:
+            while pending or running:
+                # Schedule as many data files as the number of workers and the memory budget allow
+                while pending and len(running) < workers_ and (
+                        not running or memory_in_use + pending[0][1] <= max_memory_):
+                    subregion_name, memory = pending.popleft()
+                    future = executor.submit(
+                        read_func, subregion_name, pbf_pathname=pbf_pathnames[subregion_name],
+                        **read_args)
+                    running[future] = subregion_name, memory
+                    memory_in_use += memory
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                while done:
+                    future = done.pop()
+                    subregion_name, memory = running.pop(future)
+                    memory_in_use -= memory
+
+                    error = future.exception()
+                    # e.g. a worker process is killed, after which no data file can be parsed
+                    if isinstance(error, concurrent.futures.BrokenExecutor):
+                        raise error
+
+                    if verbose or error is not None:  # A failure is reported anyway
+                        print(f"Parsing \"{subregion_name}\"", end=" ... ")
+                        print("Done." if error is None else f"Failed. {_format_err_msg(error)}")
+
+                    if error is not None:
+                        failures[subregion_name] = error
+                        continue
+
+                    data = future.result()
+
+                    if callback is None:
+                        results[subregion_name] = data
+                    else:
+                        if drop_duplicates:
+                            data, n = self._drop_duplicate_features(data, seen_ids=seen_ids)
+                            n_dropped += n
+                        callback(subregion_name, data)
+
+                    # Release the data of the (sub)region before receiving the next one
+                    del data, future
+
+        if callback is None:
+            results = {k: results[k] for k in pbf_pathnames.keys() if k in results}
+
+            if drop_duplicates and not kwargs.get('pickle_it', False):
+                for subregion_name, data in results.items():  # In the order of the (sub)regions
+                    results[subregion_name], n = self._drop_duplicate_features(data, seen_ids)
+                    n_dropped += n
+
+        if verbose and drop_duplicates and seen_ids:
+            print(f"Dropped {n_dropped} duplicated feature(s) (by OSM ID).")
+
+        if failures:
+            error_msg = "; ".join(f"\"{k}\": {_format_err_msg(v)}" for k, v in failures.items())
+            raise RuntimeError(
+                f"Failed to parse the data of {len(failures)} (sub)region(s). {error_msg}") \
+                from next(iter(failures.values()))
+
+        if callback is None:
+            return results
 
     def get_shp_pathname(self, subregion_name, layer_name=None, feature_name=None, data_dir=None):
         """
@@ -614,7 +1159,8 @@ class _Reader:
         return path_to_osm_shp_file
 
     @classmethod
-    def make_shp_pkl_pathname(cls, shp_zip_filename, extract_dir, layer_names_, feature_names_):
+    def make_shp_pkl_pathname(cls, shp_zip_filename, extract_dir, layer_names_, feature_names_,
+                              bbox=None, mask=None):
         """
         Make a pathname of a pickle file for saving shapefile data.
 
@@ -626,6 +1172,10 @@ class _Reader:
         :type layer_names_: list
         :param feature_names_: names of shapefile features
         :type feature_names_: list
+        :param bbox: bounding box within which features are selected, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
         :return: pathname of a pickle file for saving data of the specified shapefile
         :rtype: str
 
@@ -651,6 +1201,11 @@ class _Reader:
             else:
                 path_to_shp_pickle = extract_dir + ".pkl"
 
+        selection_hash = cls._hash_selection(bbox=bbox, mask=mask)
+        if selection_hash:
+            path_to_shp_pickle = re.sub(
+                r'(-shp)?\.pkl$', "-" + selection_hash + r'\g<0>', path_to_shp_pickle)
+
         return path_to_shp_pickle
 
     def _get_shp_layer_names(self, extract_dir_):
@@ -761,22 +1316,145 @@ class _Reader:
 
         return layer_name_list
 
+    def get_shp_zip_members(self, layer_names_, shp_zip_pathname, subregion_name,
+                            osm_file_format, data_dir, update, download, verbose):
+        """
+        Find the shapefiles of layers in a .shp.zip file (which is downloaded if necessary),
+        so that they can be read without extracting the .shp.zip file.
+
+        :param layer_names_: names of shapefile layers
+        :type layer_names_: list
+        :param shp_zip_pathname: pathname of a .shp.zip file
+        :type shp_zip_pathname: str
+        :param subregion_name: name of a geographic (sub)region (case-insensitive)
+            that is available on a free download server
+        :type subregion_name: str
+        :param osm_file_format: format (file extension) of OSM data
+        :type osm_file_format: str
+        :param data_dir: directory where the .shp.zip data file is located/saved
+        :type data_dir: str | None
+        :param update: whether to update the .shp.zip file, defaults to ``False``
+        :type update: bool
+        :param download: whether to download the .shp.zip file if it is not available
+        :type download: bool
+        :param verbose: whether to print relevant information in console as the function runs,
+            defaults to ``False``
+        :type verbose: bool | int
+        :return: names of the layers, and the names of the shapefiles of each layer
+            in the .shp.zip file
+        :rtype: tuple
+
+        This method is used by the methods
+        :meth:`GeofabrikReader.read_shp_zip()<pydriosm.reader.GeofabrikReader.read_shp_zip>` and
+        :meth:`BBBikeReader.read_shp_zip()<pydriosm.reader.BBBikeReader.read_shp_zip>`.
+        """
+
+        if (not os.path.isfile(shp_zip_pathname) or update) and download:
+            self.downloader.download_osm_data(
+                subregion_names=subregion_name, osm_file_format=osm_file_format,
+                download_dir=data_dir, update=update, confirmation_required=False,
+                verbose=verbose)
+
+        if os.path.isfile(shp_zip_pathname):
+            shp_members = self.SHP.find_shp_zip_members(shp_zip_pathname, layer_names_)
+            layer_name_list, shp_pathnames = list(shp_members.keys()), list(shp_members.values())
+        else:
+            layer_name_list, shp_pathnames = [], []
+
+        return layer_name_list, shp_pathnames
+
+    def _estimate_shp_memory(self, shp_pathnames, shp_zip_pathname=None):
+        """
+        Estimate the memory (in MB) used in reading each layer of shapefiles.
+
+        :param shp_pathnames: pathnames of the .shp files of each layer
+        :type shp_pathnames: list
+        :param shp_zip_pathname: path to the .shp.zip file where the shapefiles are,
+            defaults to ``None`` (i.e. the shapefiles have been extracted)
+        :type shp_zip_pathname: str | None
+        :return: estimated memory for each layer, which is ``SHP_MEMORY_RATIO`` times
+            the size of its .shp and .dbf files
+        :rtype: list
+        """
+
+        if shp_zip_pathname is None:
+            file_sizes = {}
+            for f in itertools.chain.from_iterable(shp_pathnames):
+                for f_ in [f, os.path.splitext(f)[0] + ".dbf"]:
+                    file_sizes[f_] = os.path.getsize(f_) if os.path.isfile(f_) else 0
+        else:  # Uncompressed sizes of the files in the .shp.zip file
+            with zipfile.ZipFile(shp_zip_pathname, mode='r') as sz:
+                file_sizes = {x.filename: x.file_size for x in sz.filelist}
+
+        memory = [
+            sum(file_sizes.get(f_, 0) for f in x for f_ in [f, os.path.splitext(f)[0] + ".dbf"])
+            / 2 ** 20 * self.SHP_MEMORY_RATIO
+            for x in shp_pathnames]
+
+        return memory
+
+    def _read_layer_shps_many(self, shp_pathnames, workers, **kwargs):
+        """
+        Read multiple layers of shapefiles across a pool of worker processes.
+
+        :param shp_pathnames: pathnames of the .shp files of each layer
+        :type shp_pathnames: list
+        :param workers: (maximum) number of worker processes
+        :type workers: int
+        :param kwargs: [optional] parameters of the method
+            :meth:`SHPReadParse.read_layer_shps()<pydriosm.reader.SHPReadParse.read_layer_shps>`
+        :return: data of the layers (in the given order)
+        :rtype: list
+        """
+
+        memory = self._estimate_shp_memory(
+            shp_pathnames, shp_zip_pathname=kwargs.get('shp_zip_pathname', None))
+
+        # Run only as many workers as the available memory allows for reading the largest layers
+        workers_ = min(workers, len(shp_pathnames))
+        available_memory = get_available_memory()
+        if available_memory is not None and max(memory) > 0:
+            workers_ = max(1, min(workers_, int(available_memory // max(memory))))
+
+        read_func = functools.partial(self.SHP.read_layer_shps, **kwargs)
+
+        if workers_ > 1:
+            with multiprocessing.Pool(processes=workers_) as p:
+                # The largest layers (e.g. 'buildings') are read first so as not to be left last
+                results = {
+                    i: p.apply_async(read_func, args=(shp_pathnames[i],))
+                    for i in sorted(range(len(shp_pathnames)), key=lambda i: -memory[i])}
+                shp_dat_list = [results[i].get() for i in range(len(shp_pathnames))]
+
+        else:
+            shp_dat_list = [read_func(x) for x in shp_pathnames]
+
+        return shp_dat_list
+
     def _read_shp_zip(self, shp_pathnames, feature_names_, layer_name_list, pickle_it,
                       path_to_pickle, ret_pickle_path, rm_extracts, extract_dir, rm_shp_zip,
-                      shp_zip_pathname, verbose, **kwargs):
+                      shp_zip_pathname, verbose, from_shp_zip=False, workers=None, **kwargs):
         if verbose:
-            # print(f'Reading the shapefile(s) data', end=" ... ")
-            files_dir = check_relpath(
-                os.path.commonpath(list(itertools.chain.from_iterable(shp_pathnames))))
-            if os.path.isdir(files_dir):
-                msg_ = "the shapefile(s) at "
+            if from_shp_zip:
+                files_dir, msg_ = check_relpath(shp_zip_pathname), "the shapefile(s) in "
+                print(f'Reading {msg_}"{files_dir}"', end=" ... ")
             else:
-                msg_ = ""
-            print(f'Reading {msg_}"{files_dir}\\"', end=" ... ")
+                files_dir = check_relpath(
+                    os.path.commonpath(list(itertools.chain.from_iterable(shp_pathnames))))
+                if os.path.isdir(files_dir):
+                    msg_ = "the shapefile(s) at "
+                else:
+                    msg_ = ""
+                print(f'Reading {msg_}"{files_dir}\\"', end=" ... ")
 
         try:
             kwargs.update({'feature_names': feature_names_, 'ret_feat_shp_path': False})
-            shp_dat_list = [self.SHP.read_layer_shps(x, **kwargs) for x in shp_pathnames]
+            if from_shp_zip:
+                kwargs.update({'shp_zip_pathname': shp_zip_pathname})
+            if workers and workers > 1 and len(shp_pathnames) > 1:
+                shp_dat_list = self._read_layer_shps_many(shp_pathnames, workers, **kwargs)
+            else:
+                shp_dat_list = [self.SHP.read_layer_shps(x, **kwargs) for x in shp_pathnames]
 
             shp_data = collections.OrderedDict(zip(layer_name_list, shp_dat_list))
 
@@ -784,7 +1462,7 @@ class _Reader:
                 print("Done.")
 
             if pickle_it:
-                save_pickle(shp_data, path_to_pickle, verbose=verbose)
+                self._save_cache(shp_data, path_to_pickle, shp_zip_pathname, verbose=verbose)
 
                 if ret_pickle_path:
                     shp_data = shp_data, path_to_pickle
@@ -803,7 +1481,8 @@ class _Reader:
 
     def read_shp_zip(self, subregion_name, layer_names=None, feature_names=None, data_dir=None,
                      update=False, download=True, pickle_it=False, ret_pickle_path=False,
-                     rm_extracts=False, rm_shp_zip=False, verbose=False, **kwargs):
+                     rm_extracts=None, rm_shp_zip=False, cache_format='pickle', lazy=False,
+                     workers=None, verbose=False, **kwargs):
         """
         Read a .shp.zip data file of a geographic (sub)region.
 
@@ -829,11 +1508,30 @@ class _Reader:
         :param ret_pickle_path: (when ``pickle_it=True``)
             whether to return a path to the saved pickle file
         :type ret_pickle_path: bool
-        :param rm_extracts: whether to delete extracted files from the .shp.zip file,
-            defaults to ``False``
-        :type rm_extracts: bool
+        :param rm_extracts: whether to delete extracted files from the .shp.zip file;
+            when ``rm_extracts=None`` (default) or ``rm_extracts=True``, the shapefiles are read
+            straight from the .shp.zip file without being extracted (and with ``True``,
+            any existing extracts are deleted); when ``rm_extracts=False``, the .shp.zip file
+            is extracted and the extracts are kept
+        :type rm_extracts: bool | None
         :param rm_shp_zip: whether to delete the downloaded .shp.zip file, defaults to ``False``
         :type rm_shp_zip: bool
+        :param cache_format: format in which the data is saved (when ``pickle_it=True``)
+            and from which it is loaded; options include ``'pickle'`` (default) for a single
+            pickle file, and ``'parquet'`` and ``'feather'`` for a columnar cache of the layers
+            (see :class:`~pydriosm.reader.cache.LayerCache`)
+        :type cache_format: str
+        :param lazy: whether to return a mapping that reads (or loads from a columnar cache)
+            each layer only when it is accessed (see :class:`~pydriosm.reader.lazy.LazyLayers`),
+            defaults to ``False``; when ``lazy=True``, the data is not saved and
+            neither the extracts nor the .shp.zip file is deleted
+        :type lazy: bool
+        :param workers: number of worker processes across which the layers are read,
+            defaults to ``None`` (i.e. the layers are read one after another in the current
+            process); the number of worker processes is capped so that the largest layers,
+            each estimated at ``SHP_MEMORY_RATIO`` times the size of its .shp and .dbf files,
+            fit in the memory that is available
+        :type workers: int | None
         :param verbose: whether to print relevant information in console as the function runs,
             defaults to ``False``
         :type verbose: bool | int
@@ -842,7 +1540,7 @@ class _Reader:
         :return: dictionary of the shapefile data,
             with keys and values being layer names and tabular data
             (in the format of `geopandas.GeoDataFrame`_), respectively
-        :rtype: dict | collections.OrderedDict | None
+        :rtype: dict | collections.OrderedDict | LazyLayers | None
 
         .. _`geopandas.GeoDataFrame`: https://geopandas.org/reference.html#geodataframe
 
@@ -872,32 +1570,59 @@ class _Reader:
 
             path_to_pickle = self.make_shp_pkl_pathname(
                 shp_zip_filename=shp_zip_filename, extract_dir=extract_dir,
-                layer_names_=layer_names_, feature_names_=feature_names_)
+                layer_names_=layer_names_, feature_names_=feature_names_,
+                bbox=kwargs.get('bbox', None), mask=kwargs.get('mask', None))
+            if cache_format != 'pickle':
+                path_to_pickle = self.make_cache_dir(path_to_pickle, cache_format, **kwargs)
 
-            if os.path.isfile(path_to_pickle) and not update:
-                shp_data = load_pickle(path_to_pickle, verbose=verbose)
+            if self._is_cached(path_to_pickle, shp_zip_pathname) and not update:
+                shp_data = self._load_cache(path_to_pickle, lazy=lazy, verbose=verbose)
+                if not isinstance(shp_data, LazyLayers):
+                    shp_data = collections.OrderedDict(shp_data)
 
                 if ret_pickle_path:
                     shp_data = shp_data, path_to_pickle
 
             else:
-                layer_name_list = self.validate_shp_layer_names(
-                    layer_names_=layer_names_, extract_dir=extract_dir,
-                    shp_zip_pathname=shp_zip_pathname, subregion_name=subregion_name_,
-                    osm_file_format=osm_file_format, data_dir=data_dir, update=update,
-                    download=download, verbose=verbose)
+                from_shp_zip = rm_extracts is not False and (
+                    os.path.isfile(shp_zip_pathname) or
+                    (download and not os.path.exists(extract_dir)))
 
-                if len(layer_name_list) > 0:
+                if from_shp_zip:  # Read the shapefiles straight from the .shp.zip file
+                    layer_name_list, shp_pathnames = self.get_shp_zip_members(
+                        layer_names_=layer_names_, shp_zip_pathname=shp_zip_pathname,
+                        subregion_name=subregion_name_, osm_file_format=osm_file_format,
+                        data_dir=data_dir, update=update, download=download, verbose=verbose)
+
+                else:
+                    layer_name_list = self.validate_shp_layer_names(
+                        layer_names_=layer_names_, extract_dir=extract_dir,
+                        shp_zip_pathname=shp_zip_pathname, subregion_name=subregion_name_,
+                        osm_file_format=osm_file_format, data_dir=data_dir, update=update,
+                        download=download, verbose=verbose)
                     shp_pathnames = [
                         glob.glob(shp_pathname_.format(layer_name))
                         for layer_name in layer_name_list]
 
-                    shp_data = self._read_shp_zip(
-                        shp_pathnames=shp_pathnames, feature_names_=feature_names_,
-                        layer_name_list=layer_name_list, pickle_it=pickle_it,
-                        path_to_pickle=path_to_pickle, ret_pickle_path=ret_pickle_path,
-                        rm_extracts=rm_extracts, extract_dir=extract_dir, rm_shp_zip=rm_shp_zip,
-                        shp_zip_pathname=shp_zip_pathname, verbose=verbose, **kwargs)
+                if len(layer_name_list) > 0:
+                    if lazy:
+                        kwargs.update({'feature_names': feature_names_, 'ret_feat_shp_path': False})
+                        if from_shp_zip:
+                            kwargs.update({'shp_zip_pathname': shp_zip_pathname})
+                        shp_pathnames_ = dict(zip(layer_name_list, shp_pathnames))
+                        shp_data = LazyLayers(
+                            layer_name_list,
+                            lambda x: self.SHP.read_layer_shps(shp_pathnames_[x], **kwargs))
+
+                    else:
+                        shp_data = self._read_shp_zip(
+                            shp_pathnames=shp_pathnames, feature_names_=feature_names_,
+                            layer_name_list=layer_name_list, pickle_it=pickle_it,
+                            path_to_pickle=path_to_pickle, ret_pickle_path=ret_pickle_path,
+                            rm_extracts=rm_extracts, extract_dir=extract_dir,
+                            rm_shp_zip=rm_shp_zip, shp_zip_pathname=shp_zip_pathname,
+                            verbose=verbose, from_shp_zip=from_shp_zip, workers=workers,
+                            **kwargs)
 
                 else:
                     shp_data = None
@@ -59,7 +59,10 @@ class BBBikeReader(_Reader):
     def read_osm_pbf(self, subregion_name, data_dir=None, readable=False, expand=False,
                      parse_geometry=False, parse_other_tags=False, parse_properties=False,
                      update=False, download=True, pickle_it=False, ret_pickle_path=False,
-                     rm_pbf_file=False, chunk_size_limit=50, verbose=False, **kwargs):
+                     rm_pbf_file=False, chunk_size_limit=50, layer_names=None, tag_filter=None,
+                     bbox=None, mask=None, layer_attributes=None, cache_format='pickle',
+                     lazy=False, workers=None, max_chunk_memory=None, compact=False,
+                     geometry_format=None, verbose=False, **kwargs):
         """
         Read a PBF (.osm.pbf) data file of a geographic (sub)region.
 
@@ -99,6 +102,49 @@ class BBBikeReader(_Reader):
             if the size of the .osm.pbf file (in MB) is greater than ``chunk_size_limit``,
             it will be parsed in a chunk-wise way
         :type chunk_size_limit: int | None
+        :param layer_names: name of a PBF layer, e.g. 'lines', or names of multiple layers;
+            if ``None`` (default), all available layers
+        :type layer_names: str | list | None
+        :param tag_filter: tags by which features are selected before being parsed,
+            e.g. ``{'highway': None}``, defaults to ``None``; see the parameter ``tag_filter`` of
+            the method :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type tag_filter: dict | str | None
+        :param bbox: bounding box ``(min_x, min_y, max_x, max_y)`` within which
+            the features are selected before being parsed, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param layer_attributes: tags to be reported as fields of the layers,
+            e.g. ``{'lines': ['name', 'highway', 'maxspeed']}``, defaults to ``None``;
+            see the parameter ``layer_attributes`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type layer_attributes: dict | list | None
+        :param cache_format: format in which the parsed data is saved (when ``pickle_it=True``)
+            and from which it is loaded; options include ``'pickle'`` (default) for a single
+            pickle file, and ``'parquet'`` and ``'feather'`` for a columnar cache of the layers
+            (see :class:`~pydriosm.reader.cache.LayerCache`)
+        :type cache_format: str
+        :param lazy: whether to return a mapping that parses (or loads from a columnar cache)
+            each layer only when it is accessed (see :class:`~pydriosm.reader.lazy.LazyLayers`),
+            defaults to ``False``
+        :type lazy: bool
+        :param workers: number of worker processes across which the features of each layer
+            are parsed, defaults to ``None``; see the parameter ``workers`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type workers: int | None
+        :param max_chunk_memory: memory budget (in MB) for parsing each chunk of features,
+            to which the size of the chunks is adapted (instead of ``chunk_size_limit``),
+            defaults to ``None``; see the parameter ``max_chunk_memory`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type max_chunk_memory: int | float | str | None
+        :param compact: whether to represent the parsed data with compact data types,
+            defaults to ``False``; see the parameter ``compact`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type compact: bool
+        :param geometry_format: (when ``compact=True``) format of the ``'geometry'`` column,
+            e.g. ``'quantized'``, defaults to ``None``; see the parameter ``geometry_format``
+            of the method :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type geometry_format: str | None
         :param verbose: whether to print relevant information in console as the function runs,
             defaults to ``False``
         :type verbose: bool | int
@@ -106,7 +152,7 @@ class BBBikeReader(_Reader):
             :meth:`_Reader.read_osm_pbf()<pydriosm.reader._Reader.read_osm_pbf>`
         :return: dictionary of the .osm.pbf data;
             when ``pickle_it=True``, return a tuple of the dictionary and a path to the pickle file
-        :rtype: dict | tuple | None
+        :rtype: dict | LazyLayers | tuple | None
 
         .. _`shapely.geometry`:
             https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
@@ -176,13 +222,18 @@ class BBBikeReader(_Reader):
             parse_geometry=parse_geometry, parse_properties=parse_properties,
             parse_other_tags=parse_other_tags, update=update, download=download,
             pickle_it=pickle_it, ret_pickle_path=ret_pickle_path, rm_pbf_file=rm_pbf_file,
-            chunk_size_limit=chunk_size_limit, verbose=verbose, **kwargs)
+            chunk_size_limit=chunk_size_limit, layer_names=layer_names, tag_filter=tag_filter,
+            bbox=bbox, mask=mask, layer_attributes=layer_attributes,
+            cache_format=cache_format, lazy=lazy, workers=workers,
+            max_chunk_memory=max_chunk_memory, compact=compact, geometry_format=geometry_format,
+            verbose=verbose, **kwargs)
 
         return osm_pbf_data
 
     def read_shp_zip(self, subregion_name, layer_names=None, feature_names=None, data_dir=None,
                      update=False, download=True, pickle_it=False, ret_pickle_path=False,
-                     rm_extracts=False, rm_shp_zip=False, verbose=False, **kwargs):
+                     rm_extracts=None, rm_shp_zip=False, cache_format='pickle', lazy=False,
+                     workers=None, verbose=False, **kwargs):
         """
         Read a shapefile of a geographic (sub)region.
 
@@ -208,11 +259,25 @@ class BBBikeReader(_Reader):
         :param ret_pickle_path: (when ``pickle_it=True``)
             whether to return a path to the saved pickle file
         :type ret_pickle_path: bool
-        :param rm_extracts: whether to delete extracted files from the .shp.zip file,
-            defaults to ``False``
-        :type rm_extracts: bool
+        :param rm_extracts: whether to delete extracted files from the .shp.zip file;
+            when ``rm_extracts=None`` (default) or ``rm_extracts=True``, the shapefiles are read
+            straight from the .shp.zip file without being extracted (and with ``True``,
+            any existing extracts are deleted); when ``rm_extracts=False``, the .shp.zip file
+            is extracted and the extracts are kept
+        :type rm_extracts: bool | None
         :param rm_shp_zip: whether to delete the downloaded .shp.zip file, defaults to ``False``
         :type rm_shp_zip: bool
+        :param cache_format: format in which the data is saved (when ``pickle_it=True``)
+            and from which it is loaded, e.g. ``'parquet'``, defaults to ``'pickle'``;
+            see the parameter ``cache_format`` of the method
+            :meth:`BBBikeReader.read_osm_pbf()<pydriosm.reader.BBBikeReader.read_osm_pbf>`
+        :type cache_format: str
+        :param lazy: whether to return a mapping that reads (or loads from a columnar cache)
+            each layer only when it is accessed, defaults to ``False``
+        :type lazy: bool
+        :param workers: number of worker processes across which the layers are read,
+            defaults to ``None`` (i.e. the layers are read one after another)
+        :type workers: int | None
         :param verbose: whether to print relevant information in console as the function runs,
             defaults to ``False``
         :type verbose: bool | int
@@ -243,10 +308,7 @@ class BBBikeReader(_Reader):
             ...     subregion_name=subrgn_name, data_dir=dat_dir, download=True, verbose=True)
             Downloading "Birmingham.osm.shp.zip"
                 to "tests\\osm_data\\birmingham\\" ... Done.
-            Extracting "tests\\osm_data\\birmingham\\Birmingham.osm.shp.zip"
-                to "tests\\osm_data\\birmingham\\" ... Done.
-            Reading the shapefile(s) at
-                "tests\\osm_data\\birmingham\\Birmingham-shp\\shape\\" ... Done.
+            Reading the shapefile(s) in "tests\\osm_data\\birmingham\\Birmingham.osm.shp.zip" ... Done.
             >>> type(bham_shp)
             collections.OrderedDict
             >>> list(bham_shp.keys())
@@ -276,8 +338,7 @@ class BBBikeReader(_Reader):
             >>> bham_roads_shp = bbr.read_shp_zip(
             ...     subregion_name=subrgn_name, layer_names=lyr_name, data_dir=dat_dir,
             ...     rm_extracts=True, verbose=True)
-            Reading "tests\\osm_data\\birmingham\\Birmingham-shp\\shape\\roads.shp" ... Done.
-            Deleting the extracts "tests\\osm_data\\birmingham\\Birmingham-shp\\"  ... Done.
+            Reading the shapefile(s) in "tests\\osm_data\\birmingham\\Birmingham.osm.shp.zip" ... Done.
             >>> type(bham_roads_shp)
             collections.OrderedDict
             >>> list(bham_roads_shp.keys())
@@ -298,13 +359,7 @@ class BBBikeReader(_Reader):
             >>> bham_rw_rc_shp = bbr.read_shp_zip(
             ...     subregion_name=subrgn_name, layer_names=lyr_names, feature_names=feat_names,
             ...     data_dir=dat_dir, rm_extracts=True, rm_shp_zip=True, verbose=True)
-            Extracting the following layer(s):
-                'railways'
-                'waterways'
-                from "tests\\osm_data\\birmingham\\Birmingham.osm.shp.zip"
-                  to "tests\\osm_data\\birmingham\\" ... Done.
-            Reading the data at "tests\\osm_data\\birmingham\\Birmingham-shp\\shape\\" ... Done.
-            Deleting the extracts "tests\\osm_data\\birmingham\\Birmingham-shp\\"  ... Done.
+            Reading the shapefile(s) in "tests\\osm_data\\birmingham\\Birmingham.osm.shp.zip" ... Done.
             Deleting "tests\\osm_data\\birmingham\\Birmingham.osm.shp.zip" ... Done.
             >>> type(bham_rw_rc_shp)
             collections.OrderedDict
@@ -342,7 +397,7 @@ class BBBikeReader(_Reader):
             subregion_name=subregion_name, layer_names=layer_names, feature_names=feature_names,
             data_dir=data_dir, update=update, download=download, pickle_it=pickle_it,
             ret_pickle_path=ret_pickle_path, rm_extracts=rm_extracts, rm_shp_zip=rm_shp_zip,
-            verbose=verbose, **kwargs)
+            cache_format=cache_format, lazy=lazy, workers=workers, verbose=verbose, **kwargs)
 
         return shp_data
 
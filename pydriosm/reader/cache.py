@@ -0,0 +1,428 @@
+"""
+Cache parsed OSM data layer by layer in a columnar format.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pandas as pd
+import shapely.geometry
+import shapely.wkb
+from pyhelpers._cache import _check_dependency
+
+from pydriosm.reader.quantized import QuantizedGeometryDtype
+from pydriosm.utils import check_json_engine, check_relpath
+
+
+class LayerCache:
+    """
+    Cache parsed OSM data (of multiple layers) in a directory of columnar data files,
+    i.e. one `Apache Parquet <https://parquet.apache.org/>`_ (or `Feather`_) file per layer,
+    together with a metadata file recording the source data file and the encodings of columns.
+
+    Geometry objects are stored as `WKB`_ and dict-like data as JSON strings, so that the cached
+    data of a layer, or only a few columns of it, can be loaded without unpickling everything.
+
+    .. _`Feather`: https://arrow.apache.org/docs/python/feather.html
+    .. _`WKB`: https://libgeos.org/specifications/wkb/
+
+    .. note::
+
+        It requires that `PyArrow <https://pypi.org/project/pyarrow/>`_ is installed.
+
+    **Examples**::
+
+        >>> from pydriosm.reader import LayerCache
+
+        >>> layer_cache = LayerCache("tests\\osm_data\\rutland\\rutland-latest-pbf-00000000.parquet")
+        >>> layer_cache.file_format
+        'parquet'
+        >>> layer_cache.layer_names
+        []
+    """
+
+    #: set: Valid file formats of the cached data.
+    FILE_FORMATS = {'parquet', 'feather'}
+    #: str: Filename of the metadata of the cached data.
+    META_FILENAME = "meta.json"
+
+    def __init__(self, cache_dir, file_format=None):
+        """
+        :param cache_dir: pathname of a directory where the data is cached
+        :type cache_dir: str
+        :param file_format: format of the data files, options include ``'parquet'`` and
+            ``'feather'``; when ``file_format=None`` (default), it is determined by the extension of
+            ``cache_dir`` and defaults to ``'parquet'``
+        :type file_format: str | None
+
+        :ivar str cache_dir: pathname of the directory where the data is cached
+        :ivar str file_format: format of the data files
+        """
+
+        self.cache_dir = cache_dir
+
+        if file_format is None:
+            file_format = os.path.splitext(cache_dir)[1].lstrip('.')
+            file_format = file_format if file_format in self.FILE_FORMATS else 'parquet'
+        assert file_format in self.FILE_FORMATS, \
+            f"`file_format` must be one of {self.FILE_FORMATS}."
+
+        self.file_format = file_format
+
+    @classmethod
+    def make_cache_key(cls, **kwargs):
+        """
+        Make a key (i.e. a short hash) of the options with which the data is read and parsed.
+
+        :param kwargs: options with which the data is read and parsed, e.g. ``readable=True``
+        :return: the first eight characters of the MD5 hash of the options
+        :rtype: str
+
+        **Examples**::
+
+            >>> from pydriosm.reader import LayerCache
+
+            >>> key_1 = LayerCache.make_cache_key(readable=True, expand=True)
+            >>> key_2 = LayerCache.make_cache_key(readable=True, expand=True, parse_geometry=True)
+            >>> len(key_1) == len(key_2) == 8 and key_1 != key_2
+            True
+        """
+
+        # Geometries (e.g. `mask`) are represented by their WKT
+        options = json.dumps(kwargs, sort_keys=True, default=str)
+
+        return hashlib.md5(options.encode('utf-8')).hexdigest()[:8]
+
+    @classmethod
+    def get_fingerprint(cls, pathname):
+        """
+        Get a fingerprint (i.e. name, size and time of last modification) of a source data file.
+
+        :param pathname: pathname of a data file
+        :type pathname: str
+        :return: fingerprint of the data file
+        :rtype: dict
+        """
+
+        stat = os.stat(pathname)
+
+        fingerprint = {
+            'filename': os.path.basename(pathname),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+        return fingerprint
+
+    @property
+    def meta(self):
+        """
+        Metadata of the cached data; an empty dict if no data has been cached.
+
+        :return: metadata of the cached data
+        :rtype: dict
+        """
+
+        path_to_meta = os.path.join(self.cache_dir, self.META_FILENAME)
+
+        if os.path.isfile(path_to_meta):
+            with open(path_to_meta, mode='r', encoding='utf-8') as f:
+                meta = json.load(f)
+        else:
+            meta = {}
+
+        return meta
+
+    @property
+    def layer_names(self):
+        """
+        Names of the cached layers.
+
+        :return: names of the cached layers
+        :rtype: list
+        """
+
+        return list(self.meta.get('layers', {}).keys())
+
+    def is_valid(self, source_pathname=None):
+        """
+        Check whether the data is cached and up to date with its source data file.
+
+        :param source_pathname: pathname of the source data file; if it is ``None`` (default) or
+            the file does not exist (e.g. it has been deleted), only the existence of cached data is
+            checked
+        :type source_pathname: str | None
+        :return: whether the cached data is available and up to date
+        :rtype: bool
+        """
+
+        meta = self.meta
+
+        if not meta:
+            return False
+
+        if source_pathname is not None and os.path.isfile(source_pathname):
+            return meta.get('source') == self.get_fingerprint(source_pathname)
+
+        return True
+
+    def _layer_pathname(self, layer_name):
+        return os.path.join(self.cache_dir, f"{layer_name}.{self.file_format}")
+
+    @classmethod
+    def _encode_column(cls, column):
+        """
+        Encode an object column so that it can be stored in a columnar format.
+
+        :param column: a column of layer data
+        :type column: pandas.Series
+        :return: encoded column and the name of the encoding (``None`` if not encoded)
+        :rtype: tuple
+        """
+
+        is_na = column.isna().to_numpy()
+        values = column[~is_na]
+        value_types = set(map(type, values))
+
+        for native_types in [(str,), (int, float, bool, np.number, np.bool_)]:
+            if all(issubclass(t, native_types) for t in value_types):
+                return column, None
+
+        def _encode(func):  # Nulls (e.g. NaN after a concatenation) are stored as None
+            return pd.Series(
+                [None if is_null else func(x) for x, is_null in zip(column.values, is_na)],
+                index=column.index, name=column.name, dtype=object)
+
+        if all(issubclass(t, shapely.geometry.base.BaseGeometry) for t in value_types):
+            return _encode(lambda x: x.wkb), 'wkb'
+
+        if value_types <= {dict, list}:
+            first_item = next((x[0] for x in values if isinstance(x, list) and x), None)
+            encoding = 'json_tuples' if isinstance(first_item, tuple) else 'json'
+            try:  # Strict JSON, which can be decoded by any of the JSON engines
+                return _encode(lambda x: json.dumps(x, allow_nan=False)), encoding
+            except (TypeError, ValueError):  # e.g. geometry objects or NaN within dicts
+                pass
+
+        return _encode(pickle.dumps), 'pickle'
+
+    @staticmethod
+    def _get_json_loads():
+        """
+        Get the fastest available function for decoding JSON data.
+
+        :return: the function ``loads`` of `orjson`_ or `UltraJSON`_ (if available),
+            or otherwise of the built-in `json`_ module
+        :rtype: typing.Callable
+
+        .. _`orjson`: https://pypi.org/project/orjson/
+        .. _`UltraJSON`: https://pypi.org/project/ujson/
+        .. _`json`: https://docs.python.org/3/library/json.html#module-json
+        """
+
+        for engine in ['orjson', 'ujson']:
+            if importlib.util.find_spec(engine) is not None:
+                return check_json_engine(engine).loads
+
+        return json.loads
+
+    @classmethod
+    def _decode_column(cls, column, encoding):
+        """
+        Decode a column that is encoded by the method
+        :meth:`LayerCache._encode_column()<pydriosm.reader.cache.LayerCache._encode_column>`.
+
+        :param column: an encoded column of layer data
+        :type column: pandas.Series
+        :param encoding: name of the encoding
+        :type encoding: str
+        :return: decoded column
+        :rtype: pandas.Series
+        """
+
+        if encoding == 'wkb':
+            if hasattr(shapely, 'from_wkb'):  # shapely >= 2.0
+                return pd.Series(shapely.from_wkb(column.values), index=column.index,
+                                 name=column.name, dtype=object)
+            func = shapely.wkb.loads
+        elif encoding == 'json':
+            func = cls._get_json_loads()
+        elif encoding == 'json_tuples':
+            json_loads = cls._get_json_loads()
+
+            def func(x):
+                return [tuple(y) if isinstance(y, list) else y for y in json_loads(x)]
+        else:  # encoding == 'pickle'
+            func = pickle.loads
+
+        decoded_column = pd.Series(
+            [None if x is None else func(x) for x in column.values], index=column.index,
+            name=column.name, dtype=object)
+
+        return decoded_column
+
+    def save(self, data, source_pathname=None, verbose=False):
+        """
+        Save (parsed) OSM data into the cache, replacing any data that has been cached.
+
+        :param data: data of multiple layers,
+            with keys and values being layer names and layer data, respectively
+        :type data: dict
+        :param source_pathname: pathname of the source data file, whose fingerprint is recorded in
+            the metadata, defaults to ``None``
+        :type source_pathname: str | None
+        :param verbose: whether to print relevant information in console, defaults to ``False``
+        :type verbose: bool | int
+
+        **Examples**::
+
+            >>> from pydriosm.reader import LayerCache
+            >>> from pydriosm.reader import GeofabrikReader
+            >>> from pyhelpers.dirs import delete_dir
+
+            >>> gfr = GeofabrikReader()
+
+            >>> subrgn_name = 'rutland'
+            >>> dat_dir = "tests\\osm_data"
+
+            >>> rutland_pbf, path_to_rutland_pbf = gfr.read_osm_pbf(
+            ...     subrgn_name, dat_dir, expand=True, parse_geometry=True, pickle_it=True,
+            ...     ret_pickle_path=True, cache_format='parquet')
+            >>> layer_cache = LayerCache(path_to_rutland_pbf)
+            >>> layer_cache.layer_names
+            ['points', 'lines', 'multilinestrings', 'multipolygons', 'other_relations']
+
+            >>> # Load only the 'geometry' of the layer of 'lines'
+            >>> rutland_lines = layer_cache.load(layer_names='lines', columns=['geometry'])
+            >>> rutland_lines['lines'].columns.tolist()
+            ['geometry']
+
+            >>> # Delete the test data directory
+            >>> delete_dir(dat_dir, confirmation_required=False)
+        """
+
+        _check_dependency(name='pyarrow')
+
+        if verbose:
+            cache_dir_, cache_dirname = os.path.split(self.cache_dir)
+            print(f"Saving \"{cache_dirname}\" to \"{check_relpath(cache_dir_)}\\\"", end=" ... ")
+
+        if os.path.exists(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+        os.makedirs(self.cache_dir)
+
+        layers_meta = {}
+
+        for layer_name, layer_data in data.items():
+            if isinstance(layer_data, list):  # e.g. raw features of a PBF layer
+                layer_meta = {'kind': 'list'}
+                layer_data = pd.DataFrame({str(layer_name): pd.Series(layer_data, dtype=object)})
+            elif isinstance(layer_data, pd.Series):
+                layer_meta = {'kind': 'series', 'name': layer_data.name}
+                layer_data = layer_data.to_frame(name=str(layer_name))
+            else:
+                layer_meta = {'kind': 'dataframe'}
+                if type(layer_data).__name__ == 'GeoDataFrame':
+                    geom_col, crs = layer_data.geometry.name, layer_data.crs
+                    layer_meta.update({
+                        'kind': 'geodataframe',
+                        'geometry': geom_col,
+                        'crs': None if crs is None else crs.to_wkt()})
+                    layer_data = pd.DataFrame(layer_data).astype({geom_col: object})
+
+            layer_data, encodings = layer_data.copy(), {}
+            for col in layer_data.columns:
+                if isinstance(layer_data[col].dtype, QuantizedGeometryDtype):  # Decoded
+                    layer_data[col] = layer_data[col].astype(object)
+                if layer_data[col].dtype == object:
+                    layer_data[col], encoding = self._encode_column(layer_data[col])
+                    if encoding:
+                        encodings[col] = encoding
+            layer_meta.update({'columns': list(layer_data.columns), 'encodings': encodings})
+
+            layer_pathname = self._layer_pathname(layer_name)
+            if self.file_format == 'feather':
+                layer_data.reset_index(drop=True).to_feather(layer_pathname)
+            else:
+                layer_data.to_parquet(layer_pathname, engine='pyarrow')
+
+            layers_meta[layer_name] = layer_meta
+
+        meta = {
+            'source': None if source_pathname is None else self.get_fingerprint(source_pathname),
+            'layers': layers_meta,
+        }
+        # The metadata is written last so that an incomplete cache is never regarded as valid
+        with open(os.path.join(self.cache_dir, self.META_FILENAME), mode='w') as f:
+            json.dump(meta, f, indent=4)
+
+        if verbose:
+            print("Done.")
+
+    def load(self, layer_names=None, columns=None):
+        """
+        Load (parsed) OSM data from the cache.
+
+        :param layer_names: name of a layer, or names of multiple layers, to be loaded;
+            if ``None`` (default), all cached layers
+        :type layer_names: str | list | None
+        :param columns: names of columns to be loaded from each layer (in a tabular format);
+            if ``None`` (default), all columns
+        :type columns: list | None
+        :return: data of the specified layers,
+            with keys and values being layer names and layer data, respectively
+        :rtype: dict
+
+        .. seealso::
+
+            - Examples for the method
+              :meth:`LayerCache.save()<pydriosm.reader.cache.LayerCache.save>`.
+        """
+
+        _check_dependency(name='pyarrow')
+
+        layers_meta = self.meta.get('layers', {})
+
+        if layer_names is None:
+            layer_names_ = list(layers_meta.keys())
+        else:
+            layer_names_ = [layer_names] if isinstance(layer_names, str) else layer_names
+            layer_names_ = [x for x in layers_meta.keys() if x in layer_names_]
+
+        data = {}
+
+        for layer_name in layer_names_:
+            layer_meta = layers_meta[layer_name]
+
+            if layer_meta['kind'] in {'list', 'series'} or columns is None:
+                columns_ = None
+            else:
+                columns_ = [x for x in layer_meta['columns'] if x in columns]
+
+            layer_pathname = self._layer_pathname(layer_name)
+            if self.file_format == 'feather':
+                layer_data = pd.read_feather(layer_pathname, columns=columns_)
+            else:
+                layer_data = pd.read_parquet(layer_pathname, engine='pyarrow', columns=columns_)
+
+            for col, encoding in layer_meta['encodings'].items():
+                if col in layer_data.columns:
+                    layer_data[col] = self._decode_column(layer_data[col], encoding)
+
+            if layer_meta['kind'] == 'list':
+                layer_data = layer_data.iloc[:, 0].tolist()
+            elif layer_meta['kind'] == 'series':
+                layer_data = layer_data.iloc[:, 0].rename(layer_meta['name'])
+            elif layer_meta['kind'] == 'geodataframe' and layer_meta['geometry'] in layer_data:
+                gpd = _check_dependency(name='geopandas')
+                layer_data = gpd.GeoDataFrame(
+                    layer_data, geometry=layer_meta['geometry'], crs=layer_meta['crs'])
+
+            data[layer_name] = layer_data
+
+        return data
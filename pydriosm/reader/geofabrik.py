@@ -176,7 +176,10 @@ class GeofabrikReader(_Reader):
     def read_osm_pbf(self, subregion_name, data_dir=None, readable=False, expand=False,
                      parse_geometry=False, parse_properties=False, parse_other_tags=False,
                      update=False, download=True, pickle_it=False, ret_pickle_path=False,
-                     rm_pbf_file=False, chunk_size_limit=50, verbose=False, **kwargs):
+                     rm_pbf_file=False, chunk_size_limit=50, layer_names=None, tag_filter=None,
+                     bbox=None, mask=None, layer_attributes=None, cache_format='pickle',
+                     lazy=False, workers=None, max_chunk_memory=None, compact=False,
+                     geometry_format=None, verbose=False, **kwargs):
         """
         Read a PBF (.osm.pbf) data file of a geographic (sub)region.
 
@@ -216,6 +219,49 @@ class GeofabrikReader(_Reader):
             if the size of the .osm.pbf file (in MB) is greater than ``chunk_size_limit``,
             it will be parsed in a chunk-wise way
         :type chunk_size_limit: int | None
+        :param layer_names: name of a PBF layer, e.g. 'lines', or names of multiple layers;
+            if ``None`` (default), all available layers
+        :type layer_names: str | list | None
+        :param tag_filter: tags by which features are selected before being parsed,
+            e.g. ``{'highway': None}``, defaults to ``None``; see the parameter ``tag_filter`` of
+            the method :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type tag_filter: dict | str | None
+        :param bbox: bounding box ``(min_x, min_y, max_x, max_y)`` within which
+            the features are selected before being parsed, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param layer_attributes: tags to be reported as fields of the layers,
+            e.g. ``{'lines': ['name', 'highway', 'maxspeed']}``, defaults to ``None``;
+            see the parameter ``layer_attributes`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type layer_attributes: dict | list | None
+        :param cache_format: format in which the parsed data is saved (when ``pickle_it=True``)
+            and from which it is loaded; options include ``'pickle'`` (default) for a single
+            pickle file, and ``'parquet'`` and ``'feather'`` for a columnar cache of the layers
+            (see :class:`~pydriosm.reader.cache.LayerCache`)
+        :type cache_format: str
+        :param lazy: whether to return a mapping that parses (or loads from a columnar cache)
+            each layer only when it is accessed (see :class:`~pydriosm.reader.lazy.LazyLayers`),
+            defaults to ``False``
+        :type lazy: bool
+        :param workers: number of worker processes across which the features of each layer
+            are parsed, defaults to ``None``; see the parameter ``workers`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type workers: int | None
+        :param max_chunk_memory: memory budget (in MB) for parsing each chunk of features,
+            to which the size of the chunks is adapted (instead of ``chunk_size_limit``),
+            defaults to ``None``; see the parameter ``max_chunk_memory`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type max_chunk_memory: int | float | str | None
+        :param compact: whether to represent the parsed data with compact data types,
+            defaults to ``False``; see the parameter ``compact`` of the method
+            :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type compact: bool
+        :param geometry_format: (when ``compact=True``) format of the ``'geometry'`` column,
+            e.g. ``'quantized'``, defaults to ``None``; see the parameter ``geometry_format``
+            of the method :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
+        :type geometry_format: str | None
         :param verbose: whether to print relevant information in console as the function runs,
             defaults to ``False``
         :type verbose: bool | int
@@ -223,7 +269,7 @@ class GeofabrikReader(_Reader):
             :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`
         :return: dictionary of the .osm.pbf data;
             when ``pickle_it=True``, return a tuple of the dictionary and a path to the pickle file
-        :rtype: dict | tuple | None
+        :rtype: dict | LazyLayers | tuple | None
 
         .. _`shapely.geometry`:
             https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
@@ -284,6 +330,27 @@ class GeofabrikReader(_Reader):
             4  14558402  ...  {'osm_id': '14558402', 'name': None, 'barrier'...
             [5 rows x 3 columns]
 
+            >>> # Parse only the layer of 'lines'
+            >>> pbf_lines = gfr.read_osm_pbf(subrgn_name, dat_dir, expand=True, layer_names='lines')
+            >>> list(pbf_lines.keys())
+            ['lines']
+
+            >>> # Cache the parsed data of 'lines' in a Parquet file (rather than a pickle file)
+            >>> pbf_lines, pbf_lines_cache = gfr.read_osm_pbf(
+            ...     subrgn_name, dat_dir, expand=True, pickle_it=True, ret_pickle_path=True,
+            ...     layer_names='lines', cache_format='parquet', verbose=True)
+            Parsing "tests\\osm_data\\rutland\\rutland-latest.osm.pbf" ... Done.
+            Saving "rutland-latest-lines-pbf-fde4a1ea.parquet" to "tests\\osm_data\\rutland\\" ... Done.
+
+            >>> # Parse each layer only when it is accessed
+            >>> pbf_lazy = gfr.read_osm_pbf(subrgn_name, dat_dir, expand=True, lazy=True)
+            >>> pbf_lazy.loaded_layer_names
+            []
+            >>> pbf_lazy_lines = pbf_lazy['lines']
+            >>> pbf_lazy.loaded_layer_names
+            ['lines']
+            >>> pbf_lazy.release()
+
             >>> # Set `readable` and `parse_geometry` to be `True`
             >>> pbf_parsed_1 = gfr.read_osm_pbf(subrgn_name, dat_dir, readable=True,
             ...                                 parse_geometry=True)
@@ -323,8 +390,11 @@ class GeofabrikReader(_Reader):
             parse_geometry=parse_geometry, parse_properties=parse_properties,
             parse_other_tags=parse_other_tags,
             update=update, download=download, pickle_it=pickle_it, ret_pickle_path=ret_pickle_path,
-            rm_pbf_file=rm_pbf_file, chunk_size_limit=chunk_size_limit, verbose=verbose,
-            **kwargs)
+            rm_pbf_file=rm_pbf_file, chunk_size_limit=chunk_size_limit, layer_names=layer_names,
+            tag_filter=tag_filter, bbox=bbox, mask=mask, layer_attributes=layer_attributes,
+            cache_format=cache_format, lazy=lazy, workers=workers,
+            max_chunk_memory=max_chunk_memory, compact=compact, geometry_format=geometry_format,
+            verbose=verbose, **kwargs)
 
         return osm_pbf_data
 
@@ -445,7 +515,7 @@ class GeofabrikReader(_Reader):
     def merge_subregion_layer_shp(self, subregion_names, layer_name, data_dir=None, engine='pyshp',
                                   update=False, download=True, rm_zip_extracts=True,
                                   merged_shp_dir=None, rm_shp_temp=True, verbose=False,
-                                  ret_merged_shp_path=False):
+                                  ret_merged_shp_path=False, workers=None, drop_duplicates=True):
         """
         Merge shapefiles for a specific layer of two or multiple geographic regions.
 
@@ -455,9 +525,12 @@ class GeofabrikReader(_Reader):
         :param layer_name: name of a layer (e.g. 'railways')
         :type layer_name: str
         :param engine: the method used to merge/save shapefiles;
-            options include: ``'pyshp'`` (default) and ``'geopandas'`` (or ``'gpd'``)
+            options include: ``'pyshp'`` (default), ``'pyogrio'`` and ``'geopandas'`` (or ``'gpd'``)
             if ``engine='geopandas'``, this function relies on `geopandas.GeoDataFrame.to_file()`_;
-            otherwise, it by default uses `shapefile.Writer()`_
+            otherwise, the shapefiles are read straight from the .shp.zip files and
+            their data is appended to the merged shapefile one after another
+            (see the method :meth:`SHPReadParse.merge_layer_shps()
+            <pydriosm.reader.SHPReadParse.merge_layer_shps>`)
         :type engine: str
         :param update: whether to update the source .shp.zip files, defaults to ``False``
         :type update: bool
@@ -479,13 +552,18 @@ class GeofabrikReader(_Reader):
         :param ret_merged_shp_path: whether to return the path to the merged .shp file,
             defaults to ``False``
         :type ret_merged_shp_path: bool
+        :param workers: number of worker processes across which the shapefiles are read,
+            defaults to ``None``; see the parameter ``workers`` of the method
+            :meth:`SHPReadParse.merge_layer_shps()<pydriosm.reader.SHPReadParse.merge_layer_shps>`
+        :type workers: int | None
+        :param drop_duplicates: whether to drop the features (at the borders of the regions)
+            whose OSM IDs have already been merged, defaults to ``True``
+        :type drop_duplicates: bool
         :return: the path to the merged file when ``ret_merged_shp_path=True``
         :rtype: list | str
 
         .. _`geopandas.GeoDataFrame.to_file()`:
             https://geopandas.org/reference.html#geopandas.GeoDataFrame.to_file
-        .. _`shapefile.Writer()`:
-            https://github.com/GeospatialPython/pyshp#writing-shapefiles
 
         .. _pydriosm-GeofabrikReader-merge_subregion_layer_shp:
 
@@ -518,6 +596,7 @@ class GeofabrikReader(_Reader):
                 "greater-manchester_gis_osm_railways_free_1.shp"
                 "west-yorkshire_gis_osm_railways_free_1.shp"
                     In progress ... Done.
+                    Dropped ... duplicated feature(s) (by OSM ID).
                     Find the merged shapefile at "tests\\osm_data\\gre_man-wes_yor-railways\\".
 
             >>> os.path.relpath(path_to_merged_shp_file)
@@ -577,6 +656,7 @@ class GeofabrikReader(_Reader):
                 "surrey_gis_osm_transport_a_free_1.shp"
                 "surrey_gis_osm_transport_free_1.shp"
                     In progress ... Done.
+                    Dropped ... duplicated feature(s) (by OSM ID).
                     Find the merged shapefile at "tests\\osm_data\\gre_lon-ken-sur-transport\\".
 
             >>> type(path_to_merged_shp_file)
@@ -628,14 +708,16 @@ class GeofabrikReader(_Reader):
             path_to_merged_shp = self.SHP.merge_layer_shps(
                 shp_zip_pathnames=paths_to_shp_zip_files, layer_name=layer_name_, engine=engine,
                 rm_zip_extracts=rm_zip_extracts, output_dir=merged_shp_dir, rm_shp_temp=rm_shp_temp,
-                verbose=verbose, ret_shp_pathname=ret_merged_shp_path)
+                verbose=verbose, ret_shp_pathname=ret_merged_shp_path, workers=workers,
+                drop_duplicates=drop_duplicates)
 
             if ret_merged_shp_path:
                 return path_to_merged_shp
 
     def read_shp_zip(self, subregion_name, layer_names=None, feature_names=None, data_dir=None,
                      update=False, download=True, pickle_it=False, ret_pickle_path=False,
-                     rm_extracts=False, rm_shp_zip=False, verbose=False, **kwargs):
+                     rm_extracts=None, rm_shp_zip=False, cache_format='pickle', lazy=False,
+                     workers=None, verbose=False, **kwargs):
         """
         Read a .shp.zip data file of a geographic (sub)region.
 
@@ -661,18 +743,32 @@ class GeofabrikReader(_Reader):
         :param ret_pickle_path: (when ``pickle_it=True``)
             whether to return a path to the saved pickle file
         :type ret_pickle_path: bool
-        :param rm_extracts: whether to delete extracted files from the .shp.zip file,
-            defaults to ``False``
-        :type rm_extracts: bool
+        :param rm_extracts: whether to delete extracted files from the .shp.zip file;
+            when ``rm_extracts=None`` (default) or ``rm_extracts=True``, the shapefiles are read
+            straight from the .shp.zip file without being extracted (and with ``True``,
+            any existing extracts are deleted); when ``rm_extracts=False``, the .shp.zip file
+            is extracted and the extracts are kept
+        :type rm_extracts: bool | None
         :param rm_shp_zip: whether to delete the downloaded .shp.zip file, defaults to ``False``
         :type rm_shp_zip: bool
+        :param cache_format: format in which the data is saved (when ``pickle_it=True``)
+            and from which it is loaded, e.g. ``'parquet'``, defaults to ``'pickle'``;
+            see the parameter ``cache_format`` of the method
+            :meth:`GeofabrikReader.read_osm_pbf()<pydriosm.reader.GeofabrikReader.read_osm_pbf>`
+        :type cache_format: str
+        :param lazy: whether to return a mapping that reads (or loads from a columnar cache)
+            each layer only when it is accessed, defaults to ``False``
+        :type lazy: bool
+        :param workers: number of worker processes across which the layers are read,
+            defaults to ``None`` (i.e. the layers are read one after another)
+        :type workers: int | None
         :param verbose: whether to print relevant information in console as the function runs,
             defaults to ``False``
         :type verbose: bool | int
         :return: dictionary of the shapefile data,
             with keys and values being layer names and tabular data
             (in the format of `geopandas.GeoDataFrame`_), respectively
-        :rtype: dict | collections.OrderedDict | None
+        :rtype: dict | collections.OrderedDict | LazyLayers | None
 
         .. _`geopandas.GeoDataFrame`: https://geopandas.org/reference.html#geodataframe
 
@@ -695,10 +791,8 @@ class GeofabrikReader(_Reader):
             ...     subregion_name=subrgn_name, data_dir=dat_dir, download=True, verbose=True)
             Downloading "greater-london-latest-free.shp.zip"
                 to "tests\\osm_data\\greater-london\\" ... Done.
-            Extracting "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip"
-                to "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
-            Reading the shapefile(s) at
-                "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
+            Reading the shapefile(s) in
+                "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip" ... Done.
             >>> type(london_shp_data)
             collections.OrderedDict
             >>> list(london_shp_data.keys())
@@ -730,13 +824,13 @@ class GeofabrikReader(_Reader):
             >>> # (and delete any extracts)
             >>> subrgn_layer = 'transport'
 
-            >>> # Set `rm_extracts=True` to remove the extracts
+            >>> # Set `rm_extracts=True` to remove any extracts
+            >>> # (or `rm_extracts=False` to extract the .shp.zip file and keep the extracts)
             >>> london_shp_transport = gfr.read_shp_zip(
             ...     subregion_name=subrgn_name, layer_names=subrgn_layer, data_dir=dat_dir,
             ...     rm_extracts=True, verbose=True)
-            Reading the shapefile(s) at
-                "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
-            Deleting the extracts "tests\\osm_data\\greater-london\\greater-london-latest-free-sh...
+            Reading the shapefile(s) in
+                "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip" ... Done.
             >>> type(london_shp_transport)
             collections.OrderedDict
             >>> list(london_shp_transport.keys())
@@ -757,13 +851,8 @@ class GeofabrikReader(_Reader):
             >>> london_bus_stop = gfr.read_shp_zip(
             ...     subregion_name=subrgn_name, layer_names=subrgn_layer, feature_names=feat_name,
             ...     data_dir=dat_dir, rm_extracts=True, verbose=True)
-            Extracting the following layer(s):
-                'transport'
-                from "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip"
-                  to "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
-            Reading the shapefile(s) at
-                "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
-            Deleting the extracts "tests\\osm_data\\greater-london\\greater-london-latest-free-sh...
+            Reading the shapefile(s) in
+                "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip" ... Done.
             >>> type(london_bus_stop)
             collections.OrderedDict
             >>> list(london_bus_stop.keys())
@@ -780,14 +869,8 @@ class GeofabrikReader(_Reader):
             >>> london_shp_tra_roa_par_tru = gfr.read_shp_zip(
             ...     subregion_name=subrgn_name, layer_names=subrgn_layers, feature_names=feat_names,
             ...     data_dir=dat_dir, rm_extracts=True, rm_shp_zip=True, verbose=True)
-            Extracting the following layer(s):
-                'traffic'
-                'roads'
-                from "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip"
-                  to "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
-            Reading the shapefile(s) at
-                "tests\\osm_data\\greater-london\\greater-london-latest-free-shp\\" ... Done.
-            Deleting the extracts "tests\\osm_data\\greater-london\\greater-london-latest-free-sh...
+            Reading the shapefile(s) in
+                "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip" ... Done.
             Deleting "tests\\osm_data\\greater-london\\greater-london-latest-free.shp.zip" ... Done.
             >>> type(london_shp_tra_roa_par_tru)
             collections.OrderedDict
@@ -825,6 +908,6 @@ class GeofabrikReader(_Reader):
             subregion_name=subregion_name, layer_names=layer_names, feature_names=feature_names,
             data_dir=data_dir, update=update, download=download, pickle_it=pickle_it,
             ret_pickle_path=ret_pickle_path, rm_extracts=rm_extracts, rm_shp_zip=rm_shp_zip,
-            verbose=verbose, **kwargs)
+            cache_format=cache_format, lazy=lazy, workers=workers, verbose=verbose, **kwargs)
 
         return shp_data
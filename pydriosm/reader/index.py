@@ -0,0 +1,886 @@
+"""
+Index parsed OSM data layer by layer for looking up features without scanning the data.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import shapely.geometry
+
+from pydriosm.errors import OtherTagsReformatError
+from pydriosm.reader.cache import LayerCache
+from pydriosm.reader.quantized import QuantizedGeometryArray
+from pydriosm.reader.store import LayerStore
+from pydriosm.reader.transformer import Transformer
+
+
+class FeatureIndex:
+    """
+    Look up the features of parsed OSM data (of multiple layers) by their IDs.
+
+    For each layer, the IDs of the features (i.e. of the column ``'id'`` or ``'osm_id'``) are kept
+    in a sorted array, which is built only when the layer is looked up for the first time,
+    so that finding a feature takes a binary search rather than a full scan of the layer.
+    For data in a :class:`~pydriosm.reader.store.LayerStore`, the search runs over
+    the memory-mapped IDs (with the order saved in the store) and only the features that are found
+    are decoded.
+
+    **Examples**::
+
+        >>> from pydriosm.reader import PBFReadParse, FeatureIndex
+
+        >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+        >>> rutland_pbf = PBFReadParse.read_pbf(
+        ...     rutland_pbf_path, expand=True, parse_geometry=True, parse_properties=True,
+        ...     parse_other_tags=True)
+
+        >>> feature_index = FeatureIndex(rutland_pbf)
+        >>> rutland_lines = feature_index.get_features('lines', [2484493, 2162114])
+        >>> rutland_lines[['id', 'highway']]
+                id highway
+        0  2484493   trunk
+        1  2162114    None
+
+        >>> # Look up the features in all layers
+        >>> features = feature_index.get_features(None, [488432, 2484493], columns=['geometry'])
+        >>> list(features.keys())
+        ['points', 'lines']
+    """
+
+    #: list: Names of the columns of feature IDs, in order of preference.
+    ID_COLUMNS = ['id', 'osm_id']
+
+    def __init__(self, data):
+        """
+        :param data: data of multiple layers, with keys and values being layer names and
+            layer data (in the format of `pandas.DataFrame`_), respectively,
+            e.g. the data returned by a reader; or a store of the data
+        :type data: dict | LayerStore
+
+        :ivar dict | LayerStore data: data of multiple layers
+
+        .. _`pandas.DataFrame`:
+            https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
+        """
+
+        self.data = data
+
+        self._id_index = {}
+
+    @property
+    def layer_names(self):
+        """
+        Names of the layers that can be looked up.
+
+        :return: names of the layers
+        :rtype: list
+        """
+
+        if isinstance(self.data, LayerStore):
+            layer_names = [x for x in self.data.layer_names if self.data[x].ids is not None]
+        else:
+            layer_names = [
+                k for k, v in self.data.items()
+                if isinstance(v, pd.DataFrame) and any(x in v.columns for x in self.ID_COLUMNS)]
+
+        return layer_names
+
+    def _get_id_index(self, layer_name):
+        """
+        Get the sorted IDs of the features of a layer, and the order in which they are sorted.
+
+        :return: sorted IDs, and their row indices (``None`` if the IDs are already sorted)
+        :rtype: tuple
+        """
+
+        if layer_name not in self._id_index:
+            if isinstance(self.data, LayerStore):
+                stored_layer = self.data[layer_name]
+                ids, order = stored_layer.ids, stored_layer.id_order
+                if ids is None:
+                    raise KeyError(layer_name)
+
+            else:
+                layer_data = self.data[layer_name]
+                id_col = next((x for x in self.ID_COLUMNS if x in layer_data.columns), None)
+                if id_col is None:
+                    raise KeyError(layer_name)
+                ids = layer_data[id_col].to_numpy()
+                order = None if pd.Index(ids).is_monotonic_increasing \
+                    else np.argsort(ids, kind='stable')
+
+            sorted_ids = ids if order is None else ids[order]
+            self._id_index[layer_name] = sorted_ids, order
+
+        return self._id_index[layer_name]
+
+    def locate(self, layer_name, ids):
+        """
+        Locate the features of given IDs in a layer.
+
+        :param layer_name: name of a layer
+        :type layer_name: str
+        :param ids: IDs of the features
+        :type ids: int | str | list | numpy.ndarray
+        :return: (row) indices of the features, with ``-1`` for the IDs that are not found;
+            if a layer has multiple features of the same ID, the first one is located
+        :rtype: numpy.ndarray
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse, FeatureIndex
+
+            >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+            >>> rutland_pbf = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, layer_names=['points'])
+
+            >>> feature_index = FeatureIndex(rutland_pbf)
+            >>> feature_index.locate('points', [488432, 1])
+            array([ 0, -1])
+        """
+
+        sorted_ids, order = self._get_id_index(layer_name)
+
+        ids_ = np.atleast_1d(np.asarray(ids))
+        if sorted_ids.dtype == object and len(sorted_ids) and isinstance(sorted_ids[0], str):
+            ids_ = ids_.astype(str).astype(object)  # e.g. the 'osm_id' of shapefiles
+
+        positions = np.searchsorted(sorted_ids, ids_, side='left')
+        found = positions < len(sorted_ids)
+        found[found] = sorted_ids[positions[found]] == ids_[found]
+
+        indices = np.full(len(ids_), -1, dtype=np.int64)
+        indices[found] = positions[found] if order is None else order[positions[found]]
+
+        return indices
+
+    def get_features(self, layer_name, ids, columns=None):
+        """
+        Get the features of given IDs, without decoding or copying the rest of the data.
+
+        :param layer_name: name of a layer; if ``None``, all layers are looked up
+        :type layer_name: str | None
+        :param ids: IDs of the features
+        :type ids: int | str | list | numpy.ndarray
+        :param columns: names of the columns to be returned, e.g. ``['geometry', 'other_tags']``;
+            if ``None`` (default), all columns
+        :type columns: list | None
+        :return: data of the features that are found, in the order of the given IDs
+            (and with the ID column), or when ``layer_name=None``,
+            a dict of such data of the layers where any of the features are found
+        :rtype: pandas.DataFrame | dict
+
+        .. seealso::
+
+            - Examples for the class :class:`~pydriosm.reader.index.FeatureIndex`.
+        """
+
+        if layer_name is None:
+            features = {}
+            for lyr_name in self.layer_names:
+                lyr_features = self.get_features(lyr_name, ids, columns=columns)
+                if not lyr_features.empty:
+                    features[lyr_name] = lyr_features
+            return features
+
+        indices = self.locate(layer_name, ids)
+        indices = indices[indices >= 0]
+
+        if isinstance(self.data, LayerStore):
+            stored_layer = self.data[layer_name]
+            if columns is not None:
+                columns = [stored_layer.meta['id_column']] + list(columns)
+            features = stored_layer.take(indices, columns=columns)
+
+        else:
+            layer_data = self.data[layer_name]
+            if columns is not None:
+                id_col = next(x for x in self.ID_COLUMNS if x in layer_data.columns)
+                layer_data = layer_data[[id_col] + [x for x in columns if x != id_col]]
+            features = layer_data.take(indices)
+
+        return features.reset_index(drop=True)
+
+
+class _SavedIndex:
+    """
+    Base of the indexes of layers that can be saved in the directory of a store or cache of
+    the data.
+    """
+
+    #: str: Name of the directory (in the directory of a store or cache) of saved indexes.
+    DIRNAME = ""
+
+    def __init__(self, data):
+        """
+        :param data: data of multiple layers, with keys and values being layer names and
+            layer data (in the format of `pandas.DataFrame`_), respectively,
+            e.g. the data returned by a reader; or a store or cache of the data
+        :type data: dict | LayerStore | LayerCache
+
+        :ivar dict | LayerStore | LayerCache data: data of multiple layers
+
+        .. _`pandas.DataFrame`:
+            https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
+        """
+
+        self.data = data
+
+        self._index = {}
+
+    @property
+    def index_dir(self):
+        """
+        Pathname of the directory where the indexes are saved, i.e. within the directory of
+        a store or cache; ``None`` for data that is in memory.
+
+        :return: pathname of the directory of saved indexes
+        :rtype: str | None
+        """
+
+        if isinstance(self.data, LayerStore):
+            index_dir = os.path.join(self.data.store_dir, self.DIRNAME)
+        elif isinstance(self.data, LayerCache):
+            index_dir = os.path.join(self.data.cache_dir, self.DIRNAME)
+        else:
+            index_dir = None
+
+        return index_dir
+
+    @property
+    def layer_names(self):
+        """
+        Names of the layers that can be indexed.
+
+        :return: names of the layers
+        :rtype: list
+        """
+
+        if isinstance(self.data, (LayerStore, LayerCache)):
+            layer_names = self.data.layer_names
+        else:
+            layer_names = [k for k, v in self.data.items() if isinstance(v, pd.DataFrame)]
+
+        return layer_names
+
+    def _index_pathname(self, layer_name):
+        return None if self.index_dir is None \
+            else os.path.join(self.index_dir, f"{layer_name}.npz")
+
+    def _build(self, layer_name):
+        """
+        Build the index of a layer.
+
+        :return: arrays of the index
+        :rtype: dict
+        """
+
+        raise NotImplementedError
+
+    def _get_index(self, layer_name):
+        if layer_name not in self._index:
+            path_to_index = self._index_pathname(layer_name)
+
+            if path_to_index is not None and os.path.isfile(path_to_index):
+                with np.load(path_to_index) as f:
+                    self._index[layer_name] = dict(f)
+            else:
+                self._index[layer_name] = self._build(layer_name)
+
+        return self._index[layer_name]
+
+    def save(self, layer_names=None):
+        """
+        Save the indexes of layers (building those that are not available) in the directory of
+        the store or cache of the data.
+
+        :param layer_names: name of a layer, or names of multiple layers;
+            if ``None`` (default), all layers
+        :type layer_names: str | list | None
+        """
+
+        assert self.index_dir is not None, "The data is neither in a store nor in a cache."
+
+        if layer_names is None:
+            layer_names_ = self.layer_names
+        else:
+            layer_names_ = [layer_names] if isinstance(layer_names, str) else layer_names
+
+        os.makedirs(self.index_dir, exist_ok=True)
+
+        for layer_name in layer_names_:
+            np.savez(self._index_pathname(layer_name), **self._get_index(layer_name))
+
+
+class TagIndex(_SavedIndex):
+    """
+    Query the features of parsed OSM data (of multiple layers) by their tags.
+
+    For each layer, an inverted index maps every tag key (e.g. ``'amenity'``) and every tag
+    (i.e. a key and a value, e.g. ``'amenity=hospital'``) to the sorted (row) indices of
+    the features that have it, so that a query combines a few arrays of row indices
+    instead of scanning the layer. The tags are collected from the columns of strings
+    (e.g. ``'highway'`` of an expanded PBF layer or ``'fclass'`` of a shapefile) and from the
+    dict-like data, e.g. ``'other_tags'`` (parsed or not) and ``'properties'``.
+
+    The index of a layer is built when the layer is queried for the first time. For data in
+    a :class:`~pydriosm.reader.store.LayerStore` or a :class:`~pydriosm.reader.cache.LayerCache`,
+    it can be saved in the same directory with the data and is then loaded instead of being built
+    again; it is removed together with the data when the data is replaced.
+
+    **Examples**::
+
+        >>> from pydriosm.reader import PBFReadParse, TagIndex
+
+        >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+        >>> rutland_pbf = PBFReadParse.read_pbf(
+        ...     rutland_pbf_path, expand=True, parse_properties=True, layer_names=['points'])
+
+        >>> tag_index = TagIndex(rutland_pbf)
+        >>> rows = tag_index.query('points', all_of=['amenity=post_box'], none_of=['ref'])
+        >>> rutland_pbf['points'].loc[rows, 'other_tags'].head(2)
+        72    "amenity"=>"post_box"
+        90    "amenity"=>"post_box"
+        Name: other_tags, dtype: object
+    """
+
+    #: str: Name of the directory (in the directory of a store or cache) of saved indexes.
+    DIRNAME = "tag_index"
+    #: set: Names of the columns that are not regarded as tags.
+    NON_TAG_COLUMNS = {'id', 'osm_id', 'geometry', 'coordinates', 'type', 'shape_type'}
+
+    def _load_layer_data(self, layer_name):
+        if isinstance(self.data, LayerStore):
+            stored_layer = self.data[layer_name]
+            columns = [
+                k for k, v in stored_layer.meta['columns'].items()
+                if v['encoding'] in {'dictionary', 'json', 'tags'}]
+            layer_data = stored_layer.to_frame(columns=columns)
+        elif isinstance(self.data, LayerCache):
+            layer_data = self.data.load(layer_names=layer_name)[layer_name]
+        else:
+            layer_data = self.data[layer_name]
+
+        return layer_data
+
+    @classmethod
+    def _collect_tags(cls, layer_data):
+        """
+        Collect the tags (i.e. row indices, keys and values) of the features of a layer.
+
+        Values are taken one by one: data of ``'other_tags'`` that is empty or cannot be parsed
+        is regarded as no tags, and values that are not strings (e.g. numbers in a column
+        of mixed types) are skipped.
+
+        :return: row indices, keys and values of all the tags
+        :rtype: tuple
+        """
+
+        rows, keys, values = [], [], []
+        parsed = {}  # Parsed data of each distinct string of 'other_tags'
+
+        def _parse_other_tags(other_tags):
+            if not isinstance(other_tags, str):  # e.g. None, or data that is already parsed
+                return other_tags if isinstance(other_tags, dict) else {}
+
+            tags = parsed.get(other_tags)
+            if tags is None:
+                try:
+                    tags = Transformer.transform_other_tags(other_tags) or {}
+                except OtherTagsReformatError:  # e.g. data that is truncated
+                    tags = {}
+                parsed[other_tags] = tags
+
+            return tags
+
+        for col in layer_data.columns:
+            if col in cls.NON_TAG_COLUMNS:
+                continue
+
+            column = layer_data[col].astype(object)
+            is_valid = column.notna().to_numpy()
+            if not is_valid.any():
+                continue
+            column_rows, column = np.flatnonzero(is_valid), column[is_valid]
+
+            if col != 'other_tags' and all(isinstance(x, str) for x in column):
+                # e.g. 'highway' of an expanded PBF layer
+                rows.append(column_rows)
+                keys.append(np.full(len(column), col, dtype=object))
+                values.append(column.to_numpy())
+                continue
+
+            rows_, keys_, values_ = [], [], []
+            for i, x in zip(column_rows, column):
+                if col == 'other_tags':
+                    x = _parse_other_tags(x)
+
+                if isinstance(x, dict):  # e.g. the parsed 'other_tags', or 'properties'
+                    if 'other_tags' in x:  # e.g. 'properties' that is not parsed
+                        x = {**x, **_parse_other_tags(x['other_tags'])}
+                    for k, v in x.items():
+                        if k not in cls.NON_TAG_COLUMNS and k != 'other_tags' and \
+                                isinstance(v, str):
+                            rows_.append(i), keys_.append(k), values_.append(v)
+
+                elif isinstance(x, str):  # e.g. a column of strings mixed with numbers
+                    rows_.append(i), keys_.append(col), values_.append(x)
+
+            rows.append(np.array(rows_, dtype=np.int64))
+            keys.append(np.array(keys_, dtype=object))
+            values.append(np.array(values_, dtype=object))
+
+        if rows:
+            rows, keys, values = map(np.concatenate, [rows, keys, values])
+        else:
+            rows, keys, values = np.array([], dtype=np.int64), np.array([]), np.array([])
+
+        return rows, keys, values
+
+    @staticmethod
+    def _make_postings(codes, rows, n_terms):
+        """
+        Make the (sorted and unique) row indices of each term.
+
+        :return: row indices of all terms, and the offsets of the row indices of each term
+        :rtype: tuple
+        """
+
+        order = np.lexsort((rows, codes))
+        codes, rows = codes[order], rows[order]
+
+        is_unique = np.ones(len(rows), dtype=bool)
+        is_unique[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        codes, rows = codes[is_unique], rows[is_unique]
+
+        offsets = np.searchsorted(codes, np.arange(n_terms + 1))
+
+        return rows.astype(np.uint32), offsets.astype(np.int64)
+
+    @classmethod
+    def build(cls, layer_data):
+        """
+        Build the inverted index of tags of a layer.
+
+        :param layer_data: data of a layer
+        :type layer_data: pandas.DataFrame
+        :return: arrays of the index, i.e. the (sorted) keys and tags with the offsets of
+            their row indices, and the number of features
+        :rtype: dict
+        """
+
+        rows, keys, values = cls._collect_tags(layer_data)
+
+        key_codes, key_terms = pd.factorize(keys, sort=True)
+        value_codes, value_terms = pd.factorize(values, sort=True)
+
+        # Tags are sorted by their keys and then by their values
+        n_values = max(len(value_terms), 1)
+        tag_terms, tag_codes = np.unique(
+            key_codes.astype(np.int64) * n_values + value_codes, return_inverse=True)
+        tag_keys, tag_values = key_terms[tag_terms // n_values], value_terms[tag_terms % n_values]
+
+        key_rows, key_offsets = cls._make_postings(key_codes, rows, len(key_terms))
+        tag_rows, tag_offsets = cls._make_postings(tag_codes, rows, len(tag_terms))
+
+        tag_index = {
+            'length': np.int64(len(layer_data)),
+            'keys': np.array(key_terms, dtype=str),
+            'key_rows': key_rows,
+            'key_offsets': key_offsets,
+            'tag_keys': np.array(tag_keys, dtype=str),
+            'tag_values': np.array(tag_values, dtype=str),
+            'tag_rows': tag_rows,
+            'tag_offsets': tag_offsets,
+        }
+
+        return tag_index
+
+    def _build(self, layer_name):
+        return self.build(self._load_layer_data(layer_name))
+
+    def save(self, layer_names=None):
+        """
+        Save the indexes of layers (building those that are not available) in the directory of
+        the store or cache of the data.
+
+        :param layer_names: name of a layer, or names of multiple layers;
+            if ``None`` (default), all layers
+        :type layer_names: str | list | None
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse, LayerStore, TagIndex
+            >>> from pyhelpers.dirs import delete_dir
+
+            >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+            >>> rutland_pbf = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_properties=True, parse_other_tags=True,
+            ...     layer_names=['points'])
+
+            >>> layer_store = LayerStore("tests\\data\\rutland\\rutland-latest-pbf.store")
+            >>> layer_store.save(rutland_pbf)
+
+            >>> TagIndex(layer_store).save()  # The index is loaded by other instances
+
+            >>> tag_index = TagIndex(layer_store)
+            >>> len(tag_index.query('points', any_of=['amenity=pub', 'amenity=bar']))
+            43
+
+            >>> # Delete the store
+            >>> delete_dir(layer_store.store_dir, confirmation_required=False)
+        """
+
+        super().save(layer_names=layer_names)
+
+    def _get_rows(self, layer_name, tag):
+        tag_index = self._get_index(layer_name)
+
+        if isinstance(tag, str):
+            tag = tuple(tag.split('=', 1))
+
+        if len(tag) == 1:
+            terms, rows, offsets = tag_index['keys'], tag_index['key_rows'], \
+                tag_index['key_offsets']
+            i = np.searchsorted(terms, tag[0])
+            found = i < len(terms) and terms[i] == tag[0]
+        else:
+            terms, rows, offsets = tag_index['tag_keys'], tag_index['tag_rows'], \
+                tag_index['tag_offsets']
+            lo, hi = np.searchsorted(terms, tag[0], side='left'), \
+                np.searchsorted(terms, tag[0], side='right')
+            i = lo + np.searchsorted(tag_index['tag_values'][lo:hi], tag[1])
+            found = i < hi and tag_index['tag_values'][i] == tag[1]
+
+        return rows[offsets[i]:offsets[i + 1]] if found else rows[:0]
+
+    def query(self, layer_name, all_of=None, any_of=None, none_of=None):
+        """
+        Query the features of a layer that match a combination of tags.
+
+        Each tag is given as a key (e.g. ``'amenity'``, which matches any value) or as a key and
+        a value (e.g. ``'amenity=hospital'`` or ``('amenity', 'hospital')``).
+
+        :param layer_name: name of a layer
+        :type layer_name: str
+        :param all_of: tags that a feature must all have, defaults to ``None``
+        :type all_of: list | None
+        :param any_of: tags of which a feature must have at least one, defaults to ``None``
+        :type any_of: list | None
+        :param none_of: tags that a feature must not have, defaults to ``None``
+        :type none_of: list | None
+        :return: sorted (row) indices of the features that match the tags
+        :rtype: numpy.ndarray
+
+        .. seealso::
+
+            - Examples for the class :class:`~pydriosm.reader.index.TagIndex`.
+        """
+
+        rows = None
+
+        for tag in all_of or []:
+            rows_ = self._get_rows(layer_name, tag)
+            rows = rows_ if rows is None else np.intersect1d(rows, rows_, assume_unique=True)
+
+        if any_of:
+            rows_ = np.unique(np.concatenate([self._get_rows(layer_name, x) for x in any_of]))
+            rows = rows_ if rows is None else np.intersect1d(rows, rows_, assume_unique=True)
+
+        if rows is None:  # Only with the tags to be excluded
+            rows = np.arange(self._get_index(layer_name)['length'], dtype=np.uint32)
+
+        for tag in none_of or []:
+            rows = np.setdiff1d(rows, self._get_rows(layer_name, tag), assume_unique=True)
+
+        return rows.astype(np.int64)
+
+    def get_features(self, layer_name, all_of=None, any_of=None, none_of=None, columns=None):
+        """
+        Get the features of a layer that match a combination of tags.
+
+        :param layer_name: name of a layer
+        :type layer_name: str
+        :param all_of: tags that a feature must all have, defaults to ``None``
+        :type all_of: list | None
+        :param any_of: tags of which a feature must have at least one, defaults to ``None``
+        :type any_of: list | None
+        :param none_of: tags that a feature must not have, defaults to ``None``
+        :type none_of: list | None
+        :param columns: names of the columns to be returned; if ``None`` (default), all columns
+        :type columns: list | None
+        :return: data of the features that match the tags, indexed by their (row) indices
+        :rtype: pandas.DataFrame
+
+        .. seealso::
+
+            - Examples for the method
+              :meth:`TagIndex.save()<pydriosm.reader.index.TagIndex.save>`.
+        """
+
+        rows = self.query(layer_name, all_of=all_of, any_of=any_of, none_of=none_of)
+
+        if isinstance(self.data, LayerStore):
+            features = self.data[layer_name].take(rows, columns=columns)
+        else:
+            if isinstance(self.data, LayerCache):
+                layer_data = self.data.load(layer_names=layer_name, columns=columns)[layer_name]
+            else:
+                layer_data = self.data[layer_name]
+                if columns is not None:
+                    layer_data = layer_data[[x for x in layer_data.columns if x in columns]]
+            features = layer_data.iloc[rows]
+
+        return features
+
+
+class SpatialIndex(_SavedIndex):
+    """
+    Query the features of parsed OSM data (of multiple layers) by their geometry objects.
+
+    For each layer, a `shapely.STRtree`_ is built (when the layer is queried for the first time)
+    over the bounding boxes of the geometry objects, and is reused by the subsequent queries,
+    which test the actual geometry objects only for the candidates found by the tree.
+    For data in a :class:`~pydriosm.reader.store.LayerStore` or
+    a :class:`~pydriosm.reader.cache.LayerCache`, the bounding boxes can be saved in the same
+    directory with the data, so that the tree is built without decoding all the geometry objects;
+    with a store, only the geometry objects of the candidates are decoded.
+
+    .. _`shapely.STRtree`:
+        https://shapely.readthedocs.io/en/stable/strtree.html
+
+    **Examples**::
+
+        >>> from pydriosm.reader import PBFReadParse, SpatialIndex
+        >>> from shapely.geometry import Point
+
+        >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+        >>> rutland_pbf = PBFReadParse.read_pbf(
+        ...     rutland_pbf_path, expand=True, parse_geometry=True, layer_names=['lines'])
+
+        >>> spatial_index = SpatialIndex(rutland_pbf)
+
+        >>> # Features whose bounding boxes intersect a bounding box
+        >>> rows = spatial_index.query('lines', (-0.74, 52.66, -0.72, 52.68))
+        >>> len(rows)
+        825
+
+        >>> # Features that intersect a geometry object
+        >>> oakham = Point(-0.7278, 52.6703).buffer(0.002)
+        >>> rows = spatial_index.query('lines', oakham, predicate='intersects')
+        >>> len(rows)
+        83
+
+        >>> # Three features that are nearest to a point
+        >>> rows, distances = spatial_index.nearest(
+        ...     'lines', Point(-0.7278, 52.6703), k=3, return_distance=True)
+        >>> rutland_pbf['lines'].loc[rows, 'name'].tolist()
+        [None, 'Market Place', None]
+    """
+
+    #: str: Name of the directory (in the directory of a store or cache) of saved indexes.
+    DIRNAME = "spatial_index"
+
+    def __init__(self, data):
+        super().__init__(data=data)
+
+        self._geometry = {}
+        self._tree = {}
+
+    def _get_geometry(self, layer_name, rows=None):
+        """
+        Get (the specified rows of) the geometry objects of a layer.
+
+        :return: geometry objects
+        :rtype: numpy.ndarray
+        """
+
+        if isinstance(self.data, LayerStore) and rows is not None:  # Decode only the given rows
+            stored_layer = self.data[layer_name]
+            geom_col = stored_layer.meta['geometry_column'] or 'geometry'
+            return stored_layer.take(rows, columns=[geom_col])[geom_col].to_numpy()
+
+        if layer_name not in self._geometry:
+            if isinstance(self.data, LayerStore):
+                stored_layer = self.data[layer_name]
+                geometry = stored_layer.column(stored_layer.meta['geometry_column'] or 'geometry')
+            elif isinstance(self.data, LayerCache):
+                geometry = self.data.load(layer_names=layer_name, columns=['geometry'])
+                geometry = geometry[layer_name]['geometry']
+            else:
+                geometry = self.data[layer_name]['geometry']
+
+            if isinstance(geometry.array, QuantizedGeometryArray):
+                geometry = geometry.array.to_geometry()
+            geometry = np.array([  # e.g. GeoJSON-like dicts when the geometry is not parsed
+                shapely.geometry.shape(x) if isinstance(x, dict) else x for x in geometry],
+                dtype=object)
+            geometry[pd.isna(geometry)] = None
+
+            self._geometry[layer_name] = geometry
+
+        geometry = self._geometry[layer_name]
+
+        return geometry if rows is None else geometry[rows]
+
+    def _build(self, layer_name):
+        return {'bounds': shapely.bounds(self._get_geometry(layer_name))}
+
+    def save(self, layer_names=None):
+        """
+        Save the bounding boxes of the geometry objects of layers in the directory of
+        the store or cache of the data.
+
+        :param layer_names: name of a layer, or names of multiple layers;
+            if ``None`` (default), all layers
+        :type layer_names: str | list | None
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse, LayerStore, SpatialIndex
+            >>> from pyhelpers.dirs import delete_dir
+
+            >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+            >>> rutland_pbf = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_geometry=True, layer_names=['lines'])
+
+            >>> layer_store = LayerStore("tests\\data\\rutland\\rutland-latest-pbf.store")
+            >>> layer_store.save(rutland_pbf)
+
+            >>> SpatialIndex(layer_store).save()  # The tree is then built from the saved boxes
+
+            >>> spatial_index = SpatialIndex(layer_store)
+            >>> len(spatial_index.query('lines', (-0.74, 52.66, -0.72, 52.68)))
+            825
+
+            >>> # Delete the store
+            >>> delete_dir(layer_store.store_dir, confirmation_required=False)
+        """
+
+        super().save(layer_names=layer_names)
+
+    def get_tree(self, layer_name):
+        """
+        Get the tree of the bounding boxes of the geometry objects of a layer.
+
+        :param layer_name: name of a layer
+        :type layer_name: str
+        :return: tree of the bounding boxes, in which the index of a box is the (row) index of
+            the feature
+        :rtype: shapely.STRtree
+        """
+
+        if layer_name not in self._tree:
+            bounds = self._get_index(layer_name)['bounds']
+
+            boxes = np.full(len(bounds), None, dtype=object)
+            is_valid = ~np.isnan(bounds).any(axis=1)  # Excluding missing and empty geometries
+            boxes[is_valid] = shapely.box(*bounds[is_valid].T)
+
+            self._tree[layer_name] = shapely.STRtree(boxes)
+
+        return self._tree[layer_name]
+
+    def _refine(self, layer_name, rows, geometry, predicate, distance=None):
+        rows = np.sort(rows)
+        geometry_ = self._get_geometry(layer_name, rows)
+
+        if predicate == 'dwithin':
+            is_matched = shapely.dwithin(geometry, geometry_, distance)
+        else:
+            is_matched = getattr(shapely, predicate)(geometry, geometry_)
+
+        return rows[is_matched]
+
+    def query(self, layer_name, geometry, predicate=None, distance=None):
+        """
+        Query the features of a layer by a geometry object or a bounding box.
+
+        :param layer_name: name of a layer
+        :type layer_name: str
+        :param geometry: a geometry object, or a bounding box in the form of
+            ``(min_x, min_y, max_x, max_y)``
+        :type geometry: shapely.geometry.base.BaseGeometry | tuple | list
+        :param predicate: name of a binary predicate, e.g. ``'intersects'`` or ``'contains'``,
+            with which features are tested as ``predicate(geometry, feature_geometry)``
+            (see `shapely.STRtree.query()`_); when ``predicate=None`` (default),
+            the features whose bounding boxes intersect that of ``geometry`` are returned
+        :type predicate: str | None
+        :param distance: distance for the predicate ``'dwithin'``, defaults to ``None``
+        :type distance: float | None
+        :return: sorted (row) indices of the features
+        :rtype: numpy.ndarray
+
+        .. _`shapely.STRtree.query()`:
+            https://shapely.readthedocs.io/en/stable/strtree.html#shapely.STRtree.query
+
+        .. seealso::
+
+            - Examples for the class :class:`~pydriosm.reader.index.SpatialIndex`.
+        """
+
+        if isinstance(geometry, (tuple, list)):
+            geometry = shapely.box(*geometry)
+
+        tree = self.get_tree(layer_name)
+
+        if predicate == 'dwithin':  # The boxes of the features within the distance
+            rows = tree.query(geometry, predicate='dwithin', distance=distance)
+        else:
+            rows = tree.query(geometry)
+
+        if predicate is None:
+            rows = np.sort(rows)
+        else:
+            rows = self._refine(layer_name, rows, geometry, predicate, distance=distance)
+
+        return rows.astype(np.int64)
+
+    def nearest(self, layer_name, geometry, k=1, return_distance=False):
+        """
+        Find the features of a layer that are nearest to a geometry object.
+
+        :param layer_name: name of a layer
+        :type layer_name: str
+        :param geometry: a geometry object
+        :type geometry: shapely.geometry.base.BaseGeometry
+        :param k: (maximum) number of the features to be found, defaults to ``1``
+        :type k: int
+        :param return_distance: whether to return the distances as well, defaults to ``False``
+        :type return_distance: bool
+        :return: (row) indices of the nearest features, in ascending order of the distances
+            (and the distances if ``return_distance=True``); empty if the layer has no geometry
+        :rtype: numpy.ndarray | tuple
+
+        .. seealso::
+
+            - Examples for the class :class:`~pydriosm.reader.index.SpatialIndex`.
+        """
+
+        tree = self.get_tree(layer_name)
+        n_valid = int(np.sum(~np.isnan(self._get_index(layer_name)['bounds']).any(axis=1)))
+
+        # The distance to a box is no greater than that to the geometry object within it,
+        # so all the features within a distance are among the boxes within the distance
+        rows = tree.query_nearest(geometry, all_matches=True)
+        if n_valid == 0 or len(rows) == 0:  # e.g. a layer without any (non-empty) geometry
+            rows, distances = np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+            return (rows, distances) if return_distance else rows
+
+        radius = np.min(shapely.distance(geometry, self._get_geometry(layer_name, np.sort(rows))))
+        if radius == 0:
+            min_x, min_y, max_x, max_y = shapely.total_bounds(tree.geometries)
+            radius = max(max_x - min_x, max_y - min_y, 1.0) / max(n_valid, 1)
+
+        while True:
+            rows = np.sort(tree.query(geometry, predicate='dwithin', distance=radius))
+            distances = shapely.distance(geometry, self._get_geometry(layer_name, rows))
+            if np.sum(distances <= radius) >= k or len(rows) >= n_valid:
+                break
+            radius *= 2
+
+        order = np.argsort(distances, kind='stable')[:k]
+        rows, distances = rows[order].astype(np.int64), distances[order]
+
+        return (rows, distances) if return_distance else rows
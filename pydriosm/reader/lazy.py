@@ -0,0 +1,116 @@
+"""
+Access OSM data of multiple layers, each of which is read only when it is requested.
+"""
+
+import collections.abc
+
+
+class LazyLayers(collections.abc.Mapping):
+    """
+    A read-only mapping of layer names to layer data, where the data of a layer is read
+    (i.e. parsed or loaded) only when it is accessed for the first time and is kept until
+    it is released.
+
+    It behaves like the dictionary returned by a reader, e.g. with ``keys()``, ``[]`` and
+    ``items()``, while iterating through ``items()`` or ``values()`` reads every layer.
+
+    **Examples**::
+
+        >>> from pydriosm.reader import GeofabrikReader
+
+        >>> gfr = GeofabrikReader()
+
+        >>> subrgn_name = 'rutland'
+        >>> dat_dir = "tests\\osm_data"
+
+        >>> rutland_pbf = gfr.read_osm_pbf(
+        ...     subrgn_name, data_dir=dat_dir, readable=True, lazy=True, verbose=True)
+        Downloading "rutland-latest.osm.pbf"
+            to "tests\\osm_data\\rutland\\" ... Done.
+        >>> list(rutland_pbf.keys())
+        ['points', 'lines', 'multilinestrings', 'multipolygons', 'other_relations']
+        >>> rutland_pbf.loaded_layer_names
+        []
+
+        >>> rutland_pbf_lines = rutland_pbf['lines']  # Only the layer 'lines' is parsed
+        >>> rutland_pbf.loaded_layer_names
+        ['lines']
+
+        >>> rutland_pbf.release('lines')
+        >>> rutland_pbf.loaded_layer_names
+        []
+    """
+
+    def __init__(self, layer_names, read_layer):
+        """
+        :param layer_names: names of the layers that are available
+        :type layer_names: list
+        :param read_layer: function that takes a layer name and returns the data of the layer
+        :type read_layer: typing.Callable
+
+        :ivar list layer_names: names of the layers that are available
+        """
+
+        self.layer_names = list(layer_names)
+
+        self._read_layer = read_layer
+        self._layers = {}
+
+    def __getitem__(self, layer_name):
+        if layer_name not in self._layers:
+            if layer_name not in self.layer_names:
+                raise KeyError(layer_name)
+
+            self._layers[layer_name] = self._read_layer(layer_name)
+
+        return self._layers[layer_name]
+
+    def __contains__(self, layer_name):  # without reading the layer
+        return layer_name in self.layer_names
+
+    def __iter__(self):
+        return iter(self.layer_names)
+
+    def __len__(self):
+        return len(self.layer_names)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.layer_names}, loaded={self.loaded_layer_names})"
+
+    @property
+    def loaded_layer_names(self):
+        """
+        Names of the layers whose data has been read and is kept in memory.
+
+        :return: names of the loaded layers
+        :rtype: list
+        """
+
+        return [x for x in self.layer_names if x in self._layers]
+
+    def release(self, layer_names=None):
+        """
+        Release the data of layers that has been read, which would be read again when requested.
+
+        :param layer_names: name of a layer, or names of multiple layers;
+            if ``None`` (default), all loaded layers
+        :type layer_names: str | list | None
+        """
+
+        if layer_names is None:
+            self._layers.clear()
+
+        else:
+            layer_names_ = [layer_names] if isinstance(layer_names, str) else layer_names
+            for layer_name in layer_names_:
+                self._layers.pop(layer_name, None)
+
+    def to_dict(self):
+        """
+        Read all the layers into an (ordered) dictionary.
+
+        :return: data of all layers, with keys and values being layer names and layer data
+        :rtype: collections.OrderedDict
+        """
+
+        return collections.OrderedDict((k, self[k]) for k in self.layer_names)
@@ -2,17 +2,26 @@
 Parsing the OSM data extracts of various file formats.
 """
 
+import array
 import collections
+import contextlib
 import copy
+import datetime
+import functools
 import glob
+import io
 import itertools
 import lzma
 import multiprocessing
 import os
 import re
 import shutil
+import struct
+import sys
+import tempfile
 import zipfile
 
+import numpy as np
 import pandas as pd
 import shapefile as pyshp
 import shapely.geometry
@@ -22,8 +31,33 @@ from pyhelpers.ops import split_list
 from pyhelpers.settings import gdal_configurations
 from pyhelpers.text import find_similar_str
 
+from pydriosm.reader.quantized import QuantizedGeometryArray
 from pydriosm.reader.transformer import Transformer
-from pydriosm.utils import check_json_engine, check_relpath
+from pydriosm.utils import check_json_engine, check_relpath, drop_duplicate_ids, \
+    get_available_memory, sort_layer_data
+
+
+def _validate_spatial_filter(bbox, mask):
+    """
+    Combine a bounding box and a mask into a single spatial filter.
+
+    :param bbox: bounding box ``(min_x, min_y, max_x, max_y)``, or ``None``
+    :type bbox: tuple | list | None
+    :param mask: geometry within which features are selected, or ``None``
+    :type mask: shapely.geometry.base.BaseGeometry | None
+    :return: validated bounding box and mask, at most one of which is not ``None``
+    :rtype: tuple
+    """
+
+    if bbox is not None:
+        bbox = tuple(map(float, bbox))
+        if len(bbox) != 4:
+            raise ValueError("`bbox` must be given as (min_x, min_y, max_x, max_y).")
+
+        if mask is not None:
+            mask, bbox = mask.intersection(shapely.geometry.box(*bbox)), None
+
+    return bbox, mask
 
 
 class SHPReadParse:
@@ -118,6 +152,10 @@ class SHPReadParse:
         'waterways',
     }
 
+    #: int: Maximum size (in bytes) of a file in a .shp.zip file that is read into memory when
+    #: the shapefiles are read without being extracted; a larger file is streamed from the archive.
+    MAX_BUFFERED_MEMBER_SIZE = 64 * 1024 ** 2
+
     #: Name of the vector driver for writing shapefile data;
     #: see also the parameter ``driver`` of
     #: `geopandas.GeoDataFrame.to_file()
@@ -431,6 +469,511 @@ class SHPReadParse:
         if ret_extract_dir:
             return extract_dir
 
+    @classmethod
+    def find_shp_zip_members(cls, shp_zip_pathname, layer_names=None):
+        """
+        Find the shapefiles (.shp) of layers in a zipped shapefile without extracting it.
+
+        :param shp_zip_pathname: path to a zipped shapefile data (.shp.zip)
+        :type shp_zip_pathname: str | os.PathLike[str]
+        :param layer_names: name of a .shp layer, e.g. 'railways', or names of multiple layers;
+            when ``layer_names=None`` (default), all available layers
+        :type layer_names: str | list | None
+        :return: names of the layers and the names of their .shp files in the archive
+        :rtype: collections.OrderedDict
+
+        **Examples**::
+
+            >>> from pydriosm.reader import SHPReadParse
+
+            >>> path_to_shp_zip = "tests\\data\\rutland\\rutland-latest-free.shp.zip"
+
+            >>> shp_members = SHPReadParse.find_shp_zip_members(path_to_shp_zip, 'transport')
+            >>> shp_members
+            OrderedDict([('transport',
+                          ['gis_osm_transport_a_free_1.shp', 'gis_osm_transport_free_1.shp'])])
+
+            >>> shp_members = SHPReadParse.find_shp_zip_members(path_to_shp_zip)
+            >>> list(shp_members.keys())
+            ['buildings',
+             'landuse',
+             'natural',
+             'places',
+             'pofw',
+             'pois',
+             'railways',
+             'roads',
+             'traffic',
+             'transport',
+             'water',
+             'waterways']
+        """
+
+        with zipfile.ZipFile(file=shp_zip_pathname, mode='r') as sz:
+            shp_filenames = sorted(f.filename for f in sz.filelist if f.filename.endswith(".shp"))
+
+        shp_members = collections.defaultdict(list)
+        for shp_filename in shp_filenames:
+            filename = os.path.basename(shp_filename)  # e.g. ".../shape/railways.shp" of BBBike
+            layer_name = cls.find_shp_layer_name(filename) or os.path.splitext(filename)[0]
+            shp_members[layer_name].append(shp_filename)
+
+        if layer_names:
+            layer_names_ = cls.validate_shp_layer_names(layer_names)
+        else:
+            layer_names_ = sorted(shp_members.keys())
+
+        shp_members = collections.OrderedDict((x, shp_members.get(x, [])) for x in layer_names_)
+
+        return shp_members
+
+    @classmethod
+    @contextlib.contextmanager
+    def _open_shp_files(cls, shp_pathname, shp_zip_pathname=None):
+        """
+        Open the .shp, .shx and .dbf files of a shapefile, from a zipped shapefile if specified.
+
+        :return: the opened files (in binary mode) keyed by their extensions
+        :rtype: dict
+        """
+
+        shp_basename = os.path.splitext(shp_pathname)[0]
+
+        with contextlib.ExitStack() as stack:
+            shp_files = {}
+
+            if shp_zip_pathname is None:
+                for ext in ['shp', 'shx', 'dbf']:
+                    if os.path.isfile(f"{shp_basename}.{ext}"):
+                        shp_files[ext] = stack.enter_context(open(f"{shp_basename}.{ext}", 'rb'))
+
+            else:
+                with zipfile.ZipFile(file=shp_zip_pathname, mode='r') as sz:
+                    members = {x.filename: x for x in sz.filelist}
+                    for ext in ['shp', 'shx', 'dbf']:
+                        member = members.get(f"{shp_basename}.{ext}")
+                        if member is None:
+                            continue
+                        if member.file_size <= cls.MAX_BUFFERED_MEMBER_SIZE:
+                            shp_files[ext] = io.BytesIO(sz.read(member))
+                        else:  # The archive remains open until the member is closed
+                            shp_files[ext] = stack.enter_context(sz.open(member))
+
+            yield shp_files
+
+    @classmethod
+    @contextlib.contextmanager
+    def _open_shp(cls, shp_pathname, shp_zip_pathname=None, **kwargs):
+        """
+        Open a shapefile with `shapefile.reader()`_, from a zipped shapefile if specified.
+
+        :return: a reader of the shapefile
+        :rtype: shapefile.Reader
+
+        .. _`shapefile.reader()`: https://github.com/GeospatialPython/pyshp#reading-shapefiles
+        """
+
+        if shp_zip_pathname is None:
+            with pyshp.Reader(shp_pathname, **kwargs) as f:
+                yield f
+
+        else:
+            with cls._open_shp_files(shp_pathname, shp_zip_pathname) as shp_files:
+                with pyshp.Reader(**shp_files, **kwargs) as f:
+                    yield f
+
+    @staticmethod
+    def _find_feat_col_name(field_names):
+        """
+        Find the name of the field of feature names (i.e. ``'fclass'`` or ``'type'``).
+
+        :param field_names: names of the fields of a shapefile
+        :type field_names: list
+        :return: name of the field of feature names
+        :rtype: str
+        """
+
+        feat_col_names = [x for x in field_names if x in {'type', 'fclass'}]
+        if len(feat_col_names) == 0:
+            raise ValueError("The shapefile has no field of feature names ('fclass' or 'type').")
+
+        return feat_col_names[0]
+
+    @classmethod
+    def _read_feat_col(cls, shp_pathname, shp_zip_pathname=None, **kwargs):
+        """
+        Read only the field of feature names (i.e. ``'fclass'`` or ``'type'``) of a shapefile.
+
+        :param shp_pathname: pathname of a shape format file (.shp), or
+            (when ``shp_zip_pathname`` is specified) its name in a zipped shapefile
+        :type shp_pathname: str
+        :param shp_zip_pathname: path to a zipped shapefile data (.shp.zip), defaults to ``None``
+        :type shp_zip_pathname: str | None
+        :param kwargs: [optional] parameters of the function `shapefile.reader()`_
+        :return: name of the field, and indices and feature names of the (undeleted) records
+        :rtype: tuple
+
+        .. _`shapefile.reader()`: https://github.com/GeospatialPython/pyshp#reading-shapefiles
+        """
+
+        with cls._open_shp(shp_pathname, shp_zip_pathname=shp_zip_pathname, **kwargs) as f:
+            feat_col_name = cls._find_feat_col_name([field[0] for field in f.fields[1:]])
+            feat_records = [(r.oid, r[0]) for r in f.iterRecords(fields=[feat_col_name])]
+
+        oids, feat_values = [x[0] for x in feat_records], [x[1] for x in feat_records]
+
+        return feat_col_name, oids, feat_values
+
+    @staticmethod
+    def _gather(buffer, offsets, dtype):
+        """
+        Read the values of a fixed-size type at arbitrary (unaligned) byte offsets of a buffer.
+
+        :param buffer: raw bytes of a file
+        :type buffer: bytes
+        :param offsets: byte offsets at which the values start
+        :type offsets: numpy.ndarray
+        :param dtype: data type of the values, e.g. ``'<i4'``
+        :type dtype: str
+        :return: values at the offsets
+        :rtype: numpy.ndarray
+        """
+
+        dtype = np.dtype(dtype)
+        values = np.empty(len(offsets), dtype=dtype)
+
+        # Values of each alignment are read from a view of the buffer starting at that alignment
+        alignments = offsets % dtype.itemsize
+        for alignment in np.unique(alignments):
+            view = np.frombuffer(
+                buffer, dtype=dtype, offset=alignment,
+                count=(len(buffer) - alignment) // dtype.itemsize)
+            selected = alignments == alignment
+            values[selected] = view[(offsets[selected] - alignment) // dtype.itemsize]
+
+        return values
+
+    @classmethod
+    def _parse_shp_shapes(cls, shp, shx, record_index=None):
+        """
+        Parse all (or the specified) shapes of a shapefile in bulk.
+
+        :param shp: raw bytes of the shape format file (.shp)
+        :type shp: bytes
+        :param shx: raw bytes of the shape index file (.shx)
+        :type shx: bytes
+        :param record_index: indices of the shapes to be parsed, defaults to ``None``;
+            when ``record_index=None``, all the shapes are parsed
+        :type record_index: numpy.ndarray | None
+        :return: shape types and bounding boxes of the shapes, coordinates of all their points,
+            and offsets of the points of each shape in the coordinates
+        :rtype: tuple
+
+        .. note::
+
+            Only the shape types of OSM shapefiles (i.e. null shapes, points, polylines,
+            polygons and multipoints) are supported.
+        """
+
+        # Each index record is (offset, content length) of a shape, in 16-bit words (big-endian)
+        record_offsets = np.frombuffer(shx, dtype='>i4', offset=100)[::2].astype(np.int64) * 2
+        if record_index is not None:
+            record_offsets = record_offsets[record_index]
+
+        shape_types = cls._gather(shp, record_offsets + 8, '<i4')
+        unsupported_types = set(np.unique(shape_types).tolist()) - {0, 1, 3, 5, 8}
+        if unsupported_types:
+            raise NotImplementedError(
+                f"Shape type(s) {sorted(unsupported_types)} cannot be parsed in bulk.")
+
+        is_point, is_multipoint = shape_types == 1, shape_types == 8
+        has_parts = (shape_types == 3) | (shape_types == 5)
+        has_bbox = has_parts | is_multipoint
+
+        # Numbers of parts and points, and the offsets of the first points
+        number_of_parts = np.zeros(len(shape_types), dtype=np.int64)
+        number_of_parts[has_parts] = cls._gather(shp, record_offsets[has_parts] + 44, '<i4')
+
+        number_of_points = is_point.astype(np.int64)
+        number_of_points[has_parts] = cls._gather(shp, record_offsets[has_parts] + 48, '<i4')
+        number_of_points[is_multipoint] = cls._gather(
+            shp, record_offsets[is_multipoint] + 44, '<i4')
+
+        point_offsets = record_offsets + 12
+        point_offsets[has_parts] += 40 + 4 * number_of_parts[has_parts]
+        point_offsets[is_multipoint] += 36
+
+        # Coordinates of all the points
+        coords_offsets = np.zeros(len(shape_types) + 1, dtype=np.int64)
+        np.cumsum(number_of_points, out=coords_offsets[1:])
+
+        xy_offsets = np.repeat(point_offsets - 16 * coords_offsets[:-1], number_of_points)
+        xy_offsets += 16 * np.arange(coords_offsets[-1], dtype=np.int64)
+        coordinates = np.column_stack(
+            [cls._gather(shp, xy_offsets, '<f8'), cls._gather(shp, xy_offsets + 8, '<f8')])
+
+        # Bounding boxes (that of a point is the point itself)
+        bboxes = np.full((len(shape_types), 4), np.nan)
+        bbox_offsets = record_offsets[has_bbox] + 12
+        for i in range(4):
+            bboxes[has_bbox, i] = cls._gather(shp, bbox_offsets + 8 * i, '<f8')
+        bboxes[is_point] = np.tile(coordinates[coords_offsets[:-1][is_point]], 2)
+
+        return shape_types, bboxes, coordinates, coords_offsets
+
+    @classmethod
+    def _parse_dbf_records(cls, dbf, encoding='utf-8', encoding_errors='strict',
+                           feature_names=None):
+        """
+        Parse the (undeleted) records of a dBASE file (.dbf) field by field.
+
+        :param dbf: raw bytes of the dBASE file
+        :type dbf: bytes
+        :param encoding: encoding of the text fields, defaults to ``'utf-8'``
+        :type encoding: str
+        :param encoding_errors: error handling scheme for decoding the text fields,
+            defaults to ``'strict'``
+        :type encoding_errors: str
+        :param feature_names: names of the features whose records are parsed, defaults to ``None``;
+            when ``feature_names=None``, the records of all features are parsed
+        :type feature_names: list | None
+        :return: data of the records, and their indices in the file
+        :rtype: tuple
+        """
+
+        number_of_records, header_length, record_length = struct.unpack("<4xLHH", dbf[:12])
+
+        fields, field_start = [], 1  # The first byte of each record is the deletion flag
+        for i in range(32, 32 * ((header_length - 33) // 32 + 1), 32):
+            name, field_type, size, decimal = struct.unpack("<11sc4xBB14x", dbf[i:i + 32])
+            name = name.split(b'\x00')[0].decode(encoding, encoding_errors).lstrip()
+            fields.append((name, field_type.decode('ascii'), field_start, size, decimal))
+            field_start += size
+
+        records = np.frombuffer(
+            dbf, dtype=np.uint8, count=number_of_records * record_length, offset=header_length,
+        ).reshape(number_of_records, record_length)
+        record_index = np.flatnonzero(records[:, 0] == ord(' '))  # Records that are not deleted
+
+        if feature_names is not None:  # Scan only the field of feature names for the records
+            feat_col_name = cls._find_feat_col_name([x[0] for x in fields])
+            _, _, field_start, size, _ = next(x for x in fields if x[0] == feat_col_name)
+            feat_values = records[record_index, field_start:field_start + size]
+            feat_values = np.char.strip(feat_values.copy().view(f'S{size}')[:, 0])
+            record_index = record_index[np.isin(
+                feat_values, [x.encode(encoding, encoding_errors) for x in feature_names])]
+
+        if len(record_index) < number_of_records:
+            records = records[record_index]
+
+        record_data = {}
+        for name, field_type, field_start, size, decimal in fields:
+            # Fixed-width values of the field in all the records (trailing nulls are dropped)
+            values = records[:, field_start:field_start + size].copy().view(f'S{size}')[:, 0]
+
+            if field_type in {'N', 'F'}:
+                values = np.char.strip(np.char.replace(values, b'*', b''))
+                is_null = values == b''
+
+                try:
+                    if is_null.all():
+                        column = np.full(len(values), None, dtype=object)
+                    elif decimal or is_null.any():  # Missing integers are NaN, as in pandas
+                        column = np.where(is_null, b'nan', values).astype(np.float64)
+                    else:
+                        column = values.astype(np.int64)
+
+                except ValueError:  # Leave any irregular values to pyshp-like parsing
+                    column = pd.Series([
+                        cls._parse_dbf_number(x, decimal) for x in values.tolist()]).to_numpy()
+
+            elif field_type in {'D', 'L'}:
+                column = np.array(
+                    [cls._parse_dbf_value(x, field_type) for x in values.tolist()], dtype=object)
+
+            else:
+                column = np.array(
+                    [x.decode(encoding, encoding_errors).strip() for x in values.tolist()],
+                    dtype=object)
+
+            record_data[name] = column
+
+        record_data = pd.DataFrame(record_data, columns=[x[0] for x in fields])
+
+        return record_data, record_index
+
+    @staticmethod
+    def _parse_dbf_number(value, decimal):
+        """
+        Parse a numeric value of a dBASE file in the same way as `shapefile.reader()`_ does.
+
+        .. _`shapefile.reader()`: https://github.com/GeospatialPython/pyshp#reading-shapefiles
+        """
+
+        try:
+            return float(value) if decimal else int(value)
+        except ValueError:
+            try:
+                return None if decimal else int(float(value))
+            except ValueError:
+                return None
+
+    @staticmethod
+    def _parse_dbf_value(value, field_type):
+        """
+        Parse a date or logical value of a dBASE file in the same way as `shapefile.reader()`_ does.
+
+        .. _`shapefile.reader()`: https://github.com/GeospatialPython/pyshp#reading-shapefiles
+        """
+
+        if field_type == 'D':
+            if not value.replace(b'\x00', b'').replace(b' ', b'').replace(b'0', b''):
+                return None
+            try:
+                return datetime.date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+            except ValueError:
+                return value.decode().strip()
+
+        if value in {b'Y', b'y', b'T', b't', b'1'}:
+            return True
+        elif value in {b'N', b'n', b'F', b'f', b'0'}:
+            return False
+        return None
+
+    @classmethod
+    def _make_shapes(cls, shape_types, coordinates, coords_offsets):
+        """
+        Make ``shapely.geometry`` objects from the parsed shapes in bulk.
+
+        :return: geometry objects of the shapes
+        :rtype: numpy.ndarray
+        """
+
+        geometry = np.full(len(shape_types), None, dtype=object)
+        shape_index = np.repeat(np.arange(len(shape_types)), np.diff(coords_offsets))
+
+        for shape_type in np.unique(shape_types):
+            if shape_type == 0:
+                continue
+            selected = shape_types == shape_type
+            point_selected = selected[shape_index]
+            coords, indices = coordinates[point_selected], shape_index[point_selected]
+            _, indices = np.unique(indices, return_inverse=True)
+
+            if shape_type == 1:
+                geometry[selected] = shapely.points(coords)
+            elif shape_type == 3:
+                geometry[selected] = shapely.linestrings(coords, indices=indices)
+            elif shape_type == 5:
+                geometry[selected] = shapely.polygons(shapely.linearrings(coords, indices=indices))
+            else:
+                geometry[selected] = shapely.multipoints(coords, indices=indices)
+
+        return geometry
+
+    @classmethod
+    def _read_shp_numpy(cls, shp_pathname, emulate_gpd=False, bbox=None, mask=None,
+                        shp_zip_pathname=None, feature_names=None, encoding='utf-8',
+                        encodingErrors='strict'):
+        """
+        Read a shapefile by parsing its files in bulk with NumPy.
+
+        See :meth:`SHPReadParse.read_shp()<pydriosm.reader.SHPReadParse.read_shp>`
+        (with ``engine='numpy'``) for the parameters.
+
+        :return: data frame of the shapefile data
+        :rtype: pandas.DataFrame
+        """
+
+        with cls._open_shp_files(shp_pathname, shp_zip_pathname=shp_zip_pathname) as shp_files:
+            shp, shx, dbf = (shp_files[ext].read() for ext in ['shp', 'shx', 'dbf'])
+
+        shp_data, record_index = cls._parse_dbf_records(
+            dbf, encoding, encoding_errors=encodingErrors, feature_names=feature_names)
+        shape_types, bboxes, coordinates, coords_offsets = cls._parse_shp_shapes(
+            shp=shp, shx=shx, record_index=record_index)
+
+        selected = np.ones(len(record_index), dtype=bool)
+
+        if bbox is not None or mask is not None:  # Skip the records whose bounding boxes are out
+            min_x, min_y, max_x, max_y = mask.bounds if bbox is None else bbox
+            selected &= (shape_types == 0) | (
+                (bboxes[:, 0] <= max_x) & (bboxes[:, 2] >= min_x) &
+                (bboxes[:, 1] <= max_y) & (bboxes[:, 3] >= min_y))
+
+        def _select(shp_data_, shape_types_, coordinates_, coords_offsets_, selected_):
+            number_of_points = np.diff(coords_offsets_)[selected_]
+            return (
+                shp_data_[selected_].reset_index(drop=True), shape_types_[selected_],
+                coordinates_[np.repeat(selected_, np.diff(coords_offsets_))],
+                np.concatenate([[0], np.cumsum(number_of_points)]))
+
+        if not selected.all():
+            shp_data, shape_types, coordinates, coords_offsets = _select(
+                shp_data, shape_types, coordinates, coords_offsets, selected)
+
+        if emulate_gpd or mask is not None:
+            geometry = cls._make_shapes(shape_types, coordinates, coords_offsets)
+
+            if mask is not None:
+                within_mask = shapely.intersects(geometry, mask)
+                shp_data, shape_types, coordinates, coords_offsets = _select(
+                    shp_data, shape_types, coordinates, coords_offsets, within_mask)
+                geometry = geometry[within_mask]
+
+        if emulate_gpd:
+            shp_data['geometry'] = pd.Series(geometry, index=shp_data.index)
+
+        else:  # The same coordinates as those parsed by pyshp
+            points = list(zip(*coordinates.T.tolist()))
+            shp_data['coordinates'] = [
+                [array.array('d', points[i])] if shape_type == 1 else points[i:j]
+                for i, j, shape_type in zip(
+                    coords_offsets[:-1].tolist(), coords_offsets[1:].tolist(),
+                    shape_types.tolist())]
+            shp_data['shape_type'] = shape_types.astype(np.int64)
+
+        if not selected.any():  # As is a data frame created from no records
+            shp_data = shp_data.astype(object)
+
+        return shp_data
+
+    @classmethod
+    def _read_shp_pyogrio(cls, shp_pathname, bbox=None, mask=None, shp_zip_pathname=None,
+                          **kwargs):
+        """
+        Read a shapefile in columnar batches with `pyogrio.read_arrow()`_.
+
+        See :meth:`SHPReadParse.read_shp()<pydriosm.reader.SHPReadParse.read_shp>`
+        (with ``engine='pyogrio'``) for the parameters.
+
+        :return: data frame of the shapefile data
+        :rtype: pandas.DataFrame
+
+        .. _`pyogrio.read_arrow()`: https://pyogrio.readthedocs.io/en/latest/api.html
+        """
+
+        pyogrio = _check_dependency(name='pyogrio')
+
+        if shp_zip_pathname is not None:
+            shp_pathname = f"/vsizip/{os.path.abspath(shp_zip_pathname)}/{shp_pathname}"
+
+        # Selection of columns (and features) is done by the driver
+        shp_meta, shp_table = pyogrio.read_arrow(shp_pathname, bbox=bbox, mask=mask, **kwargs)
+
+        geom_col_name = shp_meta['geometry_name'] or 'wkb_geometry'
+        if geom_col_name in shp_table.column_names:
+            geometry = shapely.from_wkb(shp_table.column(geom_col_name).to_numpy())
+            shp_table = shp_table.drop_columns(geom_col_name)
+        else:  # e.g. read_geometry=False
+            geometry = None
+
+        shp_data = shp_table.to_pandas()
+        if geometry is not None:
+            shp_data['geometry'] = pd.Series(geometry, index=shp_data.index, dtype=object)
+
+        return shp_data
+
     @classmethod
     def _covert_to_geometry(cls, x):
         """Convert the ``(shape_type, coordinates)`` of a feature to a ``shapely.geometry`` object.
@@ -468,34 +1011,85 @@ class SHPReadParse:
 
         return coordinates, shape_type
 
+    @staticmethod
+    def _point_in_bbox(shape, bbox):
+        """
+        Check whether a point shape (read by `PyShp`_) is within a bounding box.
+
+        :param shape: shape of a record of a shapefile
+        :type shape: shapefile.Shape
+        :param bbox: bounding box ``(min_x, min_y, max_x, max_y)``
+        :type bbox: tuple | list
+        :return: whether the shape is within the bounding box, or ``True`` if it is not a point
+        :rtype: bool
+
+        .. _`PyShp`: https://github.com/GeospatialPython/pyshp
+        """
+
+        if shape.shapeType in {pyshp.POINT, pyshp.POINTM, pyshp.POINTZ} and shape.points:
+            x, y = shape.points[0][:2]
+            return bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]
+
+        return True
+
     @classmethod
-    def read_shp(cls, shp_pathname, engine='pyshp', emulate_gpd=False, **kwargs):
+    def read_shp(cls, shp_pathname, engine='pyshp', emulate_gpd=False, bbox=None, mask=None,
+                 shp_zip_pathname=None, feature_names=None, **kwargs):
         """
         Read a shapefile.
 
-        :param shp_pathname: pathname of a shape format file (.shp)
+        :param shp_pathname: pathname of a shape format file (.shp), or
+            (when ``shp_zip_pathname`` is specified) its name in a zipped shapefile
         :type shp_pathname: str
         :param engine: method used to read shapefiles;
-            options include: ``'pyshp'`` (default) and ``'geopandas'`` (or ``'gpd'``)
+            options include: ``'pyshp'`` (default), ``'numpy'``, ``'pyogrio'``
+            and ``'geopandas'`` (or ``'gpd'``)
             this function by default relies on `shapefile.reader()`_;
+            when ``engine='numpy'``, the .shp, .shx and .dbf files are parsed in bulk with NumPy,
+            producing the same data as ``engine='pyshp'`` does (but much faster for large layers);
+            when ``engine='pyogrio'``, it relies on `pyogrio.read_arrow()`_,
+            producing the same data as ``engine='geopandas'`` does, but in a pandas.DataFrame;
             when ``engine='geopandas'`` (or ``engine='gpd'``),
             it relies on `geopandas.read_file()`_;
         :type engine: str
         :param emulate_gpd: whether to emulate the data format produced by `geopandas.read_file()`_
-            when ``engine='pyshp'``.
+            when ``engine='pyshp'`` (or ``engine='numpy'``).
         :type emulate_gpd: bool
+        :param bbox: bounding box ``(min_x, min_y, max_x, max_y)`` within which
+            the features are selected, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param shp_zip_pathname: path to a zipped shapefile data (.shp.zip) from which
+            the shapefile is read without being extracted, defaults to ``None``
+        :type shp_zip_pathname: str | None
+        :param feature_names: (exact) class name(s) of the features to be read, e.g. ``'rail'``,
+            defaults to ``None``; when specified, only the field of feature names
+            (i.e. ``'fclass'`` or ``'type'``) is scanned for all the records,
+            and only the records of the features (and their shapes) are read
+        :type feature_names: str | list | None
         :param kwargs: [optional] parameters of the function
-            `geopandas.read_file()`_ or `shapefile.reader()`_
+            `geopandas.read_file()`_, `pyogrio.read_arrow()`_ (e.g. ``columns`` and ``where``,
+            which are applied by the driver) or `shapefile.reader()`_
         :return: data frame of the shapefile data
         :rtype: pandas.DataFrame | geopandas.GeoDataFrame
 
         .. _`shapefile.reader()`: https://github.com/GeospatialPython/pyshp#reading-shapefiles
+        .. _`pyogrio.read_arrow()`: https://pyogrio.readthedocs.io/en/latest/api.html
         .. _`geopandas.read_file()`: https://geopandas.org/reference/geopandas.read_file.html
 
         .. note::
 
             - If ``engine`` is set to be ``'geopandas'`` (or ``'gpd'``), it requires that
                 `GeoPandas <https://geopandas.org/>`_ is installed.
+            - If ``engine='pyogrio'``, it requires that `pyogrio <https://pyogrio.readthedocs.io/>`_
+                and `PyArrow <https://pypi.org/project/pyarrow/>`_ are installed.
+            - When ``engine='pyshp'``, ``bbox`` (or the bounds of ``mask``) is checked against
+                the bounding box of each record (or the coordinates of each point) before
+                the record is read; ``mask`` is then tested against the geometries of
+                the remaining records.
+            - When ``engine='numpy'``, only the shape types of OSM shapefiles (i.e. points,
+                polylines, polygons and multipoints) are supported.
 
         **Examples**::
 
@@ -564,6 +1158,37 @@ class SHPReadParse:
             4  282898  6103  ...      F  LINESTRING (-0.18626 51.61591, -0.18687 51.61384)
             [5 rows x 8 columns]
 
+            >>> # Set `engine='numpy'` to parse the shapefile in bulk
+            >>> london_railways_np = SHPReadParse.read_shp(
+            ...     path_to_railways_shp, engine='numpy', emulate_gpd=True)
+            >>> london_railways_np.equals(london_railways)
+            True
+
+            >>> # Set `engine='pyogrio'` to read only the specified columns in columnar batches
+            >>> london_railways_ogr = SHPReadParse.read_shp(
+            ...     path_to_railways_shp, engine='pyogrio', columns=['osm_id', 'fclass'])
+            >>> london_railways_ogr.columns.to_list()
+            ['osm_id', 'fclass', 'geometry']
+
+            >>> # Read only the railways within a bounding box
+            >>> london_railways_bbox = SHPReadParse.read_shp(
+            ...     path_to_railways_shp, bbox=(-0.2, 51.45, 0.0, 51.55))
+            >>> len(london_railways_bbox) < len(london_railways)
+            True
+
+            >>> # Read only the features labelled 'rail'
+            >>> london_railways_rail = SHPReadParse.read_shp(
+            ...     path_to_railways_shp, feature_names='rail')
+            >>> london_railways_rail['fclass'].unique()
+            array(['rail'], dtype=object)
+
+            >>> # Read the data of 'railways' straight from the .shp.zip file
+            >>> london_railways_zip = SHPReadParse.read_shp(
+            ...     "gis_osm_railways_free_1.shp", shp_zip_pathname=london_shp_zip,
+            ...     emulate_gpd=True)
+            >>> london_railways_zip.equals(london_railways)
+            True
+
             >>> # Check the data types of `london_railways` and `london_railways_`
             >>> railways_data = [london_railways, london_railways_]
             >>> list(map(type, railways_data))
@@ -580,26 +1205,86 @@ class SHPReadParse:
             Deleting "tests\\osm_data\\" ... Done.
         """
 
+        bbox, mask = _validate_spatial_filter(bbox=bbox, mask=mask)
+
+        if isinstance(feature_names, str):
+            feature_names = [feature_names]
+
+        if feature_names is not None and engine in {'geopandas', 'gpd', 'pyogrio'}:
+            # Let the driver select the features with an SQL WHERE clause
+            with cls._open_shp(shp_pathname, shp_zip_pathname=shp_zip_pathname) as f:
+                feat_col_name = cls._find_feat_col_name([field[0] for field in f.fields[1:]])
+            feat_names = ", ".join("'{}'".format(x.replace("'", "''")) for x in feature_names)
+            where = f'"{feat_col_name}" IN ({feat_names})'
+            if kwargs.get('where'):
+                where = f"({kwargs['where']}) AND {where}"
+            kwargs.update({'where': where})
+
         if engine in {'geopandas', 'gpd'}:
             gpd = _check_dependency(name='geopandas')
-            shp_data = gpd.read_file(shp_pathname, **kwargs)
+            if shp_zip_pathname is not None:
+                shp_pathname = f"zip://{os.path.abspath(shp_zip_pathname)}!{shp_pathname}"
+            shp_data = gpd.read_file(shp_pathname, bbox=bbox, mask=mask, **kwargs)
+
+        elif engine == 'pyogrio':
+            shp_data = cls._read_shp_pyogrio(
+                shp_pathname, bbox=bbox, mask=mask, shp_zip_pathname=shp_zip_pathname, **kwargs)
+
+        elif engine == 'numpy':
+            shp_data = cls._read_shp_numpy(
+                shp_pathname, emulate_gpd=emulate_gpd, bbox=bbox, mask=mask,
+                shp_zip_pathname=shp_zip_pathname, feature_names=feature_names, **kwargs)
 
         else:  # method == 'pyshp':  # default
+            if bbox is None and mask is not None:
+                bbox = mask.bounds
+
             # Read .shp file using shapefile.reader()
-            with pyshp.Reader(shp_pathname, **kwargs) as f:
+            with cls._open_shp(shp_pathname, shp_zip_pathname=shp_zip_pathname, **kwargs) as f:
+                if feature_names is not None:  # Read only the records of the features
+                    feat_col_name = cls._find_feat_col_name([field[0] for field in f.fields[1:]])
+                    oids = [
+                        r.oid for r in f.iterRecords(fields=[feat_col_name])
+                        if r[0] in feature_names]
+                    # Locate the shapes by the .shx file (skipping those out of range)
+                    shapes = [(i, f.shape(i, bbox=bbox)) for i in oids]
+                    shapes = [(i, s) for i, s in shapes if s is not None]
+                    records, shapes = [f.record(i) for i, _ in shapes], [s for _, s in shapes]
+                elif bbox is None:
+                    records, shapes = f.records(), f.iterShapes()
+                else:  # Skip the records whose bounding boxes are out of range
+                    shape_records = f.shapeRecords(bbox=bbox)
+                    records = [sr.record for sr in shape_records]
+                    shapes = [sr.shape for sr in shape_records]
+
+                if bbox is not None:  # Points have no bounding boxes to be checked by pyshp
+                    in_bbox = [cls._point_in_bbox(s, bbox) for s in shapes]
+                    if not all(in_bbox):
+                        records = list(itertools.compress(records, in_bbox))
+                        shapes = list(itertools.compress(shapes, in_bbox))
+
                 # Transform the data to a DataFrame
                 filed_names = [field[0] for field in f.fields[1:]]
-                shp_data = pd.DataFrame(data=f.records(), columns=filed_names)
+                shp_data = pd.DataFrame(data=records, columns=filed_names)
 
                 # shp_data['name'] = shp_data['name'].str.encode('utf-8').str.decode('utf-8')
                 shape_geom_colnames = ['coordinates', 'shape_type']
                 shape_geom = pd.DataFrame(
-                    data=[(s.points, s.shapeType) for s in f.iterShapes()], index=shp_data.index,
+                    data=[(s.points, s.shapeType) for s in shapes], index=shp_data.index,
                     columns=shape_geom_colnames)
 
+            if emulate_gpd or mask is not None:
+                geometry = shape_geom[shape_geom_colnames].apply(
+                    cls._covert_to_geometry, axis=1, result_type='reduce')
+
+                if mask is not None:
+                    within_mask = geometry.map(mask.intersects).astype(bool)
+                    shp_data, shape_geom, geometry = (
+                        x[within_mask].reset_index(drop=True)
+                        for x in (shp_data, shape_geom, geometry))
+
             if emulate_gpd:
-                shp_data['geometry'] = shape_geom[shape_geom_colnames].apply(
-                    cls._covert_to_geometry, axis=1)
+                shp_data['geometry'] = geometry
                 # shp_data.drop(columns=shape_geom_colnames, inplace=True)
             else:
                 shp_data = pd.concat([shp_data, shape_geom], axis=1)
@@ -641,28 +1326,211 @@ class SHPReadParse:
         fields = []
 
         for field_name, dtype, in data[field_names].dtypes.items():
-            try:
-                max_size = data[field_name].map(len).max()
-            except TypeError:
-                max_size = data[field_name].astype(str).map(len).max()
+            # Sizes of text fields are in bytes, in which the values are written
+            values = data[field_name].astype(str)
+            if dtype.name == 'object':
+                values = values.str.encode(cls.ENCODING)
+            max_size = values.str.len().max()
+            max_size = 1 if pd.isna(max_size) else int(max_size)
 
             if 'float' in dtype.name:
                 decimal = decimal_precision
             else:
                 decimal = 0
 
-            fields.append((field_name, dtype_shp_type[dtype.name], max_size, decimal))
+            field_type = dtype_shp_type[dtype.name]
+            if field_type == 'L':  # A logical value is of one byte
+                max_size = 1
+
+            fields.append((field_name, field_type, max_size, decimal))
 
         return fields
 
     @classmethod
-    def write_to_shapefile(cls, data, write_to, shp_filename=None, decimal_precision=5,
-                           ret_shp_pathname=False, verbose=False):
+    def _get_pyshp_shapes(cls, data):
         """
-        Save .shp data as a shapefile by `PyShp <https://github.com/GeospatialPython/pyshp>`_.
+        Get the shapes of (a chunk of) shapefile data in the forms that are accepted by
+        `shapefile.Writer.shape()`_.
 
         :param data: data of a shapefile
         :type data: pandas.DataFrame
+        :return: GeoJSON-like dicts of the shapes (``None`` for missing or empty geometries)
+        :rtype: list
+
+        .. _`shapefile.Writer.shape()`:
+            https://github.com/GeospatialPython/pyshp#adding-geometry
+        """
+
+        if 'geometry' in data:  # Including multi-part geometries and polygons with holes
+            shapes = [
+                None if x is None or x.is_empty else x.__geo_interface__
+                for x in data['geometry'].where(data['geometry'].notna(), None).tolist()]
+
+        else:  # The points of each shape read by pyshp (see the method `.read_shp()`)
+            shapes = []
+            for shape_type, coordinates in zip(data['shape_type'].tolist(),
+                                               data['coordinates'].tolist()):
+                if shape_type == 1:
+                    coordinates = coordinates[0]
+                elif shape_type == 5:
+                    coordinates = [[list(coords) for coords in coordinates]]
+                shapes.append(
+                    {'type': cls.SHAPE_TYPE_GEOM_NAME[shape_type], 'coordinates': coordinates})
+
+        return shapes
+
+    @classmethod
+    def _write_shp_chunks(cls, data, write_to_, fields=None, decimal_precision=5):
+        """
+        Write (chunks of) shapefile data by `shapefile.Writer()`_.
+
+        The records and shapes of each chunk are taken column by column (rather than row by row)
+        and then passed to the writer.
+
+        :param data: data of a shapefile, or an iterable of chunks of the data
+        :type data: pandas.DataFrame | typing.Iterable[pandas.DataFrame]
+        :param write_to_: pathname (without extension) of the output files
+        :type write_to_: str
+        :param fields: specifications ``(name, type, size, decimal)`` of the fields,
+            defaults to ``None``; when ``fields=None``, the fields are sized to fit
+            the data (or its first chunk)
+        :type fields: list | None
+        :param decimal_precision: decimal precision for writing float records, defaults to ``5``
+        :type decimal_precision: int
+
+        .. _`shapefile.Writer()`: https://github.com/GeospatialPython/pyshp#writing-shapefiles
+        """
+
+        chunks = iter([data] if isinstance(data, pd.DataFrame) else data)
+
+        dat = next(chunks, None)
+        if dat is None:
+            raise ValueError("No data is available for writing a shapefile.")
+
+        if fields is None:
+            field_names = [
+                x for x in dat.columns if x not in {'coordinates', 'shape_type', 'geometry'}]
+            fields = cls._specify_pyshp_fields(
+                data=dat, field_names=field_names, decimal_precision=decimal_precision)
+
+        # The shape type is that of the first (non-null) shape
+        with pyshp.Writer(target=write_to_, encoding=cls.ENCODING) as w:
+            for field in fields:
+                w.field(*field)
+            field_names = [field[0] for field in fields]
+
+            while dat is not None:
+                columns = [  # None for a field that is missing from a chunk of the data
+                    dat[x].tolist() if x in dat else [None] * len(dat) for x in field_names]
+                for record in zip(*columns):
+                    w.record(*record)
+
+                for shape in cls._get_pyshp_shapes(dat):
+                    if shape is None:
+                        w.null()
+                    else:
+                        w.shape(shape)
+
+                dat = next(chunks, None)
+
+    @classmethod
+    def _write_arrow_shapefile(cls, shp_table, shp_pathname, geometry_type, geometry_name,
+                               crs=None, **kwargs):
+        """
+        Write a table of shapefile data in columnar batches with `pyogrio.write_arrow()`_.
+
+        :param shp_table: table of shapefile data, including a column of WKB geometries
+        :type shp_table: pyarrow.Table
+        :param shp_pathname: pathname of the output .shp file
+        :type shp_pathname: str
+        :param geometry_type: geometry type of the shapefile, e.g. ``'LineString'``
+        :type geometry_type: str
+        :param geometry_name: name of the column of WKB geometries
+        :type geometry_name: str
+        :param crs: coordinate reference system of the data, defaults to ``None``;
+            when ``crs=None``, it is `EPSG:4326 <https://spatialreference.org/ref/epsg/wgs-84/>`_
+        :type crs: str | None
+        :param kwargs: [optional] parameters of the function `pyogrio.write_arrow()`_,
+            e.g. ``append=True`` for appending the table to an existing shapefile
+
+        .. _`pyogrio.write_arrow()`: https://pyogrio.readthedocs.io/en/latest/api.html
+        """
+
+        pa = _check_dependency(name='pyarrow')
+        pyogrio = _check_dependency(name='pyogrio')
+
+        # Let the driver size the fields to fit the data (rather than those of any source files)
+        shp_table = shp_table.cast(pa.schema(
+            [x if x.name == geometry_name else x.remove_metadata() for x in shp_table.schema]))
+
+        pyogrio.write_arrow(
+            shp_table, shp_pathname, driver=cls.VECTOR_DRIVER, geometry_name=geometry_name,
+            geometry_type=geometry_type, crs=crs or cls.EPSG4326_WGS84_PROJ4, encoding=cls.ENCODING,
+            layer_options={'RESIZE': 'YES'}, **kwargs)
+
+        # Write .cpg and .prj
+        for ext, content in zip([".cpg", ".prj"], [cls.ENCODING, cls.EPSG4326_WGS84_ESRI_WKT]):
+            with open(os.path.splitext(shp_pathname)[0] + ext, mode="w") as f:
+                f.write(content)
+
+    @classmethod
+    def _write_to_shapefile_pyogrio(cls, data, shp_pathname):
+        """
+        Save .shp data as a shapefile by `pyogrio.write_arrow()`_.
+
+        See :meth:`SHPReadParse.write_to_shapefile()
+        <pydriosm.reader.SHPReadParse.write_to_shapefile>` (with ``engine='pyogrio'``).
+
+        .. _`pyogrio.write_arrow()`: https://pyogrio.readthedocs.io/en/latest/api.html
+        """
+
+        pa = _check_dependency(name='pyarrow')
+
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+
+        geometry_type = None
+        for dat in chunks:
+            if 'geometry' in dat:
+                geometry = dat['geometry'].to_numpy()
+                field_names = [x for x in dat.columns if x != 'geometry']
+
+            else:  # Make the geometries from the data parsed by pyshp
+                number_of_points = dat['coordinates'].map(len).to_numpy()
+                coords_offsets = np.concatenate([[0], np.cumsum(number_of_points)])
+                coordinates = np.array(
+                    list(itertools.chain.from_iterable(dat['coordinates'])), dtype=np.float64)
+                geometry = cls._make_shapes(
+                    dat['shape_type'].to_numpy(), coordinates.reshape(-1, 2), coords_offsets)
+                field_names = [x for x in dat.columns if x not in {'coordinates', 'shape_type'}]
+
+            shp_table = pa.Table.from_pandas(dat[field_names], preserve_index=False)
+            shp_table = shp_table.append_column(
+                pa.field(
+                    'geometry', pa.binary(), metadata={'ARROW:extension:name': 'geoarrow.wkb'}),
+                pa.array(shapely.to_wkb(geometry), type=pa.binary()))
+
+            if geometry_type is None:
+                # e.g. 'MultiPolygon' if any of the polygons are multi-part
+                geometry_type = geometry[np.argmax(shapely.get_type_id(geometry))].geom_type
+                cls._write_arrow_shapefile(
+                    shp_table, shp_pathname, geometry_type=geometry_type,
+                    geometry_name='geometry')
+
+            else:  # Append the later chunks to the shapefile
+                cls._write_arrow_shapefile(
+                    shp_table, shp_pathname, geometry_type=geometry_type,
+                    geometry_name='geometry', append=True)
+
+    @classmethod
+    def write_to_shapefile(cls, data, write_to, shp_filename=None, decimal_precision=5,
+                           ret_shp_pathname=False, engine='pyshp', fields=None, verbose=False):
+        """
+        Save .shp data as a shapefile by `PyShp <https://github.com/GeospatialPython/pyshp>`_
+        (or `pyogrio <https://pyogrio.readthedocs.io/>`_).
+
+        :param data: data of a shapefile, or an iterable of chunks of the data
+            (e.g. a generator of data frames), which are written one after another
+        :type data: pandas.DataFrame | typing.Iterable[pandas.DataFrame]
         :param write_to: pathname of a directory where the shapefile data is to be saved
         :type write_to: str
         :param shp_filename: filename (or pathname) of the target .shp file, defaults to ``None``;
@@ -673,6 +1541,16 @@ class SHPReadParse:
         :param ret_shp_pathname: whether to return the pathname of the output .shp file,
             defaults to ``False``
         :type ret_shp_pathname: bool
+        :param engine: method used to write the shapefile;
+            options include: ``'pyshp'`` (default), which passes the records and shapes
+            (taken column by column) to PyShp,
+            and ``'pyogrio'``, which writes the data in columnar batches
+            (where ``decimal_precision`` and ``fields`` are not applicable)
+        :type engine: str
+        :param fields: specifications ``(name, type, size, decimal)`` of the fields,
+            defaults to ``None``; when ``fields=None``, the fields are sized to fit the data
+            (or its first chunk), in which case values of later chunks may be truncated
+        :type fields: list | None
         :param verbose: whether to print relevant information in console, defaults to ``False``
         :type verbose: bool | int
 
@@ -751,6 +1629,26 @@ class SHPReadParse:
             >>> london_railways_shp_.equals(london_railways_shp)
             True
 
+            >>> # Set `engine='pyogrio'` to write the data in columnar batches
+            >>> path_to_railways_shp_ = SHPReadParse.write_to_shapefile(
+            ...     london_railways_shp, railways_subdir, shp_filename="rail_data_ogr",
+            ...     ret_shp_pathname=True, engine='pyogrio')
+            >>> london_railways_shp_ = SHPReadParse.read_shp(path_to_railways_shp_)
+            >>> london_railways_shp_['coordinates'].equals(london_railways_shp['coordinates'])
+            True
+
+            >>> # Write the data in chunks, with the fields sized to fit all of the data
+            >>> fields = SHPReadParse._specify_pyshp_fields(
+            ...     london_railways_shp, london_railways_shp.columns[:-2], decimal_precision=5)
+            >>> chunks = (london_railways_shp[i:i + 1000]
+            ...           for i in range(0, len(london_railways_shp), 1000))
+            >>> path_to_railways_shp_ = SHPReadParse.write_to_shapefile(
+            ...     chunks, railways_subdir, shp_filename="rail_data_chunks", fields=fields,
+            ...     ret_shp_pathname=True)
+            >>> london_railways_shp_ = SHPReadParse.read_shp(path_to_railways_shp_)
+            >>> london_railways_shp_.equals(london_railways_shp)
+            True
+
             >>> # Delete the download/data directory
             >>> delete_dir(gfd.download_dir, verbose=True)
             To delete the directory "tests\\osm_data\\" (Not empty)
@@ -766,43 +1664,21 @@ class SHPReadParse:
             print(f'Writing data to "{check_relpath(write_to_)}.*"', end=" ... ")
 
         try:
-            key_column_names = ['coordinates', 'shape_type']
-            dat = data.copy()
-
-            if 'geometry' in data:
-                coords_and_shape_type = pd.DataFrame(
-                    dat['geometry'].map(cls._convert_to_coords_and_shape_type).to_list(),
-                    columns=key_column_names, index=dat.index)
-                del dat['geometry']
-                dat = pd.concat([dat, coords_and_shape_type], axis=1)
-
-            field_names = [x for x in dat.columns if x not in key_column_names]
-
-            shape_type = dat['shape_type'].unique()[0]
+            if engine == 'pyogrio':
+                cls._write_to_shapefile_pyogrio(data=data, shp_pathname=f"{write_to_}.shp")
 
-            with pyshp.Writer(target=write_to_, shapeType=shape_type, autoBalance=True) as w:
-                w.fields = cls._specify_pyshp_fields(
-                    data=dat, field_names=field_names, decimal_precision=decimal_precision)
+            else:  # engine == 'pyshp' (default)
+                cls._write_shp_chunks(
+                    data=data, write_to_=write_to_, fields=fields,
+                    decimal_precision=decimal_precision)
 
-                for i in dat.index:
-                    w.record(*dat.loc[i, field_names].to_list())
-
-                    # s = pyshp.Shape(shapeType=w.shapeType, points=dat.loc[i, 'coordinates'])
-                    coordinates = dat.loc[i, 'coordinates']
-                    if shape_type == 1:
-                        coordinates = coordinates[0]
-                    elif shape_type == 5:
-                        coordinates = [[list(coords) for coords in coordinates]]
-                    s = {'type': cls.SHAPE_TYPE_GEOM_NAME[shape_type], 'coordinates': coordinates}
-                    w.shape(s)
-
-            # Write .cpg
-            with open(f"{write_to_}.cpg", "w") as cpg_file:
-                cpg_file.write(cls.ENCODING)
+                # Write .cpg
+                with open(f"{write_to_}.cpg", "w") as cpg_file:
+                    cpg_file.write(cls.ENCODING)
 
-            # Write .prj
-            with open(f"{write_to_}.prj", "w") as prj_file:
-                prj_file.write(cls.EPSG4326_WGS84_ESRI_WKT)
+                # Write .prj
+                with open(f"{write_to_}.prj", "w") as prj_file:
+                    prj_file.write(cls.EPSG4326_WGS84_ESRI_WKT)
 
             if verbose:
                 print("Done.")
@@ -910,7 +1786,9 @@ class SHPReadParse:
 
         :param shp_pathnames: pathname of a .shp file, or pathnames of multiple shapefiles
         :type shp_pathnames: str | list
-        :param feature_names: class name(s) of feature(s), defaults to ``None``
+        :param feature_names: class name(s) of feature(s), defaults to ``None``;
+            when specified, the names are matched against those found by scanning only
+            the field of feature names, and then only the records of the features are read
         :type feature_names: str | list | None
         :param save_feat_shp: (when ``fclass`` is not ``None``)
             whether to save data of the ``fclass`` as shapefile, defaults to ``False``
@@ -1003,26 +1881,35 @@ class SHPReadParse:
             data = None
 
         else:
-            dat_dict = {
-                lyr_shp_pathname: cls.read_shp(shp_pathname=lyr_shp_pathname, **kwargs)
-                for lyr_shp_pathname in lyr_shp_pathnames}
-            data = pd.concat(dat_dict.values(), axis=0, ignore_index=True)
-
             if feature_names:
                 if isinstance(feature_names, str):
                     feat_names = [feature_names]
                 else:
                     feat_names = feature_names
-                feat_col_name = [x for x in data.columns if x in {'type', 'fclass'}][0]
-                feat_names_ = [
-                    find_similar_str(x, data[feat_col_name].unique()) for x in feat_names]
 
-                data = data.query(f'{feat_col_name} in @feat_names_')
+                # Scan only the field of feature names for the names of the available features
+                reader_kwargs = {
+                    k: v for k, v in kwargs.items()
+                    if k in {'shp_zip_pathname', 'encoding', 'encodingErrors'}}
+                feat_values = itertools.chain.from_iterable(
+                    cls._read_feat_col(x, **reader_kwargs)[2] for x in lyr_shp_pathnames)
+                feat_values = list(dict.fromkeys(feat_values))
+                feat_names_ = [find_similar_str(x, feat_values) for x in feat_names]
+
+                # Read only the records of the features
+                kwargs.update({'feature_names': [x for x in feat_names_ if x is not None]})
+
+            dat_dict = {
+                lyr_shp_pathname: cls.read_shp(shp_pathname=lyr_shp_pathname, **kwargs)
+                for lyr_shp_pathname in lyr_shp_pathnames}
+            data = pd.concat(dat_dict.values(), axis=0, ignore_index=True)
 
+            if feature_names:
                 if data.empty:
                     data = None
 
                 elif save_feat_shp:
+                    feat_col_name = cls._find_feat_col_name(data.columns)
                     feat_shp_pathnames = []
 
                     for lyr_shp_pathname in lyr_shp_pathnames:
@@ -1044,6 +1931,95 @@ class SHPReadParse:
 
         return data
 
+    @classmethod
+    def _group_shp_files(cls, shp_files):
+        """
+        Group shapefiles by shape type, with fields that fit the data of all of them.
+
+        :param shp_files: pairs of the pathname of a .shp file and the path to
+            the zipped shapefile (or ``None``) where it is
+        :type shp_files: list
+        :return: the shapefiles of each shape type, and the fields of the shapefiles
+            of each shape type (as specified by ``(name, type, size, decimal)``)
+        :rtype: tuple
+        """
+
+        shp_files_, fields = collections.defaultdict(list), collections.defaultdict(dict)
+
+        for shp_pathname, shp_zip_pathname in shp_files:
+            with cls._open_shp(shp_pathname, shp_zip_pathname=shp_zip_pathname) as f:
+                shp_files_[f.shapeType].append((shp_pathname, shp_zip_pathname))
+                fields_ = fields[f.shapeType]
+                for name, field_type, size, decimal in f.fields[1:]:
+                    _, size_, decimal_ = fields_.get(name, (field_type, 0, 0))
+                    fields_[name] = (field_type, max(size, size_), max(decimal, decimal_))
+
+        fields = {k: [(name,) + v for name, v in x.items()] for k, x in fields.items()}
+
+        return shp_files_, fields
+
+    @classmethod
+    def _iter_shp_data(cls, shp_files, workers=None):
+        """
+        Read shapefiles one after another, in parallel when multiple workers are specified.
+
+        :param shp_files: pairs of the pathname of a .shp file and the path to
+            the zipped shapefile (or ``None``) where it is
+        :type shp_files: list
+        :param workers: number of worker processes across which the shapefiles are read,
+            defaults to ``None`` (i.e. the shapefiles are read in the current process)
+        :type workers: int | None
+        :return: data of the shapefiles (in the given order)
+        :rtype: typing.Generator[pandas.DataFrame]
+        """
+
+        # Geometries are passed from the workers (in WKB) much faster than lists of coordinates
+        read_func = functools.partial(cls.read_shp, engine='numpy', emulate_gpd=True)
+
+        if workers and workers > 1 and len(shp_files) > 1:
+            with multiprocessing.Pool(processes=min(workers, len(shp_files))) as p:
+                # Keep only as many shapefiles in progress as the number of workers
+                running = collections.deque()
+                for shp_pathname, shp_zip_pathname in shp_files:
+                    kwds = {'shp_zip_pathname': shp_zip_pathname}
+                    running.append(p.apply_async(read_func, args=(shp_pathname,), kwds=kwds))
+                    if len(running) >= workers:
+                        yield running.popleft().get()
+
+                while running:
+                    yield running.popleft().get()
+
+        else:
+            for shp_pathname, shp_zip_pathname in shp_files:
+                yield read_func(shp_pathname, shp_zip_pathname=shp_zip_pathname)
+
+    @staticmethod
+    def _iter_unique_shp_data(shp_data, n_dropped, id_col='osm_id'):
+        """
+        Drop the features whose OSM IDs have already been seen in the data of shapefiles.
+
+        Only the OSM IDs (rather than the features) that have been seen are kept in memory.
+
+        :param shp_data: data of shapefiles (e.g. of a layer of adjacent regions)
+        :type shp_data: typing.Iterable[pandas.DataFrame]
+        :param n_dropped: a list, to which the number of the features dropped
+            from the data of each shapefile is appended
+        :type n_dropped: list
+        :param id_col: name of the column of OSM IDs, defaults to ``'osm_id'``
+        :type id_col: str
+        :return: data of the shapefiles without duplicated features
+        :rtype: typing.Generator[pandas.DataFrame]
+        """
+
+        seen_ids = set()
+
+        for dat in shp_data:
+            if id_col in dat.columns:
+                dat, n = drop_duplicate_ids(dat, seen_ids=seen_ids, by=id_col)
+                n_dropped.append(n)
+
+            yield dat
+
     @classmethod
     def merge_shps(cls, shp_pathnames, path_to_merged_dir, engine='pyshp', **kwargs):
         """
@@ -1054,21 +2030,32 @@ class SHPReadParse:
         :param path_to_merged_dir: path to a directory where the merged files are to be saved
         :type path_to_merged_dir: str
         :param engine: the open-source package that is used to merge/save shapefiles;
-            options include: ``'pyshp'`` (default) and ``'geopandas'`` (or ``'gpd'``)
+            options include: ``'pyshp'`` (default), ``'pyogrio'`` and ``'geopandas'`` (or ``'gpd'``)
             when ``engine='geopandas'``,
             this function relies on `geopandas.GeoDataFrame.to_file()`_;
-            otherwise, it by default uses `shapefile.Writer()`_
+            when ``engine='pyogrio'``, the data is read and written in columnar batches
+            by `pyogrio.read_arrow()`_ and `pyogrio.write_arrow()`_;
+            otherwise, it by default reads the shapefiles one after another and writes the data
+            by `shapefile.Writer()`_, without concatenating all of it
         :type engine: str
+        :param kwargs: [optional] parameters of the method
+            :meth:`SHPReadParse.read_layer_shps()<pydriosm.reader.SHPReadParse.read_layer_shps>`
+            (or the function `pyogrio.read_arrow()`_ when ``engine='pyogrio'``)
 
         .. _`shapefile.Writer()`:
             https://github.com/GeospatialPython/pyshp#writing-shapefiles
         .. _`geopandas.GeoDataFrame.to_file()`:
             https://geopandas.org/reference.html#geopandas.GeoDataFrame.to_file
+        .. _`pyogrio.read_arrow()`: https://pyogrio.readthedocs.io/en/latest/api.html
+        .. _`pyogrio.write_arrow()`: https://pyogrio.readthedocs.io/en/latest/api.html
 
         .. note::
 
             - When ``engine='geopandas'`` (or ``engine='gpd'``), the implementation of this function
               requires that `GeoPandas <https://geopandas.org/>`_ is installed.
+            - When ``engine='pyogrio'``, it requires that
+              `pyogrio <https://pyogrio.readthedocs.io/>`_ and
+              `PyArrow <https://pypi.org/project/pyarrow/>`_ are installed.
 
         .. seealso::
 
@@ -1091,26 +2078,38 @@ class SHPReadParse:
                 shp_dat.to_file(
                     filename=out_fn, driver=cls.VECTOR_DRIVER, crs=cls.EPSG4326_WGS84_PROJ4)
 
+        elif engine == 'pyogrio':
+            pa = _check_dependency(name='pyarrow')
+            pyogrio = _check_dependency(name='pyogrio')
+
+            shp_tables, geom_col_names = collections.defaultdict(list), {}
+            for shp_pathname in shp_pathnames:
+                shp_meta, shp_table = pyogrio.read_arrow(shp_pathname, **kwargs)
+                geo_typ = shp_meta['geometry_type']
+                shp_tables[geo_typ].append(shp_table)
+                geom_col_names[geo_typ] = shp_meta['geometry_name'] or 'wkb_geometry'
+
+            for geo_typ, shp_table_list in shp_tables.items():
+                out_fn = os.path.join(path_to_merged_dir, f"{geo_typ.lower()}.shp")
+                shp_table = pa.concat_tables(shp_table_list, promote_options='default')
+                cls._write_arrow_shapefile(
+                    shp_table, out_fn, geometry_type=geo_typ,
+                    geometry_name=geom_col_names[geo_typ], crs=shp_meta['crs'])
+
         else:  # method == 'pyshp': (default)
             kwargs.update({'ret_feat_shp_path': False})
-            shp_data = cls.read_layer_shps(shp_pathnames, **kwargs)
-            if 'geometry' in shp_data.columns:
-                k = shp_data['geometry'].map(lambda x: x.geom_type)
-            else:
-                k = 'shape_type'
 
-            for geo_typ, dat in shp_data.groupby(k):
-                if isinstance(k, str):
-                    geo_typ = cls.SHAPE_TYPE_GEOM_NAME[geo_typ]
+            shp_files, fields = cls._group_shp_files([(x, None) for x in shp_pathnames])
+
+            for shape_type, shp_files_ in shp_files.items():
+                geo_typ = cls.SHAPE_TYPE_GEOM_NAME[shape_type]
                 out_fn = os.path.join(path_to_merged_dir, f"{geo_typ.lower()}.shp")
-                cls.write_to_shapefile(data=dat, write_to=out_fn)
 
-                # Write .cpg
-                with open(out_fn.replace(".shp", ".cpg"), mode="w") as cpg:
-                    cpg.write(cls.ENCODING)
-                # Write .prj
-                with open(out_fn.replace(".shp", ".prj"), mode="w") as prj:
-                    prj.write(cls.EPSG4326_WGS84_ESRI_WKT)
+                # Write the data of the shapefiles one after another
+                shp_data = (cls.read_layer_shps(x, **kwargs) for x, _ in shp_files_)
+                cls.write_to_shapefile(
+                    data=(dat for dat in shp_data if dat is not None), write_to=out_fn,
+                    fields=fields[shape_type])
 
     @classmethod
     def _extract_files(cls, shp_zip_pathnames, layer_name, verbose=False):
@@ -1184,7 +2183,8 @@ class SHPReadParse:
 
     @classmethod
     def merge_layer_shps(cls, shp_zip_pathnames, layer_name, engine='pyshp', rm_zip_extracts=True,
-                         output_dir=None, rm_shp_temp=True, ret_shp_pathname=False, verbose=False):
+                         output_dir=None, rm_shp_temp=True, ret_shp_pathname=False, verbose=False,
+                         workers=None, drop_duplicates=True):
         """
         Merge shapefiles over a layer for multiple geographic regions.
 
@@ -1193,13 +2193,18 @@ class SHPReadParse:
         :param layer_name: name of a layer (e.g. 'railways')
         :type layer_name: str
         :param engine: the open-source package used to merge/save shapefiles;
-            options include: ``'pyshp'`` (default) and ``'geopandas'`` (or ``'gpd'``)
+            options include: ``'pyshp'`` (default), ``'pyogrio'`` and ``'geopandas'`` (or ``'gpd'``)
             if ``engine='geopandas'``, this function relies on `geopandas.GeoDataFrame.to_file()`_;
-            otherwise, it by default uses `shapefile.Writer()`_
+            otherwise (i.e. ``'pyshp'`` or ``'pyogrio'``), the shapefiles are read straight from
+            the .shp.zip files (without being extracted or copied) and their data is appended
+            to the merged shapefile one after another by `shapefile.Writer()`_
+            (or in columnar batches when ``engine='pyogrio'``)
         :type engine: str
-        :param rm_zip_extracts: whether to delete the extracted files, defaults to ``False``
+        :param rm_zip_extracts: (when ``engine='geopandas'``)
+            whether to delete the extracted files, defaults to ``False``
         :type rm_zip_extracts: bool
-        :param rm_shp_temp: whether to delete temporary layer files, defaults to ``False``
+        :param rm_shp_temp: (when ``engine='geopandas'``)
+            whether to delete temporary layer files, defaults to ``False``
         :type rm_shp_temp: bool
         :param output_dir: if ``None`` (default), use the layer name as the name of the folder
             where the merged .shp files will be saved
@@ -1209,6 +2214,16 @@ class SHPReadParse:
         :type ret_shp_pathname: bool
         :param verbose: whether to print relevant information in console, defaults to ``False``
         :type verbose: bool | int
+        :param workers: (unless ``engine='geopandas'``) number of worker processes across which
+            the shapefiles are read, defaults to ``None`` (i.e. the shapefiles are read
+            one after another in the current process); only as many shapefiles as the workers
+            are read ahead of the merged output, which keeps the memory bounded
+        :type workers: int | None
+        :param drop_duplicates: (unless ``engine='geopandas'``) whether to drop the features
+            whose OSM IDs (i.e. ``'osm_id'``) have already been merged, defaults to ``True``;
+            adjacent regions overlap at their borders, so that some features are in
+            the shapefiles of more than one region
+        :type drop_duplicates: bool
         :return: the path to the merged file when ``ret_merged_shp_path=True``
         :rtype: list
 
@@ -1265,6 +2280,7 @@ class SHPReadParse:
                 "greater-manchester_gis_osm_railways_free_1.shp"
                 "west-yorkshire_gis_osm_railways_free_1.shp"
                     In progress ... Done.
+                    Dropped ... duplicated feature(s) (by OSM ID).
                     Find the merged shapefile at "tests\\osm_data\\gre_man-wes_yor-railways\\".
 
             >>> # Check the pathname of the merged shapefile
@@ -1299,9 +2315,6 @@ class SHPReadParse:
               <pydriosm.reader.GeofabrikReader.merge_subregion_layer_shp>`.
         """
 
-        path_to_extract_dirs = cls._extract_files(
-            shp_zip_pathnames=shp_zip_pathnames, layer_name=layer_name, verbose=verbose)
-
         # Specify a directory that stores files for the specific layer
         subrgn_names_ = [
             re.search(r'.*(?=\.shp\.zip)', os.path.basename(x).replace("-latest-free", "")).group(0)
@@ -1313,19 +2326,34 @@ class SHPReadParse:
         path_to_data_dir = os.path.commonpath(shp_zip_pathnames)
         merged_dirname_temp = f"{prefix}-{layer_name}{suffix}"
         path_to_merged_dir_temp = os.path.join(path_to_data_dir, merged_dirname_temp)
-        os.makedirs(path_to_merged_dir_temp, exist_ok=True)
 
-        paths_to_temp_files = cls._copy_tempfiles(
-            subrgn_names_=subrgn_names_, layer_name=layer_name,
-            path_to_extract_dirs=path_to_extract_dirs,
-            path_to_merged_dir_temp=path_to_merged_dir_temp)
+        if engine in {'geopandas', 'gpd'}:
+            path_to_extract_dirs = cls._extract_files(
+                shp_zip_pathnames=shp_zip_pathnames, layer_name=layer_name, verbose=verbose)
+
+            os.makedirs(path_to_merged_dir_temp, exist_ok=True)
+
+            paths_to_temp_files = cls._copy_tempfiles(
+                subrgn_names_=subrgn_names_, layer_name=layer_name,
+                path_to_extract_dirs=path_to_extract_dirs,
+                path_to_merged_dir_temp=path_to_merged_dir_temp)
 
-        # Get the paths to the target .shp files
-        paths_to_shp_files = [x for x in paths_to_temp_files if x.endswith(".shp")]
+            # Get the paths to the target .shp files
+            paths_to_shp_files = [x for x in paths_to_temp_files if x.endswith(".shp")]
+            shp_filenames = [os.path.basename(f) for f in paths_to_shp_files]
+
+        else:  # Read the shapefiles of the layer straight from the .shp.zip files
+            shp_files, shp_filenames = [], []
+            for subregion_name, shp_zip_pathname in zip(subrgn_names_, shp_zip_pathnames):
+                shp_members = cls.find_shp_zip_members(shp_zip_pathname, layer_name)
+                for shp_filename in itertools.chain.from_iterable(shp_members.values()):
+                    shp_files.append((shp_filename, shp_zip_pathname))
+                    shp_filenames.append(
+                        f"{subregion_name.lower().replace(' ', '-')}_{shp_filename}")
 
         if verbose:
             print("Merging the following shapefiles:")
-            print("\t" + "\n\t".join(f"\"{os.path.basename(f)}\"" for f in paths_to_shp_files))
+            print("\t" + "\n\t".join(f"\"{f}\"" for f in shp_filenames))
             print("\t\tIn progress ... ", end="")
 
         try:
@@ -1333,23 +2361,45 @@ class SHPReadParse:
                 output_dir=output_dir, path_to_data_dir=path_to_data_dir,
                 merged_dirname_temp=merged_dirname_temp, suffix=suffix)
 
-            cls.merge_shps(
-                shp_pathnames=paths_to_shp_files, path_to_merged_dir=path_to_merged_dir,
-                engine=engine)
+            if engine in {'geopandas', 'gpd'}:
+                cls.merge_shps(
+                    shp_pathnames=paths_to_shp_files, path_to_merged_dir=path_to_merged_dir,
+                    engine=engine)
+
+                cls._transfer_files(
+                    engine=engine, path_to_merged_dir=path_to_merged_dir,
+                    path_to_merged_dir_temp=path_to_merged_dir_temp, prefix=prefix,
+                    suffix=suffix)
+
+            else:
+                shp_files, fields = cls._group_shp_files(shp_files)
+
+                n_dropped = []
+                for shape_type, shp_files_ in shp_files.items():
+                    geo_typ = cls.SHAPE_TYPE_GEOM_NAME[shape_type]
+                    out_fn = os.path.join(path_to_merged_dir, f"{geo_typ.lower()}.shp")
 
-            cls._transfer_files(
-                engine=engine, path_to_merged_dir=path_to_merged_dir,
-                path_to_merged_dir_temp=path_to_merged_dir_temp, prefix=prefix, suffix=suffix)
+                    # Append the data of the shapefiles to the output as soon as each is read
+                    shp_data = cls._iter_shp_data(shp_files_, workers=workers)
+                    if drop_duplicates:
+                        shp_data = cls._iter_unique_shp_data(shp_data, n_dropped=n_dropped)
+
+                    cls.write_to_shapefile(
+                        data=shp_data, write_to=out_fn, engine=engine, fields=fields[shape_type])
 
             if verbose:
                 print("Done.")
 
-            if rm_zip_extracts:
-                for path_to_extract_dir in path_to_extract_dirs:
-                    shutil.rmtree(path_to_extract_dir)
+                if engine not in {'geopandas', 'gpd'} and drop_duplicates:
+                    print(f"\t\tDropped {sum(n_dropped)} duplicated feature(s) (by OSM ID).")
+
+            if engine in {'geopandas', 'gpd'}:
+                if rm_zip_extracts:
+                    for path_to_extract_dir in path_to_extract_dirs:
+                        shutil.rmtree(path_to_extract_dir)
 
-            if rm_shp_temp:
-                shutil.rmtree(path_to_merged_dir_temp)
+                if rm_shp_temp:
+                    shutil.rmtree(path_to_merged_dir_temp)
 
             if verbose:
                 m_rel_path = check_relpath(path_to_merged_dir)
@@ -1392,6 +2442,11 @@ class PBFReadParse(Transformer):
         'other_relations': shapely.geometry.GeometryCollection,
     }
 
+    #: list: Attributes of OSM objects (other than ``'osm_id'``) that can be reported as fields
+    #: by the `OSM driver <https://gdal.org/drivers/vector/osm.html>`_ of GDAL/OGR.
+    OSM_META_ATTRIBUTES = [
+        'osm_version', 'osm_timestamp', 'osm_uid', 'osm_user', 'osm_changeset']
+
     @classmethod
     def get_pbf_layer_geom_types(cls, shape_name=False):
         """
@@ -1435,6 +2490,61 @@ class PBFReadParse(Transformer):
 
         return pbf_layer_geom_dict
 
+    @classmethod
+    def validate_pbf_layer_names(cls, layer_names):
+        """
+        Validate the input of layer name(s) for reading PBF data.
+
+        :param layer_names: name of a PBF layer, e.g. 'lines', or names of multiple layers;
+            if ``None`` (default), returns an empty list;
+            if ``layer_names='all'``, the function returns a list of all available layers
+        :type layer_names: str | list | None
+        :return: valid layer names (in the order of the layers in a PBF data file)
+        :rtype: list
+        :raises ValueError: if any of ``layer_names`` does not match a layer of PBF data
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+
+            >>> PBFReadParse.validate_pbf_layer_names(None)
+            []
+
+            >>> PBFReadParse.validate_pbf_layer_names('line')
+            ['lines']
+
+            >>> PBFReadParse.validate_pbf_layer_names(['multipolygon', 'point'])
+            ['points', 'multipolygons']
+
+            >>> PBFReadParse.validate_pbf_layer_names('all')
+            ['points', 'lines', 'multilinestrings', 'multipolygons', 'other_relations']
+
+            >>> PBFReadParse.validate_pbf_layer_names('roads')
+            Traceback (most recent call last):
+              ...
+            ValueError: Invalid PBF layer name(s): ['roads']. Valid options include: ...
+        """
+
+        if layer_names:
+            if layer_names == 'all':
+                layer_names_ = list(cls.LAYER_GEOM.keys())
+            else:
+                lyr_names = [layer_names] if isinstance(layer_names, str) else layer_names
+                lyr_names_ = {x: find_similar_str(x, cls.LAYER_GEOM.keys()) for x in lyr_names}
+
+                invalid_names = [k for k, v in lyr_names_.items() if v is None]
+                if invalid_names:
+                    raise ValueError(
+                        f"Invalid PBF layer name(s): {invalid_names}. "
+                        f"Valid options include: {list(cls.LAYER_GEOM.keys())}.")
+
+                layer_names_ = [x for x in cls.LAYER_GEOM.keys() if x in lyr_names_.values()]
+
+        else:
+            layer_names_ = []
+
+        return layer_names_
+
     @classmethod
     def get_pbf_layer_names(cls, pbf_pathname, verbose=False):
         """
@@ -1511,6 +2621,148 @@ class PBFReadParse(Transformer):
         except Exception as e:
             _print_failure_msg(e=e, msg="Failed.")
 
+    @classmethod
+    def make_attribute_filter(cls, tag_filter, field_names):
+        """
+        Make an attribute filter (in the form of an `OGR SQL`_ ``WHERE`` clause)
+        for selecting features of a PBF layer by their tags.
+
+        :param tag_filter: tags by which features are selected; when it is a dict,
+            its keys are tag keys and values can be a tag value, a list of tag values or ``None``
+            (any value), e.g. ``{'highway': None, 'railway': 'rail'}`` selects the features with
+            a ``highway`` tag or with ``railway=rail``; when it is a str, it is regarded as
+            an OGR SQL ``WHERE`` clause and returned as is
+        :type tag_filter: dict | str
+        :param field_names: names of the fields of a PBF layer; tags that are not among the
+            fields are matched within the field of ``'other_tags'``
+        :type field_names: list
+        :return: an attribute filter of the PBF layer
+        :rtype: str
+
+        .. _`OGR SQL`: https://gdal.org/user/ogr_sql_dialect.html
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+
+            >>> fields = ['osm_id', 'name', 'highway', 'railway', 'other_tags']
+
+            >>> PBFReadParse.make_attribute_filter({'highway': None}, fields)
+            '"highway" IS NOT NULL'
+
+            >>> PBFReadParse.make_attribute_filter({'railway': 'rail'}, fields)
+            '"railway" = \\'rail\\''
+
+            >>> # Tags other than the fields are matched within 'other_tags'
+            >>> attr_filter = PBFReadParse.make_attribute_filter({'maxspeed': '30 mph'}, fields)
+            >>> attr_filter.startswith('"other_tags" LIKE')
+            True
+        """
+
+        if isinstance(tag_filter, str):
+            attribute_filter = tag_filter
+
+        else:
+            def _quote(x):
+                return "'{}'".format(str(x).replace("'", "''"))
+
+            def _like(x):
+                return str(x).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+            conditions = []
+
+            for key, values in tag_filter.items():
+                values_ = [values] if isinstance(values, str) else values
+
+                if key in field_names:
+                    if values_ is None:
+                        conditions.append(f'"{key}" IS NOT NULL')
+                    elif len(values_) == 1:
+                        conditions.append(f'"{key}" = {_quote(values_[0])}')
+                    else:
+                        conditions.append(f'"{key}" IN ({", ".join(map(_quote, values_))})')
+
+                else:
+                    if values_ is None:
+                        patterns = [f'%"{_like(key)}"=>%']
+                    else:
+                        patterns = [f'%"{_like(key)}"=>"{_like(v)}"%' for v in values_]
+                    conditions += [
+                        f'"other_tags" LIKE {_quote(pat)} ESCAPE \'\\\'' for pat in patterns]
+
+            attribute_filter = " OR ".join(conditions)
+
+        return attribute_filter
+
+    @classmethod
+    def make_osm_config(cls, layer_attributes, osm_config_file):
+        """
+        Make the content of a configuration file (osmconf.ini) for the `OSM driver`_ of GDAL/OGR,
+        which specifies the attributes and tags to be reported as fields of PBF layers.
+
+        :param layer_attributes: names of the tags (and attributes, e.g. ``'osm_timestamp'``)
+            to be reported as fields, which replace the default ones of the layers;
+            when it is a dict, its keys are names of PBF layers and values are lists of tags;
+            when it is a list, it applies to all layers; tags that are not specified are
+            packed into the field of ``'other_tags'``
+        :type layer_attributes: dict | list
+        :param osm_config_file: pathname of an existing configuration file on which
+            the new configuration is based, e.g. the default osmconf.ini of GDAL
+        :type osm_config_file: str
+        :return: content of the configuration file
+        :rtype: str
+
+        .. _`OSM driver`: https://gdal.org/drivers/vector/osm.html
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+            >>> from osgeo import gdal
+
+            >>> default_osm_conf = gdal.FindFile('gdal', 'osmconf.ini')
+
+            >>> osm_conf = PBFReadParse.make_osm_config(
+            ...     {'lines': ['name', 'highway', 'maxspeed', 'osm_timestamp']}, default_osm_conf)
+            >>> lines_conf = osm_conf.split('[lines]')[1].split('[multipolygons]')[0]
+            >>> 'attributes=name,highway,maxspeed' in lines_conf.splitlines()
+            True
+            >>> 'osm_timestamp=yes' in lines_conf.splitlines()
+            True
+        """
+
+        if isinstance(layer_attributes, dict):
+            layer_attributes_ = {
+                cls.validate_pbf_layer_names(k)[0]: v for k, v in layer_attributes.items()}
+        else:
+            layer_attributes_ = dict.fromkeys(cls.LAYER_GEOM.keys(), layer_attributes)
+
+        with open(osm_config_file, mode='r', encoding='utf-8') as f:
+            config_lines = f.read().splitlines()
+
+        layer_name = None
+
+        for i, line in enumerate(config_lines):
+            section = re.match(r'\s*\[(\w+)]', line)
+
+            if section:
+                layer_name = section.group(1)
+
+            elif layer_name in layer_attributes_:
+                attributes = [layer_attributes_[layer_name]] \
+                    if isinstance(layer_attributes_[layer_name], str) \
+                    else layer_attributes_[layer_name]
+                key = line.split('=', 1)[0].strip()
+
+                if key == 'attributes':
+                    config_lines[i] = 'attributes=' + ','.join(
+                        x for x in attributes if x not in cls.OSM_META_ATTRIBUTES)
+                elif key in cls.OSM_META_ATTRIBUTES:
+                    config_lines[i] = key + '=' + ('yes' if key in attributes else 'no')
+
+        osm_config = '\n'.join(config_lines) + '\n'
+
+        return osm_config
+
     @classmethod
     def transform_pbf_layer_field(cls, layer_data, layer_name, parse_geometry=False,
                                   parse_properties=False, parse_other_tags=False):
@@ -1568,7 +2820,7 @@ class PBFReadParse(Transformer):
                         del prop_data['osm_id']
                     if parse_other_tags:
                         # Reformat the properties
-                        prop_data.loc[:, ot_name] = prop_data[ot_name].map(cls.transform_other_tags)
+                        prop_data.loc[:, ot_name] = cls.transform_other_tags_series(prop_data[ot_name])
                 else:
                     # Whether to reformat 'other_tags'
                     if parse_other_tags:
@@ -1588,10 +2840,179 @@ class PBFReadParse(Transformer):
 
         if isinstance(lyr_dat, pd.DataFrame):
             if 'id' in lyr_dat.columns:
-                lyr_dat.sort_values('id', ignore_index=True, inplace=True)
+                lyr_dat = sort_layer_data(lyr_dat, by='id')
 
         return lyr_dat
 
+    @classmethod
+    def compact_pbf_layer(cls, layer_data, max_category_ratio=0.5, geometry_format=None):
+        """
+        Represent (expanded) data of a PBF layer with compact data types.
+
+        - the ``'id'`` column is of integers, and columns of OSM IDs
+          (i.e. ``'osm_id'`` and ``'osm_way_id'``) are of nullable integers (``'Int64'``);
+          a column ``'osm_id'`` (or a key ``'osm_id'`` of ``'properties'``)
+          that duplicates ``'id'`` is removed;
+        - a column of strings is categorical if the ratio of its distinct values to its values
+          is not greater than ``max_category_ratio``, otherwise repeated strings
+          (including the keys and values of dictionaries) share the same string objects.
+
+        :param layer_data: data of a PBF layer, e.g. parsed with ``expand=True``
+        :type layer_data: pandas.DataFrame | pandas.Series | list
+        :param max_category_ratio: maximum ratio of distinct values to (non-null) values
+            of a column of strings for it to be categorical, defaults to ``0.5``
+        :type max_category_ratio: float
+        :param geometry_format: format of the ``'geometry'`` column, options include
+            ``{None, 'wkb', 'quantized'}``; when ``geometry_format='wkb'``, the geometry objects
+            are in WKB (which can be loaded by `shapely.wkb.loads()`_); when
+            ``geometry_format='quantized'``, their coordinates are quantized in contiguous arrays
+            (see :class:`~pydriosm.reader.quantized.QuantizedGeometryArray`);
+            defaults to ``None``, i.e. as it is
+        :type geometry_format: str | None
+        :return: data of the PBF layer with compact data types
+            (only data in a tabular format is compacted)
+        :rtype: pandas.DataFrame | pandas.Series | list
+
+        .. _`shapely.wkb.loads()`:
+            https://shapely.readthedocs.io/en/latest/reference/shapely.wkb.loads.html
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+            >>> from pyhelpers.dirs import cd
+
+            >>> rutland_pbf_path = cd("tests\\data\\rutland\\rutland-latest.osm.pbf")
+
+            >>> rutland_pbf = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_properties=True, layer_names='lines')
+            >>> rutland_lines = rutland_pbf['lines']
+            >>> rutland_lines['highway'].dtype.name
+            'object'
+
+            >>> rutland_lines_ = PBFReadParse.compact_pbf_layer(rutland_lines)
+            >>> rutland_lines_['highway'].dtype.name
+            'category'
+
+            >>> mem_usage, mem_usage_ = [
+            ...     x.drop(columns='geometry').memory_usage(deep=True).sum()
+            ...     for x in (rutland_lines, rutland_lines_)]
+            >>> mem_usage_ < mem_usage / 2
+            True
+
+        .. seealso::
+
+            - Examples for the method
+              :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`.
+        """
+
+        if not isinstance(layer_data, pd.DataFrame) or layer_data.empty:
+            return layer_data
+
+        if geometry_format not in {None, 'wkb', 'quantized'}:
+            raise ValueError("`geometry_format` must be one of {None, 'wkb', 'quantized'}.")
+
+        # The columns are collected into a new dataframe, since replacing the columns in place
+        # would keep the original (consolidated) data alive
+        columns = {col: layer_data[col] for col in layer_data.columns}
+
+        strings = {}  # Repeated strings share the same objects
+
+        def _share(x):
+            if isinstance(x, str):
+                return strings.setdefault(x, x)
+            if isinstance(x, dict):
+                return {_share(k): _share(v) for k, v in x.items()}
+            return x
+
+        for col in ['id', 'osm_id', 'osm_way_id']:
+            if col in columns:
+                ids = pd.to_numeric(columns[col], errors='coerce')
+                if col == 'id' and ids.notna().all():
+                    columns[col] = ids.astype('int64')
+                else:
+                    columns[col] = ids.astype('Int64')
+
+        if 'osm_id' in columns and 'id' in columns:
+            if columns['osm_id'].equals(columns['id'].astype('Int64')):
+                del columns['osm_id']
+
+        if 'properties' in columns:  # without the key 'osm_id' that duplicates 'id'
+            ids = map(str, columns['id']) if 'id' in columns else itertools.repeat(None)
+            columns['properties'] = pd.Series([
+                {_share(k): _share(v) for k, v in prop.items() if not (k == 'osm_id' and v == id_)}
+                if isinstance(prop, dict) else prop
+                for id_, prop in zip(ids, columns['properties'])],
+                index=layer_data.index, name='properties')
+
+        for col, column in columns.items():
+            if col == 'geometry' or column.dtype != object:
+                continue
+
+            values = column.dropna()
+            value_types = set(map(type, values))
+
+            if value_types <= {str} and values.nunique() <= max_category_ratio * len(values):
+                columns[col] = column.astype('category')
+            elif value_types <= {str, dict} and col != 'properties':  # (already shared)
+                columns[col] = column.map(_share, na_action='ignore')
+
+        if geometry_format == 'wkb' and 'geometry' in columns:
+            geoms = [
+                shapely.geometry.shape(x) if isinstance(x, dict) else x
+                for x in columns['geometry']]
+            columns['geometry'] = pd.Series(
+                [None if x is None else x.wkb for x in geoms], index=layer_data.index,
+                name='geometry')
+        elif geometry_format == 'quantized' and 'geometry' in columns:
+            columns['geometry'] = pd.Series(
+                QuantizedGeometryArray.from_geometry(columns['geometry']), index=layer_data.index,
+                name='geometry')
+
+        lyr_dat = pd.DataFrame(columns)
+
+        return lyr_dat
+
+    @classmethod
+    def _transform_pbf_features(cls, features, layer_name, expand, parse_geometry,
+                                parse_properties, parse_other_tags):
+        """
+        Parse features (exported as GeoJSON-like dicts) of a layer of a PBF data file.
+
+        :param features: features of a PBF layer, each of which is exported as a dict
+        :type features: list
+        :param layer_name: name (geometric type) of the PBF layer
+        :type layer_name: str
+        :param expand: whether to expand dict-like data into separate columns
+        :type expand: bool
+        :param parse_geometry: whether to represent the ``'geometry'`` field
+            in a `shapely.geometry`_ format
+        :type parse_geometry: bool
+        :param parse_properties: whether to represent the ``'properties'`` field
+            in a tabular format
+        :type parse_properties: bool
+        :param parse_other_tags: whether to represent the ``'other_tags'`` (of ``'properties'``)
+            in a `dict`_ format
+        :type parse_other_tags: bool
+        :return: readable data of the features
+        :rtype: pandas.DataFrame | pandas.Series
+
+        .. _`shapely.geometry`:
+            https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
+        .. _`dict`:
+            https://docs.python.org/3/library/stdtypes.html#dict
+        """
+
+        if expand:
+            lyr_dat = pd.DataFrame(features)
+        else:
+            lyr_dat = pd.Series(data=features, name=layer_name)
+
+        layer_data = cls.transform_pbf_layer_field(
+            layer_data=lyr_dat, layer_name=layer_name, parse_geometry=parse_geometry,
+            parse_properties=parse_properties, parse_other_tags=parse_other_tags)
+
+        return layer_data
+
     @classmethod
     def _read_pbf_layer(cls, layer, readable, expand, parse_geometry, parse_properties,
                         parse_other_tags):
@@ -1637,13 +3058,8 @@ class PBFReadParse(Transformer):
 
             dat = [f.ExportToJson(as_object=True) for f in layer]
 
-            if expand:
-                lyr_dat = pd.DataFrame(dat)
-            else:
-                lyr_dat = pd.Series(data=dat, name=layer_name)
-
-            layer_data = cls.transform_pbf_layer_field(
-                layer_data=lyr_dat, layer_name=layer_name, parse_geometry=parse_geometry,
+            layer_data = cls._transform_pbf_features(
+                features=dat, layer_name=layer_name, expand=expand, parse_geometry=parse_geometry,
                 parse_properties=parse_properties, parse_other_tags=parse_other_tags)
 
         else:
@@ -1655,8 +3071,285 @@ class PBFReadParse(Transformer):
 
         return layer_data
 
+    @staticmethod
+    def get_chunk_memory_limit(max_chunk_memory):
+        """
+        Get the memory budget for parsing a chunk of features.
+
+        :param max_chunk_memory: memory budget (in MB) for each chunk, or ``'auto'``
+            for a quarter of the memory that is currently available (or 1024 MB if it is unknown)
+        :type max_chunk_memory: int | float | str
+        :return: memory budget (in MB) for each chunk
+        :rtype: int | float
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+
+            >>> PBFReadParse.get_chunk_memory_limit(500)
+            500
+            >>> PBFReadParse.get_chunk_memory_limit('auto') > 0
+            True
+        """
+
+        if max_chunk_memory == 'auto':
+            available_memory = get_available_memory()
+            max_chunk_memory_ = 1024 if available_memory is None else available_memory / 4
+        else:
+            max_chunk_memory_ = max_chunk_memory
+
+        return max_chunk_memory_
+
+    @staticmethod
+    def _get_deep_size(obj):
+        # Size (in bytes) of an object, including the objects (e.g. coordinates) nested within it
+        size, objs = 0, [obj]
+
+        while objs:
+            x = objs.pop()
+            size += sys.getsizeof(x)
+            if isinstance(x, dict):  # Keys are mostly the same (interned) strings
+                objs.extend(x.values())
+            elif isinstance(x, (list, tuple)):
+                objs.extend(x)
+            elif isinstance(x, shapely.geometry.base.BaseGeometry):
+                # The coordinates are held by GEOS, i.e. (up to) three doubles per vertex
+                size += int(shapely.get_num_coordinates(x)) * 24
+
+        return size
+
     @classmethod
-    def _read_pbf_layer_chunkwise(cls, layer, number_of_chunks, **kwargs):
+    def estimate_memory_usage(cls, data):
+        """
+        Estimate the memory used by (a chunk of) parsed data.
+
+        Unlike `pandas.DataFrame.memory_usage()`_ (even with ``deep=True``), the size of
+        the objects that are nested within the values, e.g. the coordinates of GeoJSON-like
+        geometry, and the vertices of `shapely.geometry`_ objects are included.
+
+        :param data: parsed data, e.g. of a chunk of features
+        :type data: pandas.DataFrame | pandas.Series | list
+        :return: estimated memory (in bytes) used by the data
+        :rtype: int
+
+        .. _`pandas.DataFrame.memory_usage()`:
+            https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.memory_usage.html
+        .. _`shapely.geometry`:
+            https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+            >>> import pandas as pd
+
+            >>> coords = [[-0.4528259 + i * 1e-5, 52.6993113] for i in range(1000)]
+            >>> geom = pd.Series([{'type': 'LineString', 'coordinates': coords}])
+            >>> geom.memory_usage(index=False, deep=True) < 1000
+            True
+            >>> PBFReadParse.estimate_memory_usage(geom) > 1000 * 100
+            True
+        """
+
+        if isinstance(data, pd.Series):
+            data = data.to_frame()
+
+        if isinstance(data, pd.DataFrame):
+            data_size = 0
+            for _, column in data.items():
+                if column.dtype == object:
+                    values = column.to_numpy()
+                    data_size += values.nbytes + sum(map(cls._get_deep_size, values))
+                else:
+                    data_size += column.memory_usage(index=False, deep=True)
+        else:
+            data_size = sum(map(cls._get_deep_size, data))
+
+        return int(data_size)
+
+    @classmethod
+    def iter_chunks_adaptively(cls, features, parse_chunk, max_chunk_memory,
+                               initial_chunk_size=1000):
+        """
+        Parse features chunk by chunk, with the size of each chunk adapted to a memory budget.
+
+        The memory used by the parsed data of each chunk is estimated per feature
+        (see the method :meth:`PBFReadParse.estimate_memory_usage()
+        <pydriosm.reader.PBFReadParse.estimate_memory_usage>`), from which the number of
+        features in the next chunk is estimated to keep the data of a chunk within the budget.
+        The features are taken from an iterable (e.g. a layer) only as each chunk is parsed.
+
+        :param features: features of a layer
+        :type features: typing.Iterable
+        :param parse_chunk: function that parses a list of features,
+            e.g. into a `pandas.DataFrame`_
+        :type parse_chunk: typing.Callable
+        :param max_chunk_memory: memory budget (in MB) for the parsed data of each chunk;
+            see also the method :meth:`PBFReadParse.get_chunk_memory_limit()
+            <pydriosm.reader.PBFReadParse.get_chunk_memory_limit>`
+        :type max_chunk_memory: int | float | str
+        :param initial_chunk_size: number of features in the first chunk, defaults to ``1000``
+        :type initial_chunk_size: int
+        :return: parsed data of each chunk
+        :rtype: typing.Generator[pandas.DataFrame | pandas.Series]
+
+        .. _`pandas.DataFrame`:
+            https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
+
+        **Examples**::
+
+            >>> from pydriosm.reader import PBFReadParse
+            >>> import pandas as pd
+
+            >>> features = [{'id': i, 'name': f'feature_{i}'} for i in range(10000)]
+            >>> chunks = list(PBFReadParse.iter_chunks_adaptively(
+            ...     features, pd.DataFrame, max_chunk_memory=0.1, initial_chunk_size=100))
+            >>> sum(len(x) for x in chunks)
+            10000
+            >>> len(chunks[1]) > len(chunks[0])
+            True
+        """
+
+        max_chunk_bytes = cls.get_chunk_memory_limit(max_chunk_memory) * 2 ** 20
+
+        features_, chunk_size = iter(features), max(1, initial_chunk_size)
+
+        chunk = list(itertools.islice(features_, chunk_size))
+        while chunk:
+            chunk_data = parse_chunk(chunk)
+            data_size = cls.estimate_memory_usage(chunk_data)
+
+            # Resize the next chunk based on the memory used per feature by this chunk
+            chunk_size = max(1, int(max_chunk_bytes / max(data_size / len(chunk), 1)))
+
+            yield chunk_data
+
+            chunk = list(itertools.islice(features_, chunk_size))
+
+    @classmethod
+    def _open_pbf(cls, pbf_pathname, layer_names=None, tag_filter=None, bbox=None, mask=None,
+                  layer_attributes=None):
+        """
+        Open a PBF data file (by `GDAL/OGR <https://gdal.org>`_) and get its layers,
+        with the features of the layers being filtered.
+
+        :param pbf_pathname: pathname of a PBF data file
+        :type pbf_pathname: str
+        :param layer_names: name of a PBF layer, or names of multiple layers,
+            defaults to ``None`` (i.e. all available layers)
+        :type layer_names: str | list | None
+        :param tag_filter: tags by which features are selected, defaults to ``None``
+        :type tag_filter: dict | str | None
+        :param bbox: bounding box within which features are selected, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param layer_attributes: tags to be reported as fields of the layers, defaults to ``None``
+        :type layer_attributes: dict | list | None
+        :return: the opened data file (which has to be kept for reading the layers)
+            and the layers
+        :rtype: tuple
+
+        See examples for the method
+        :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`.
+        """
+
+        osgeo_ogr, osgeo_gdal = map(_check_dependency, ['osgeo.ogr', 'osgeo.gdal'])
+
+        if layer_attributes:
+            osm_config_file = osgeo_gdal.GetConfigOption('OSM_CONFIG_FILE')
+            default_osm_config_file = osm_config_file or osgeo_gdal.FindFile('gdal', 'osmconf.ini')
+            osm_config = cls.make_osm_config(layer_attributes, default_osm_config_file)
+
+            # The configuration is loaded when the PBF data file is opened
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_osm_config_file = os.path.join(temp_dir, "osmconf.ini")
+                with open(temp_osm_config_file, mode='w', encoding='utf-8') as osm_conf:
+                    osm_conf.write(osm_config)
+
+                osgeo_gdal.SetConfigOption('OSM_CONFIG_FILE', temp_osm_config_file)
+                try:
+                    f = osgeo_ogr.Open(pbf_pathname)
+                finally:
+                    osgeo_gdal.SetConfigOption('OSM_CONFIG_FILE', osm_config_file)
+
+        else:
+            f = osgeo_ogr.Open(pbf_pathname)
+
+        layer_names_ = cls.validate_pbf_layer_names(layer_names)
+        if layer_names_:
+            layers = [f.GetLayerByName(layer_name) for layer_name in layer_names_]
+        else:
+            layers = [f.GetLayerByIndex(i) for i in range(f.GetLayerCount())]
+
+        if tag_filter:
+            for layer in layers:
+                layer_defn = layer.GetLayerDefn()
+                field_names = [
+                    layer_defn.GetFieldDefn(i).GetName() for i in range(layer_defn.GetFieldCount())]
+                layer.SetAttributeFilter(cls.make_attribute_filter(tag_filter, field_names))
+
+        bbox, mask = _validate_spatial_filter(bbox=bbox, mask=mask)
+        if bbox is not None:
+            for layer in layers:
+                layer.SetSpatialFilterRect(*bbox)
+        elif mask is not None:
+            spatial_filter = osgeo_ogr.CreateGeometryFromWkb(mask.wkb)
+            for layer in layers:
+                layer.SetSpatialFilter(spatial_filter)
+
+        return f, layers
+
+    @classmethod
+    def _read_pbf_layer_range(cls, pbf_pathname, layer_name, start, stop, open_args=None,
+                              gdal_args=None, **kwargs):
+        """
+        Open a PBF data file and parse a range of the features of a layer.
+
+        This is run in a worker process, which reads the features on its own
+        (rather than receiving them, exported, from the main process).
+
+        :param pbf_pathname: pathname of a PBF data file
+        :type pbf_pathname: str
+        :param layer_name: name of a PBF layer
+        :type layer_name: str
+        :param start: index of the first feature in the range
+        :type start: int
+        :param stop: index after the last feature in the range
+        :type stop: int
+        :param open_args: parameters of the method :meth:`PBFReadParse._open_pbf()
+            <pydriosm.reader.PBFReadParse._open_pbf>`, defaults to ``None``
+        :type open_args: dict | None
+        :param gdal_args: parameters of the function
+            `pyhelpers.settings.gdal_configurations()`_, defaults to ``None``
+        :type gdal_args: dict | None
+        :param kwargs: [optional] parameters of the method
+            :meth:`PBFReadParse._read_pbf_layer()<pydriosm.reader.PBFReadParse._read_pbf_layer>`
+        :return: parsed data of the features
+        :rtype: pandas.DataFrame | pandas.Series
+
+        .. _`pyhelpers.settings.gdal_configurations()`:
+            https://pyhelpers.readthedocs.io/en/latest/_generated/
+            pyhelpers.settings.gdal_configurations.html
+        """
+
+        osgeo_gdal = _check_dependency(name='osgeo.gdal')
+        osgeo_gdal.PushErrorHandler('CPLQuietErrorHandler')
+        osgeo_gdal.UseExceptions()
+        gdal_configurations(**(gdal_args or {}))
+
+        f, (layer,) = cls._open_pbf(pbf_pathname, layer_names=[layer_name], **(open_args or {}))
+
+        # The OSM driver cannot seek to a feature, so that all the features before the range are
+        # still decoded (though not exported or parsed), i.e. the later the range, the more
+        # of the file is decoded for it
+        layer.SetNextByIndex(start)
+        features = list(itertools.islice(iter(layer.GetNextFeature, None), stop - start))
+
+        return cls._read_pbf_layer(features + [layer_name], **kwargs)
+
+    @classmethod
+    def _read_pbf_layer_chunkwise(cls, layer, number_of_chunks, workers=None,
+                                  max_chunk_memory=None, pbf_source=None, **kwargs):
         """
         Parse a layer of a PBF data file chunk-wisely.
 
@@ -1664,6 +3357,24 @@ class PBFReadParse(Transformer):
         :type layer: osgeo.ogr.Layer
         :param number_of_chunks: number of chunks
         :type number_of_chunks: int
+        :param workers: number of worker processes across which the chunks are parsed,
+            defaults to ``None`` (i.e. the chunks are parsed one after another);
+            it applies only when ``readable=True`` or ``expand=True``
+        :type workers: int | None
+        :param max_chunk_memory: memory budget (in MB) for the parsed data of each chunk,
+            to which the size of the chunks is adapted instead of ``number_of_chunks``,
+            defaults to ``None``; it applies only when ``workers`` is not specified
+            (see the method :meth:`PBFReadParse.iter_chunks_adaptively()
+            <pydriosm.reader.PBFReadParse.iter_chunks_adaptively>`)
+        :type max_chunk_memory: int | float | str | None
+        :param pbf_source: (when ``workers`` is specified) pathname of the PBF data file
+            (``'pbf_pathname'``) and the parameters with which it is opened (``'open_args'``
+            and ``'gdal_args'``), so that each worker process reads its chunk on its own,
+            defaults to ``None``; when ``pbf_source=None`` (or the features of the layer cannot
+            be counted), the features are exported in the current process and then passed to
+            the worker processes; note that a worker process decodes all the features before
+            its chunk, since the OSM driver of GDAL cannot seek to a feature
+        :type pbf_source: dict | None
         :param kwargs: [optional] parameters of the method
             :meth:`PBFReadParse._read_pbf_layer()<pydriosm.reader.PBFReadParse._read_pbf_layer>`
         :return: data of the given layer of the given OSM PBF layer
@@ -1674,13 +3385,62 @@ class PBFReadParse(Transformer):
         """
 
         layer_name = layer.GetName()
-        layer_chunks = split_list(lst=[f for f in layer], num_of_sub=number_of_chunks)
+        readable = kwargs['readable'] or kwargs['expand']
+
+        number_of_features = -1
+        if workers and workers > 1 and readable and pbf_source is not None:
+            # The OSM driver keeps no count of the features: it decodes the whole file to count
+            # them, or returns -1, in which case the features are exported here instead
+            number_of_features = layer.GetFeatureCount()
+
+        if number_of_features >= 0:
+            # Each worker process opens the PBF data file and reads a range of the features
+            bounds = [number_of_features * i // number_of_chunks for i in range(number_of_chunks)]
+            bounds.append(number_of_features)
+
+            # The temporary storage of the OSM driver (held in memory up to 'max_tmpfile_size' MB)
+            # is allocated by every worker process, so its size is shared between them
+            gdal_args = dict(pbf_source.get('gdal_args') or {})
+            max_tmpfile_size = gdal_args.get('max_tmpfile_size') or 5000
+            gdal_args.update({'max_tmpfile_size': max(max_tmpfile_size // workers, 1)})
+
+            read_args = {'layer_name': layer_name, **pbf_source, 'gdal_args': gdal_args, **kwargs}
+            ranges = [(i, j) for i, j in zip(bounds[:-1], bounds[1:]) if j > i] or [(0, 0)]
+            with multiprocessing.Pool(processes=workers) as p:
+                results = [
+                    p.apply_async(
+                        cls._read_pbf_layer_range, kwds={**read_args, 'start': i, 'stop': j})
+                    for i, j in ranges]
+                list_of_layer_dat = [x.get() for x in results]
+
+        elif workers and workers > 1 and readable:
+            # The features are exported (as dicts) here, since they cannot be passed to processes
+            # (and are then split into chunks)
+            layer_chunks = split_list(
+                lst=[f.ExportToJson(as_object=True) for f in layer], num_of_sub=number_of_chunks)
+
+            transform_args = {k: v for k, v in kwargs.items() if k != 'readable'}
+            with multiprocessing.Pool(processes=workers) as p:
+                list_of_layer_dat = p.starmap(
+                    functools.partial(cls._transform_pbf_features, **transform_args),
+                    [(lyr, layer_name) for lyr in layer_chunks])
+
+        elif max_chunk_memory and readable:
+            list_of_layer_dat = list(cls.iter_chunks_adaptively(
+                features=layer, max_chunk_memory=max_chunk_memory,
+                parse_chunk=lambda lyr: cls._read_pbf_layer(lyr + [layer_name], **kwargs)))
+
+        else:
+            layer_chunks = split_list(lst=[f for f in layer], num_of_sub=number_of_chunks)
 
-        list_of_layer_dat = [
-            cls._read_pbf_layer(lyr + [layer_name], **kwargs) for lyr in layer_chunks]
+            list_of_layer_dat = [
+                cls._read_pbf_layer(lyr + [layer_name], **kwargs) for lyr in layer_chunks]
 
-        if kwargs['readable']:
+        if readable:
             layer_data = pd.concat(objs=list_of_layer_dat, axis=0, ignore_index=True)
+            if isinstance(layer_data, pd.DataFrame) and 'id' in layer_data.columns:
+                # Each chunk is sorted by id, so the chunks are merged only if they overlap
+                layer_data = sort_layer_data(layer_data, by='id')
         else:
             layer_data = [dat for chunk in list_of_layer_dat for dat in chunk]
 
@@ -1688,7 +3448,8 @@ class PBFReadParse(Transformer):
 
     @classmethod
     def read_pbf_layer(cls, layer, readable=True, expand=False, parse_geometry=False,
-                       parse_properties=False, parse_other_tags=False, number_of_chunks=None):
+                       parse_properties=False, parse_other_tags=False, number_of_chunks=None,
+                       workers=None, max_chunk_memory=None, pbf_source=None):
         """
         Parse a layer of a PBF data file.
 
@@ -1709,6 +3470,19 @@ class PBFReadParse(Transformer):
         :type parse_other_tags: bool
         :param number_of_chunks: number of chunks, defaults to ``None``
         :type number_of_chunks: int | None
+        :param workers: number of worker processes across which the chunks are parsed,
+            defaults to ``None``; when ``number_of_chunks`` is not specified,
+            the layer is split into as many chunks as ``workers``
+        :type workers: int | None
+        :param max_chunk_memory: memory budget (in MB) for the parsed data of each chunk,
+            to which the size of the chunks is adapted, defaults to ``None``
+        :type max_chunk_memory: int | float | str | None
+        :param pbf_source: (when ``workers`` is specified) the PBF data file and the parameters
+            with which it is opened, from which each worker process reads its chunk
+            of the features, defaults to ``None``; see the parameter ``pbf_source`` of the method
+            :meth:`PBFReadParse._read_pbf_layer_chunkwise()
+            <pydriosm.reader.PBFReadParse._read_pbf_layer_chunkwise>`
+        :type pbf_source: dict | None
         :return: parsed data of the given OSM PBF layer
         :rtype: dict
 
@@ -1733,11 +3507,15 @@ class PBFReadParse(Transformer):
             'parse_other_tags': parse_other_tags,
         }
 
-        if number_of_chunks in {None, 0, 1}:
+        if workers and workers > 1 and number_of_chunks in {None, 0, 1}:
+            number_of_chunks = workers
+
+        if number_of_chunks in {None, 0, 1} and not max_chunk_memory:
             layer_data = cls._read_pbf_layer(layer=layer, **func_args)
         else:
             layer_data = cls._read_pbf_layer_chunkwise(
-                layer=layer, number_of_chunks=number_of_chunks, **func_args)
+                layer=layer, number_of_chunks=number_of_chunks, workers=workers,
+                max_chunk_memory=max_chunk_memory, pbf_source=pbf_source, **func_args)
 
         data = {layer_name: layer_data}
 
@@ -1746,7 +3524,9 @@ class PBFReadParse(Transformer):
     @classmethod
     def read_pbf(cls, pbf_pathname, readable=True, expand=False, parse_geometry=False,
                  parse_properties=False, parse_other_tags=False, number_of_chunks=None,
-                 max_tmpfile_size=5000, **kwargs):
+                 max_tmpfile_size=5000, layer_names=None, tag_filter=None, bbox=None, mask=None,
+                 layer_attributes=None, workers=None, parallel_layers=False,
+                 max_chunk_memory=None, compact=False, geometry_format=None, **kwargs):
         """
         Parse a PBF data file (by `GDAL <https://pypi.org/project/GDAL/>`_).
 
@@ -1770,6 +3550,55 @@ class PBFReadParse(Transformer):
         :param max_tmpfile_size: maximum size of the temporary file, defaults to ``None``;
             when ``max_tmpfile_size=None``, it defaults to ``5000``
         :type max_tmpfile_size: int | None
+        :param layer_names: name of a PBF layer, e.g. 'lines', or names of multiple layers;
+            when ``layer_names=None`` (default), all available layers;
+            only the specified layers are read and parsed
+        :type layer_names: str | list | None
+        :param tag_filter: tags by which features are selected before being parsed,
+            e.g. ``{'highway': None}`` or ``{'railway': 'rail'}``, or an `OGR SQL`_ ``WHERE`` clause,
+            defaults to ``None``; see also the method
+            :meth:`PBFReadParse.make_attribute_filter()
+            <pydriosm.reader.PBFReadParse.make_attribute_filter>`
+        :type tag_filter: dict | str | None
+        :param bbox: bounding box ``(min_x, min_y, max_x, max_y)`` within which
+            the features are selected before being parsed, defaults to ``None``
+        :type bbox: tuple | list | None
+        :param mask: geometry with which the selected features intersect, defaults to ``None``
+        :type mask: shapely.geometry.base.BaseGeometry | None
+        :param layer_attributes: tags to be reported as fields of the layers (instead of
+            being packed into ``'other_tags'``), e.g. ``{'lines': ['name', 'highway', 'maxspeed']}``,
+            defaults to ``None``; when specified, a temporary osmconf.ini is made for the reading
+            (see the method :meth:`PBFReadParse.make_osm_config()
+            <pydriosm.reader.PBFReadParse.make_osm_config>`)
+        :type layer_attributes: dict | list | None
+        :param workers: number of worker processes across which the chunks of each layer are
+            read and parsed (when ``readable=True`` or ``expand=True``), defaults to ``None``;
+            each worker process opens the PBF data file and reads its own range of features
+            (decoding, but not parsing, all the features before the range);
+            when ``number_of_chunks`` is not specified, each layer is split into
+            as many chunks as ``workers``
+        :type workers: int | None
+        :param parallel_layers: (when ``workers`` is specified) whether to read the layers
+            in separate worker processes instead, each of which opens the PBF data file on its own,
+            defaults to ``False``
+        :type parallel_layers: bool
+        :param max_chunk_memory: memory budget (in MB) for the parsed data of each chunk,
+            e.g. ``500``, or ``'auto'`` for a quarter of the available memory,
+            defaults to ``None``; when specified, each layer is parsed in chunks whose size is
+            adapted to the budget (instead of ``number_of_chunks``), see the method
+            :meth:`PBFReadParse.iter_chunks_adaptively()
+            <pydriosm.reader.PBFReadParse.iter_chunks_adaptively>`
+        :type max_chunk_memory: int | float | str | None
+        :param compact: (when ``expand=True``) whether to represent the parsed data of each layer
+            with compact data types (e.g. categorical tags), defaults to ``False``;
+            see the method :meth:`PBFReadParse.compact_pbf_layer()
+            <pydriosm.reader.PBFReadParse.compact_pbf_layer>`
+        :type compact: bool
+        :param geometry_format: (when ``compact=True``) format of the ``'geometry'`` column,
+            options include ``{None, 'wkb', 'quantized'}``, defaults to ``None``;
+            the geometry objects take most of the memory of the parsed data, which is little
+            reduced by compact data types of the tags unless the geometry is compacted as well
+        :type geometry_format: str | None
         :param kwargs: [optional] parameters of the function
             `pyhelpers.settings.gdal_configurations()`_
         :return: parsed OSM PBF data
@@ -1782,6 +3611,7 @@ class PBFReadParse(Transformer):
         .. _`pyhelpers.settings.gdal_configurations()`:
             https://pyhelpers.readthedocs.io/en/latest/_generated/
             pyhelpers.settings.gdal_configurations.html
+        .. _`OGR SQL`: https://gdal.org/user/ogr_sql_dialect.html
 
         .. note::
 
@@ -1849,6 +3679,50 @@ class PBFReadParse(Transformer):
             4    {'type': 'Feature', 'geometry': {'type': 'Poin...
             Name: points, dtype: object
 
+            >>> # Read only the layer of 'lines'
+            >>> rutland_pbf_lines = PBFReadParse.read_pbf(rutland_pbf_path, layer_names='lines')
+            >>> list(rutland_pbf_lines.keys())
+            ['lines']
+
+            >>> # Read only the features tagged with 'highway' from the layer of 'lines'
+            >>> rutland_highways = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_properties=True, layer_names='lines',
+            ...     tag_filter={'highway': None})
+            >>> rutland_highways['lines']['highway'].isna().any()
+            False
+
+            >>> # Read only the features within a bounding box (around Oakham)
+            >>> oakham_lines = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, layer_names='lines', bbox=(-0.76, 52.66, -0.70, 52.69))
+            >>> len(oakham_lines['lines']) < len(rutland_pbf_lines['lines'])
+            True
+
+            >>> # Report the tag 'maxspeed' as a field of the layer of 'lines'
+            >>> rutland_maxspeed = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_properties=True, layer_names='lines',
+            ...     layer_attributes={'lines': ['name', 'highway', 'maxspeed']})
+            >>> 'maxspeed' in rutland_maxspeed['lines'].columns
+            True
+
+            >>> # Parse the features (in chunks) with four worker processes
+            >>> rutland_pbf_4 = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_geometry=True, workers=4)
+            >>> rutland_pbf_4['lines']['id'].is_monotonic_increasing
+            True
+
+            >>> # Represent the parsed tags with compact data types
+            >>> rutland_pbf_c = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_properties=True, compact=True)
+            >>> rutland_pbf_c['lines']['highway'].dtype.name
+            'category'
+
+            >>> # Quantize the coordinates of the geometry objects as well
+            >>> rutland_pbf_q = PBFReadParse.read_pbf(
+            ...     rutland_pbf_path, expand=True, parse_geometry=True, parse_properties=True,
+            ...     compact=True, geometry_format='quantized')
+            >>> rutland_pbf_q['lines']['geometry'].dtype
+            quantized_geometry
+
             >>> # Set `expand` to be `True`
             >>> pbf_0 = PBFReadParse.read_pbf(rutland_pbf_path, expand=True)
             >>> type(pbf_0)
@@ -1922,7 +3796,31 @@ class PBFReadParse(Transformer):
               and :meth:`BBBikeReader.read_osm_pbf()<pydriosm.reader.BBBikeReader.read_osm_pbf>`.
         """
 
-        osgeo_ogr, osgeo_gdal = map(_check_dependency, ['osgeo.ogr', 'osgeo.gdal'])
+        osgeo_gdal = _check_dependency(name='osgeo.gdal')
+
+        if workers and workers > 1 and parallel_layers and (readable or expand):
+            layer_names_ = cls.validate_pbf_layer_names(layer_names if layer_names else 'all')
+            read_args = {
+                'pbf_pathname': pbf_pathname, 'readable': readable, 'expand': expand,
+                'parse_geometry': parse_geometry, 'parse_properties': parse_properties,
+                'parse_other_tags': parse_other_tags, 'number_of_chunks': number_of_chunks,
+                'max_tmpfile_size': max_tmpfile_size, 'tag_filter': tag_filter, 'bbox': bbox,
+                'mask': mask, 'layer_attributes': layer_attributes,
+                'max_chunk_memory': max_chunk_memory, 'compact': compact,
+                'geometry_format': geometry_format,
+            }
+
+            # Each worker process opens the PBF data file and reads one layer
+            read_args.update(kwargs)
+            with multiprocessing.Pool(processes=min(workers, len(layer_names_))) as p:
+                results = [
+                    p.apply_async(cls.read_pbf, kwds={**read_args, 'layer_names': [x]})
+                    for x in layer_names_]
+                collection_of_layer_data = [x.get() for x in results]
+
+            data = dict(collections.ChainMap(*reversed(collection_of_layer_data)))
+
+            return data
 
         # Reference: https://gis.stackexchange.com/questions/332327/
         # Stop GDAL printing both warnings and errors to STDERR
@@ -1940,18 +3838,35 @@ class PBFReadParse(Transformer):
             'parse_properties': parse_properties,
             'parse_other_tags': parse_other_tags,
             'number_of_chunks': number_of_chunks,
+            'workers': workers,
+            'max_chunk_memory': max_chunk_memory,
         }
 
-        f = osgeo_ogr.Open(pbf_pathname)
+        f, layers = cls._open_pbf(
+            pbf_pathname, layer_names=layer_names, tag_filter=tag_filter, bbox=bbox, mask=mask,
+            layer_attributes=layer_attributes)
+
+        if workers and workers > 1 and (readable or expand):
+            # Worker processes open the PBF data file in the same way and read their own chunks
+            func_args.update({'pbf_source': {
+                'pbf_pathname': pbf_pathname,
+                'open_args': {
+                    'tag_filter': tag_filter, 'bbox': bbox, 'mask': mask,
+                    'layer_attributes': layer_attributes},
+                'gdal_args': kwargs}})
 
         # Get a collection of parsed layer data
-        collection_of_layer_data = [
-            cls.read_pbf_layer(f.GetLayerByIndex(i), **func_args) for i in range(f.GetLayerCount())]
+        collection_of_layer_data = [cls.read_pbf_layer(layer, **func_args) for layer in layers]
 
         # Make the output in a dictionary form:
         # {Layer1 name: Layer1 data, Layer2 name: Layer2 data, ...}
         data = dict(collections.ChainMap(*reversed(collection_of_layer_data)))
 
+        if compact:
+            data = {
+                k: cls.compact_pbf_layer(v, geometry_format=geometry_format)
+                for k, v in data.items()}
+
         return data
 
 
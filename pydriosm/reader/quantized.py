@@ -0,0 +1,401 @@
+"""
+Hold the geometry of OSM features with integer-quantized coordinates in contiguous arrays.
+"""
+
+import numbers
+
+import numpy as np
+import pandas as pd
+import shapely.geometry
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype
+
+
+@register_extension_dtype
+class QuantizedGeometryDtype(ExtensionDtype):
+    """
+    Data type of a column of geometry held in a
+    :class:`~pydriosm.reader.quantized.QuantizedGeometryArray`,
+    which can be specified as ``'quantized_geometry'``.
+    """
+
+    #: str: Name of the data type.
+    name = 'quantized_geometry'
+    #: type: Type of the (decoded) values.
+    type = object
+    #: str: Kind of the data type.
+    kind = 'O'
+    #: None: Missing value.
+    na_value = None
+
+    def __repr__(self):
+        return self.name
+
+    @classmethod
+    def construct_array_type(cls):
+        """
+        Get the array type associated with this data type.
+
+        :return: the class :class:`~pydriosm.reader.quantized.QuantizedGeometryArray`
+        :rtype: type
+        """
+
+        return QuantizedGeometryArray
+
+
+class QuantizedGeometryArray(ExtensionArray):
+    """
+    An array of geometry objects whose coordinates are quantized to (OSM-native) 1e-7 degree
+    as 32-bit integers and kept in a contiguous buffer with offsets per feature.
+
+    Each vertex takes 8 bytes (instead of, e.g., a tuple of two floats, or a list within
+    GeoJSON-like dicts, which takes around 100 bytes), and a geometry object is decoded into
+    a `shapely.geometry`_ object (or a list of coordinate tuples, if it is given as such,
+    e.g. the ``'coordinates'`` of shapefile data) only when it is accessed.
+    It can be held in a column of a `pandas.DataFrame`_, so that the layer data can still be
+    sorted, sliced, concatenated and saved. Assigning geometry objects to (some of) the items,
+    e.g. ``layer_data.loc[0, 'geometry'] = geom``, quantizes them and rebuilds the buffer,
+    which takes time in proportion to the size of the whole array.
+
+    .. _`shapely.geometry`:
+        https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
+    .. _`pandas.DataFrame`:
+        https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
+
+    **Examples**::
+
+        >>> from pydriosm.reader import PBFReadParse, QuantizedGeometryArray
+        >>> import pandas as pd
+
+        >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+        >>> rutland_pbf = PBFReadParse.read_pbf(
+        ...     rutland_pbf_path, expand=True, parse_geometry=True, layer_names='lines')
+        >>> rutland_lines = rutland_pbf['lines']
+
+        >>> lines_geom = QuantizedGeometryArray.from_geometry(rutland_lines['geometry'])
+        >>> lines_geom.dtype
+        quantized_geometry
+        >>> lines_geom[0]
+        <LINESTRING (-0.453 52.699, -0.452 52.699, -0.452 52.699, -0.451 52.698, -0....>
+
+        >>> lines_geom_ = pd.Series(lines_geom, name='geometry')
+        >>> lines_geom_.head(3)
+        0    LINESTRING (-0.4528083 52.6993402, -0.4521571 ...
+        1    LINESTRING (-0.7246057 52.5964195, -0.7245154 ...
+        2    LINESTRING (-0.6467097 52.5935345, -0.645902 5...
+        Name: geometry, dtype: quantized_geometry
+
+        >>> mem_usage = rutland_lines['geometry'].map(lambda x: x.wkb).map(len).sum()
+        >>> lines_geom.nbytes < mem_usage
+        True
+    """
+
+    #: int: Number of units per degree, i.e. the precision of the coordinates is 1e-7 degree.
+    SCALE = 10 ** 7
+
+    #: int: Type of a list of coordinate tuples (alongside the type IDs of `shapely`_ geometry).
+    #:
+    #: .. _`shapely`: https://shapely.readthedocs.io/en/stable/reference/shapely.get_type_id.html
+    COORDINATE_LIST = -1
+
+    def __init__(self, coords, coord_offsets, parts, part_offsets, null):
+        """
+        :param coords: quantized coordinates of all the geometry objects, in the shape of ``(n, 2)``
+        :type coords: numpy.ndarray
+        :param coord_offsets: offsets of the coordinates of each geometry object
+        :type coord_offsets: numpy.ndarray
+        :param parts: type IDs and sizes of the (nested) parts of all the geometry objects
+        :type parts: numpy.ndarray
+        :param part_offsets: offsets of the parts of each geometry object
+        :type part_offsets: numpy.ndarray
+        :param null: whether each geometry object is missing
+        :type null: numpy.ndarray
+
+        :ivar numpy.ndarray coords: quantized coordinates (of ``numpy.int32``)
+        :ivar numpy.ndarray coord_offsets: offsets of the coordinates of each geometry object
+        :ivar numpy.ndarray parts: type IDs and sizes of the parts of the geometry objects
+        :ivar numpy.ndarray part_offsets: offsets of the parts of each geometry object
+        :ivar numpy.ndarray null: whether each geometry object is missing
+        """
+
+        self.coords = coords
+        self.coord_offsets = coord_offsets
+        self.parts = parts
+        self.part_offsets = part_offsets
+        self.null = null
+
+    @classmethod
+    def _encode_parts(cls, geom, parts):
+        type_id = int(shapely.get_type_id(geom))
+
+        if type_id in {0, 1, 2}:  # Point, LineString, LinearRing
+            parts += [type_id, int(shapely.get_num_coordinates(geom))]
+
+        elif type_id == 3:  # Polygon
+            rings = [geom.exterior, *geom.interiors] if not geom.is_empty else []
+            parts += [type_id, len(rings), *(len(x.coords) for x in rings)]
+
+        else:  # Multi-part geometry and geometry collection
+            parts += [type_id, int(shapely.get_num_geometries(geom))]
+            for x in geom.geoms:
+                cls._encode_parts(x, parts)
+
+    @classmethod
+    def from_geometry(cls, geometry):
+        """
+        Quantize geometry objects.
+
+        :param geometry: geometry objects, which are either `shapely.geometry`_ objects,
+            GeoJSON-like dicts or lists of coordinate tuples, where missing values are ``None``
+        :type geometry: typing.Iterable
+        :return: array of the geometry objects with quantized coordinates
+        :rtype: QuantizedGeometryArray
+        :raises ValueError: if any coordinate cannot be held as a 32-bit integer, i.e. beyond
+            (approximately) ±214.748 degrees (e.g. the coordinates are not longitude/latitude)
+
+        .. _`shapely.geometry`:
+            https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
+
+        .. seealso::
+
+            - Examples for the class :class:`~pydriosm.reader.quantized.QuantizedGeometryArray`.
+        """
+
+        if isinstance(geometry, cls):
+            return geometry.copy()
+
+        coords, parts, coord_counts, part_counts, null = [], [], [], [], []
+
+        for geom in geometry:
+            is_null = geom is None or (isinstance(geom, float) and np.isnan(geom))
+            feat_parts = []
+
+            if is_null:
+                xy = np.empty((0, 2))
+            elif isinstance(geom, list):
+                feat_parts += [cls.COORDINATE_LIST, len(geom)]
+                xy = np.asarray(geom, dtype=float).reshape(-1, 2)
+            else:
+                if isinstance(geom, dict):
+                    geom = shapely.geometry.shape(geom)
+                cls._encode_parts(geom, feat_parts)
+                xy = shapely.get_coordinates(geom)
+
+            coords.append(xy)
+            parts += feat_parts
+            coord_counts.append(len(xy))
+            part_counts.append(len(feat_parts))
+            null.append(is_null)
+
+        coords = np.concatenate(coords) if coords else np.empty((0, 2))
+        coords = np.round(coords * cls.SCALE)
+
+        int32_info = np.iinfo(np.int32)
+        if not np.all((coords >= int32_info.min) & (coords <= int32_info.max)):  # incl. NaN
+            raise ValueError(
+                f"Coordinates must be finite and within ±{int32_info.max / cls.SCALE} degrees "
+                f"to be quantized as 32-bit integers.")
+
+        return cls(
+            coords=coords.astype(np.int32),
+            coord_offsets=np.concatenate([[0], np.cumsum(coord_counts, dtype=np.int64)]),
+            parts=np.asarray(parts, dtype=np.int32),
+            part_offsets=np.concatenate([[0], np.cumsum(part_counts, dtype=np.int64)]),
+            null=np.asarray(null, dtype=bool))
+
+    @classmethod
+    def _decode_parts(cls, parts, xy):
+        type_id, size, parts = parts[0], parts[1], parts[2:]
+
+        if type_id == cls.COORDINATE_LIST:
+            return list(map(tuple, xy[:size].tolist())), parts, xy[size:]
+
+        if type_id == 0:  # Point
+            geom = shapely.geometry.Point(xy[0]) if size else shapely.geometry.Point()
+            return geom, parts, xy[size:]
+
+        if type_id in {1, 2}:  # LineString, LinearRing
+            geom_class = {1: shapely.geometry.LineString, 2: shapely.geometry.LinearRing}[type_id]
+            return geom_class(xy[:size]), parts, xy[size:]
+
+        if type_id == 3:  # Polygon, whose rings are of the sizes given by the parts
+            ring_sizes, parts = parts[:size], parts[size:]
+            ring_ends = np.cumsum([0] + ring_sizes)
+            rings = [xy[i:j] for i, j in zip(ring_ends[:-1], ring_ends[1:])]
+            geom = shapely.geometry.Polygon(rings[0], rings[1:]) if rings \
+                else shapely.geometry.Polygon()
+            return geom, parts, xy[ring_ends[-1]:]
+
+        geoms = []
+        for _ in range(size):
+            geom, parts, xy = cls._decode_parts(parts, xy)
+            geoms.append(geom)
+
+        geom_class = {
+            4: shapely.geometry.MultiPoint, 5: shapely.geometry.MultiLineString,
+            6: shapely.geometry.MultiPolygon, 7: shapely.geometry.GeometryCollection,
+        }[type_id]
+
+        return geom_class(geoms), parts, xy
+
+    def _decode(self, i):
+        if self.null[i]:
+            return None
+
+        parts = self.parts[self.part_offsets[i]:self.part_offsets[i + 1]].tolist()
+        xy = self.coords[self.coord_offsets[i]:self.coord_offsets[i + 1]] / self.SCALE
+
+        return self._decode_parts(parts, xy)[0]
+
+    @staticmethod
+    def _gather(buffer, offsets, indices, missing):
+        # Gather the (variable-length) items of the given indices into a new buffer with offsets
+        starts = np.where(missing, 0, offsets[indices])
+        counts = np.where(missing, 0, offsets[indices + 1] - offsets[indices])
+        offsets_ = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+        positions = np.repeat(starts - offsets_[:-1], counts) + np.arange(offsets_[-1])
+
+        return buffer[positions], offsets_
+
+    def to_geometry(self):
+        """
+        Decode all the geometry objects.
+
+        :return: array of `shapely.geometry`_ objects (or lists of coordinate tuples)
+        :rtype: numpy.ndarray
+
+        .. _`shapely.geometry`:
+            https://shapely.readthedocs.io/en/latest/manual.html#geometric-objects
+        """
+
+        geometry = np.empty(len(self), dtype=object)
+        for i in range(len(self)):
+            geometry[i] = self._decode(i)
+
+        return geometry
+
+    # Interface of pandas.api.extensions.ExtensionArray
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        return cls.from_geometry(scalars)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls.from_geometry(values)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+
+        def _concat_offsets(name, size_name):
+            offsets, end = [np.zeros(1, dtype=np.int64)], 0
+            for x in to_concat:
+                offsets.append(getattr(x, name)[1:] + end)
+                end += len(getattr(x, size_name))
+            return np.concatenate(offsets)
+
+        return cls(
+            coords=np.concatenate([x.coords for x in to_concat]),
+            coord_offsets=_concat_offsets('coord_offsets', 'coords'),
+            parts=np.concatenate([x.parts for x in to_concat]),
+            part_offsets=_concat_offsets('part_offsets', 'parts'),
+            null=np.concatenate([x.null for x in to_concat]))
+
+    @property
+    def dtype(self):
+        return QuantizedGeometryDtype()
+
+    @property
+    def nbytes(self):
+        return sum(x.nbytes for x in [
+            self.coords, self.coord_offsets, self.parts, self.part_offsets, self.null])
+
+    def __len__(self):
+        return len(self.null)
+
+    def __getitem__(self, item):
+        if isinstance(item, numbers.Integral):
+            return self._decode(item if item >= 0 else len(self) + item)
+
+        item = pd.api.indexers.check_array_indexer(self, item)
+        indices = np.arange(len(self))[item]
+
+        return self.take(indices)
+
+    def __setitem__(self, key, value):
+        key = pd.api.indexers.check_array_indexer(self, key)
+        indices = np.arange(len(self))[key]
+
+        if isinstance(value, QuantizedGeometryArray):
+            value_ = value
+        elif np.ndim(indices) == 0 or isinstance(value, dict) or \
+                not pd.api.types.is_list_like(value):  # A single geometry object
+            value_ = self.from_geometry([value] * np.size(indices))
+        else:
+            value_ = self.from_geometry(value)
+
+        indices = np.atleast_1d(indices)
+        if len(value_) != len(indices):
+            raise ValueError(
+                f"Cannot set {len(value_)} geometry object(s) to {len(indices)} item(s).")
+
+        # Rebuild the buffers, in which the new items are taken in place of the old ones
+        order = np.arange(len(self))
+        order[indices] = len(self) + np.arange(len(indices))
+        array = self._concat_same_type([self, value_]).take(order)
+
+        self.coords, self.coord_offsets = array.coords, array.coord_offsets
+        self.parts, self.part_offsets, self.null = array.parts, array.part_offsets, array.null
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_geometry()
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        values = self.to_geometry()
+        if isinstance(other, QuantizedGeometryArray):
+            other = other.to_geometry()
+
+        if isinstance(other, (list, np.ndarray, ExtensionArray)):
+            return np.array([x == y for x, y in zip(values, other)], dtype=bool)
+        return np.array([x == other for x in values], dtype=bool)
+
+    def isna(self):
+        return self.null.copy()
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.int64)
+
+        if allow_fill:
+            if fill_value is not None:
+                raise ValueError("`fill_value` of a QuantizedGeometryArray must be None.")
+            if (indices < -1).any():
+                raise ValueError("Invalid value in `indices`, which must be >= -1.")
+            missing = indices == -1
+        else:
+            missing = np.zeros(len(indices), dtype=bool)
+            indices = np.where(indices < 0, indices + len(self), indices)
+
+        if ((indices < 0) & ~missing).any() or (indices >= len(self)).any():
+            raise IndexError("Index out of bounds for the QuantizedGeometryArray.")
+
+        if len(self) == 0:  # i.e. all missing
+            return self.from_geometry([None] * len(indices))
+
+        indices_ = np.where(missing, 0, indices)
+        coords, coord_offsets = self._gather(
+            self.coords, self.coord_offsets, indices_, missing)
+        parts, part_offsets = self._gather(self.parts, self.part_offsets, indices_, missing)
+        null = missing | self.null[indices_]
+
+        return self.__class__(coords, coord_offsets, parts, part_offsets, null)
+
+    def copy(self):
+        return self.__class__(
+            self.coords.copy(), self.coord_offsets.copy(), self.parts.copy(),
+            self.part_offsets.copy(), self.null.copy())
+
+    def _formatter(self, boxed=False):
+        return str
@@ -0,0 +1,693 @@
+"""
+Store parsed OSM data layer by layer in flat arrays that can be memory-mapped.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import shapely.geometry
+import shapely.wkb
+
+from pydriosm.reader.cache import LayerCache
+from pydriosm.utils import check_relpath
+
+
+class StoredLayer:
+    """
+    A layer of OSM data in a :class:`~pydriosm.reader.store.LayerStore`, whose arrays are
+    memory-mapped (read-only) and decoded only when they are accessed.
+
+    .. seealso::
+
+        - Examples for the class :class:`~pydriosm.reader.store.LayerStore`.
+    """
+
+    def __init__(self, layer_dir, layer_meta):
+        """
+        :param layer_dir: pathname of the directory of the layer
+        :type layer_dir: str
+        :param layer_meta: metadata of the layer
+        :type layer_meta: dict
+
+        :ivar str layer_dir: pathname of the directory of the layer
+        :ivar dict meta: metadata of the layer
+        """
+
+        self.layer_dir = layer_dir
+        self.meta = layer_meta
+
+        # Strings (of the dictionaries) that have been decoded, and whether each has been decoded
+        self._strings = {}
+
+    def __len__(self):
+        return self.meta['length']
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {os.path.basename(self.layer_dir)!r} " \
+               f"({len(self)} features)>"
+
+    def array(self, name):
+        """
+        Open a (memory-mapped) array of the layer.
+
+        :param name: name of the array, e.g. ``'coordinates'``
+        :type name: str
+        :return: read-only memory-mapped array
+        :rtype: numpy.memmap | numpy.ndarray
+        """
+
+        return np.load(os.path.join(self.layer_dir, f"{name}.npy"), mmap_mode='r')
+
+    @property
+    def columns(self):
+        """
+        Names of the columns of the layer.
+
+        :return: names of the columns
+        :rtype: list
+        """
+
+        return list(self.meta['columns'].keys())
+
+    @property
+    def ids(self):
+        """
+        IDs of the features (if available), e.g. OSM IDs.
+
+        :return: memory-mapped array of the IDs
+        :rtype: numpy.memmap | None
+        """
+
+        id_col = self.meta.get('id_column')
+
+        return None if id_col is None else self.array(f"{id_col}.values")
+
+    @property
+    def id_order(self):
+        """
+        Order (i.e. row indices) in which the IDs of the features are sorted.
+
+        :return: memory-mapped array of the row indices,
+            or ``None`` if the IDs are stored in ascending order (or not available)
+        :rtype: numpy.memmap | numpy.ndarray | None
+        """
+
+        id_col = self.meta.get('id_column')
+
+        if id_col is None or self.meta.get('id_sorted'):
+            return None
+
+        if 'id_sorted' in self.meta:  # The order is saved with the store
+            return self.array(f"{id_col}.order")
+
+        ids = self.ids  # e.g. a store saved without the order of IDs
+        return None if np.all(ids[1:] >= ids[:-1]) else np.argsort(ids, kind='stable')
+
+    @property
+    def coordinates(self):
+        """
+        Coordinates of all the geometry objects (if stored as a ragged array).
+
+        :return: memory-mapped array of the coordinates, in the shape of ``(n, 2)`` or ``(n, 3)``
+        :rtype: numpy.memmap | None
+        """
+
+        geom_col = self.meta.get('geometry_column')
+
+        if geom_col is None or self.meta['columns'][geom_col]['encoding'] != 'ragged':
+            return None
+
+        return self.array(f"{geom_col}.coords")
+
+    def _read_strings(self, name, codes):
+        """
+        Read the strings (that are concatenated in a buffer) to which the given codes refer.
+
+        Only the strings that have not been read with the layer are decoded,
+        each only once however many times it is referred to.
+
+        :return: decoded strings, where a code of -1 refers to ``None``
+        :rtype: numpy.ndarray
+        """
+
+        buffer, offsets = self.array(f"{name}.buffer"), self.array(f"{name}.offsets")
+
+        if name not in self._strings:
+            # The trailing None is referred to by a code of -1
+            self._strings[name] = (
+                np.empty(len(offsets), dtype=object), np.zeros(len(offsets) - 1, dtype=bool))
+        strings, is_decoded = self._strings[name]
+
+        codes_ = np.unique(codes)
+        codes_ = codes_[codes_ >= 0]
+        codes_ = codes_[~is_decoded[codes_]]
+        if len(codes_) > 0:
+            strings[codes_] = [
+                bytes(buffer[offsets[i]:offsets[i + 1]]).decode('utf-8') for i in codes_]
+            is_decoded[codes_] = True
+
+        return strings[codes]
+
+    def _decode_geometry(self, column, col_meta, start, stop):
+        geom_types = np.asarray(self.array(f"{column}.types")[start:stop])
+
+        if col_meta['encoding'] == 'ragged':
+            offsets = [self.array(f"{column}.offsets_{i}") for i in range(col_meta['n_offsets'])]
+
+            # Slice the ragged array from the geometry level down to the coordinates
+            offsets_, lo, hi = [], start, stop
+            for off in reversed(offsets):
+                off_ = np.asarray(off[lo:hi + 1])
+                offsets_.insert(0, off_ - off_[0])
+                lo, hi = off_[0], off_[-1]
+            coords = np.asarray(self.array(f"{column}.coords")[lo:hi])
+
+            geoms = shapely.from_ragged_array(
+                shapely.GeometryType(col_meta['geometry_type']), coords,
+                tuple(offsets_) if offsets_ else None)
+            geoms = np.asarray(geoms, dtype=object)
+
+            # Restore single-part geometries that were promoted to multipart ones
+            promoted = (geom_types >= 0) & (geom_types != col_meta['geometry_type'])
+            geoms[promoted] = shapely.get_geometry(geoms[promoted], 0)
+
+        else:  # col_meta['encoding'] == 'wkb'
+            buffer, offsets = self.array(f"{column}.buffer"), self.array(f"{column}.offsets")
+            geoms = np.array([
+                shapely.wkb.loads(bytes(buffer[offsets[i]:offsets[i + 1]]))
+                if offsets[i + 1] > offsets[i] else None for i in range(start, stop)],
+                dtype=object)
+
+        geoms[geom_types < 0] = None
+
+        return geoms
+
+    def _decode_tags(self, column, indices):
+        offsets = self.array(f"{column}.offsets")
+        if isinstance(indices, slice):
+            offsets_ = np.asarray(offsets[indices.start:indices.stop + 1])
+            starts, stops = offsets_[:-1], offsets_[1:]
+        else:
+            starts, stops = np.asarray(offsets[indices]), np.asarray(offsets[indices + 1])
+        is_null = np.asarray(self.array(f"{column}.null")[indices])
+
+        # Positions of the keys (and values) of the features, one after another
+        bounds = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(stops - starts, out=bounds[1:])
+        positions = np.repeat(starts - bounds[:-1], stops - starts) + np.arange(bounds[-1])
+
+        keys = self._read_strings(
+            f"{column}.key_dict", np.asarray(self.array(f"{column}.keys")[positions]))
+        values = self._read_strings(
+            f"{column}.value_dict", np.asarray(self.array(f"{column}.values")[positions]))
+
+        tags = [
+            None if is_null[i] else dict(zip(
+                keys[bounds[i]:bounds[i + 1]], values[bounds[i]:bounds[i + 1]]))
+            for i in range(len(starts))]
+
+        return tags
+
+    def _decode_column(self, name, indices):
+        """
+        Decode a column of the layer at a range (i.e. a slice) or sorted positions of features.
+
+        :return: decoded data of the column
+        :rtype: numpy.ndarray | list | pandas.Categorical
+        """
+
+        col_meta = self.meta['columns'][name]
+        encoding = col_meta['encoding']
+
+        if encoding in {'ragged', 'wkb'}:
+            if isinstance(indices, slice):
+                data = self._decode_geometry(name, col_meta, indices.start, indices.stop)
+            elif len(indices) == 0:
+                data = np.array([], dtype=object)
+            else:  # Decode each run of consecutive positions at once
+                run_starts = np.flatnonzero(np.diff(indices, prepend=-2) != 1)
+                run_stops = np.append(indices[run_starts[1:] - 1], indices[-1:]) + 1
+                if len(run_starts) * 64 >= indices[-1] + 1 - indices[0]:  # Densely scattered
+                    data = self._decode_geometry(name, col_meta, indices[0], indices[-1] + 1)
+                    data = data[indices - indices[0]]
+                else:
+                    data = np.concatenate([
+                        self._decode_geometry(name, col_meta, start, stop)
+                        for start, stop in zip(indices[run_starts], run_stops)])
+
+        elif encoding == 'tags':
+            data = self._decode_tags(name, indices)
+
+        elif encoding in {'dictionary', 'json', 'json_tuples'}:
+            codes = np.asarray(self.array(f"{name}.codes")[indices])
+            if encoding == 'dictionary':
+                data = self._read_strings(f"{name}.dict", codes)
+            else:  # Each of the referred strings is parsed only once
+                codes_, inverse = np.unique(codes, return_inverse=True)
+                strings = self._read_strings(f"{name}.dict", codes_)
+                if encoding == 'json_tuples':  # e.g. coordinates as lists of tuples
+                    dictionary = [
+                        None if x is None else
+                        [tuple(y) if isinstance(y, list) else y for y in json.loads(x)]
+                        for x in strings]
+                else:
+                    dictionary = [None if x is None else json.loads(x) for x in strings]
+                # The trailing None keeps numpy from nesting lists of the same length
+                dictionary = np.array(dictionary + [None], dtype=object)[:-1]
+                data = dictionary[inverse.reshape(-1)]
+            if col_meta.get('dtype') == 'category':
+                data = pd.Categorical(data)
+
+        else:  # encoding == 'array'
+            data = np.asarray(self.array(f"{name}.values")[indices])
+            if col_meta.get('dtype') == 'object':
+                data = data.astype(object)
+            elif col_meta.get('dtype') not in {None, str(data.dtype)}:  # e.g. 'Int64'
+                data = pd.array(data).astype(col_meta['dtype'])
+
+        return data
+
+    def column(self, name, start=None, stop=None):
+        """
+        Decode (a range of) a column of the layer.
+
+        :param name: name of the column
+        :type name: str
+        :param start: index of the first feature, defaults to ``None`` (i.e. ``0``)
+        :type start: int | None
+        :param stop: index after the last feature, defaults to ``None`` (i.e. the end)
+        :type stop: int | None
+        :return: decoded data of the column
+        :rtype: pandas.Series
+        """
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        data = self._decode_column(name, slice(start, stop))
+
+        return pd.Series(data, index=pd.RangeIndex(start, stop), name=name)
+
+    def take(self, indices, columns=None):
+        """
+        Decode the features at given positions of the layer.
+
+        :param indices: (row) indices of the features
+        :type indices: list | numpy.ndarray
+        :param columns: names of the columns to be decoded; if ``None`` (default), all columns
+        :type columns: list | None
+        :return: tabular data of the features, indexed by their (row) indices
+        :rtype: pandas.DataFrame
+        """
+
+        indices = np.asarray(indices, dtype=np.int64)
+        columns_ = self.columns if columns is None else [x for x in self.columns if x in columns]
+
+        positions = np.unique(indices)
+        layer_data = pd.DataFrame(
+            {x: self._decode_column(x, positions) for x in columns_},
+            index=pd.Index(positions, dtype=np.int64))
+
+        return layer_data.loc[indices]
+
+    def to_frame(self, columns=None, start=None, stop=None):
+        """
+        Decode (a range of) the layer into a data frame.
+
+        :param columns: names of the columns to be decoded; if ``None`` (default), all columns
+        :type columns: list | None
+        :param start: index of the first feature, defaults to ``None`` (i.e. ``0``)
+        :type start: int | None
+        :param stop: index after the last feature, defaults to ``None`` (i.e. the end)
+        :type stop: int | None
+        :return: tabular data of the layer
+        :rtype: pandas.DataFrame
+        """
+
+        columns_ = self.columns if columns is None else [x for x in self.columns if x in columns]
+
+        if columns_:
+            layer_data = pd.concat([self.column(x, start, stop) for x in columns_], axis=1)
+        else:
+            start_, stop_, _ = slice(start, stop).indices(len(self))
+            layer_data = pd.DataFrame(index=pd.RangeIndex(start_, stop_))
+
+        return layer_data
+
+
+class LayerStore:
+    """
+    Store parsed OSM data (of multiple layers in a tabular format) in flat arrays,
+    i.e. a directory of `.npy <https://numpy.org/doc/stable/reference/generated/numpy.save.html>`_
+    files per layer, which can be opened with memory mapping.
+
+    In a layer, geometry objects are kept as coordinates and geometry offsets
+    (see `shapely.to_ragged_array()`_), strings as dictionary-encoded codes, and dict-like tags
+    (e.g. the parsed ``'other_tags'``) as dictionary-encoded keys and values with offsets per feature.
+    Opening a store takes only the time of reading its metadata, and the pages of the arrays are
+    shared between the processes that open the same store on one host.
+
+    .. _`shapely.to_ragged_array()`:
+        https://shapely.readthedocs.io/en/stable/reference/shapely.to_ragged_array.html
+
+    **Examples**::
+
+        >>> from pydriosm.reader import PBFReadParse, LayerStore
+        >>> from pyhelpers.dirs import delete_dir
+
+        >>> rutland_pbf_path = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+        >>> rutland_pbf = PBFReadParse.read_pbf(
+        ...     rutland_pbf_path, expand=True, parse_geometry=True, parse_properties=True,
+        ...     parse_other_tags=True, layer_names=['points', 'lines'])
+
+        >>> layer_store = LayerStore("tests\\data\\rutland\\rutland-latest-pbf.store")
+        >>> layer_store.save(rutland_pbf)
+
+        >>> rutland_lines = layer_store['lines']
+        >>> rutland_lines.coordinates.shape[1]
+        2
+        >>> rutland_lines.column('geometry', stop=3)
+        0    LINESTRING (-0.4528259 52.6993113, -0.4518072 ...
+        1    LINESTRING (-0.4798934 52.6197756, -0.4800824 ...
+        2    LINESTRING (-0.3275668 52.6262843, -0.3286952 ...
+        Name: geometry, dtype: object
+
+        >>> # Delete the store
+        >>> delete_dir(layer_store.store_dir, confirmation_required=False)
+    """
+
+    #: str: Filename of the metadata of the store.
+    META_FILENAME = "meta.json"
+
+    def __init__(self, store_dir):
+        """
+        :param store_dir: pathname of a directory where the data is stored
+        :type store_dir: str
+
+        :ivar str store_dir: pathname of the directory where the data is stored
+        """
+
+        self.store_dir = store_dir
+
+    @property
+    def meta(self):
+        """
+        Metadata of the store; an empty dict if no data has been stored.
+
+        :return: metadata of the store
+        :rtype: dict
+        """
+
+        path_to_meta = os.path.join(self.store_dir, self.META_FILENAME)
+
+        if os.path.isfile(path_to_meta):
+            with open(path_to_meta, mode='r', encoding='utf-8') as f:
+                meta = json.load(f)
+        else:
+            meta = {}
+
+        return meta
+
+    @property
+    def layer_names(self):
+        """
+        Names of the stored layers.
+
+        :return: names of the stored layers
+        :rtype: list
+        """
+
+        return list(self.meta.get('layers', {}).keys())
+
+    def is_valid(self, source_pathname=None):
+        """
+        Check whether the data is stored and up to date with its source data file.
+
+        :param source_pathname: pathname of the source data file; if it is ``None`` (default) or
+            the file does not exist, only the existence of stored data is checked
+        :type source_pathname: str | None
+        :return: whether the stored data is available and up to date
+        :rtype: bool
+        """
+
+        meta = self.meta
+
+        if not meta:
+            return False
+
+        if source_pathname is not None and os.path.isfile(source_pathname):
+            return meta.get('source') == LayerCache.get_fingerprint(source_pathname)
+
+        return True
+
+    def __getitem__(self, layer_name):
+        layers_meta = self.meta.get('layers', {})
+
+        if layer_name not in layers_meta:
+            raise KeyError(layer_name)
+
+        return StoredLayer(os.path.join(self.store_dir, layer_name), layers_meta[layer_name])
+
+    def __contains__(self, layer_name):
+        return layer_name in self.layer_names
+
+    @staticmethod
+    def _save_strings(layer_dir, name, strings):
+        encoded = [x.encode('utf-8') for x in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(x) for x in encoded], out=offsets[1:])
+
+        np.save(os.path.join(layer_dir, f"{name}.buffer.npy"),
+                np.frombuffer(b''.join(encoded), dtype=np.uint8))
+        np.save(os.path.join(layer_dir, f"{name}.offsets.npy"), offsets)
+
+    @classmethod
+    def _save_geometry(cls, layer_dir, name, column):
+        geoms = column.to_numpy(dtype=object)
+        geom_types = np.asarray(shapely.get_type_id(geoms), dtype=np.int8)
+        np.save(os.path.join(layer_dir, f"{name}.types.npy"), geom_types)
+
+        try:
+            geom_type, coords, offsets = shapely.to_ragged_array(geoms)
+            col_meta = {
+                'encoding': 'ragged', 'geometry_type': int(geom_type),
+                'n_offsets': len(offsets)}
+            np.save(os.path.join(layer_dir, f"{name}.coords.npy"), coords)
+            for i, off in enumerate(offsets):
+                np.save(os.path.join(layer_dir, f"{name}.offsets_{i}.npy"), off.astype(np.int64))
+
+        except (ValueError, TypeError):  # e.g. geometry collections, or mixed types
+            col_meta = {'encoding': 'wkb'}
+            wkb = [b'' if x is None else x for x in shapely.to_wkb(geoms)]
+            offsets = np.zeros(len(wkb) + 1, dtype=np.int64)
+            np.cumsum([len(x) for x in wkb], out=offsets[1:])
+            np.save(os.path.join(layer_dir, f"{name}.buffer.npy"),
+                    np.frombuffer(b''.join(wkb), dtype=np.uint8))
+            np.save(os.path.join(layer_dir, f"{name}.offsets.npy"), offsets)
+
+        return col_meta
+
+    @classmethod
+    def _save_tags(cls, layer_dir, name, column):
+        is_null = column.isna().to_numpy()
+        tags = [{} if x is None or y else x for x, y in zip(column, is_null)]
+
+        offsets = np.zeros(len(tags) + 1, dtype=np.int64)
+        np.cumsum([len(x) for x in tags], out=offsets[1:])
+
+        keys = pd.Series([k for x in tags for k in x.keys()], dtype=object)
+        values = pd.Series([v for x in tags for v in x.values()], dtype=object)
+        key_codes, key_dict = pd.factorize(keys)
+        value_codes, value_dict = pd.factorize(values)  # Values of None are coded as -1
+
+        np.save(os.path.join(layer_dir, f"{name}.offsets.npy"), offsets)
+        np.save(os.path.join(layer_dir, f"{name}.null.npy"), is_null)
+        np.save(os.path.join(layer_dir, f"{name}.keys.npy"), key_codes.astype(np.int32))
+        np.save(os.path.join(layer_dir, f"{name}.values.npy"), value_codes.astype(np.int32))
+        cls._save_strings(layer_dir, f"{name}.key_dict", key_dict)
+        cls._save_strings(layer_dir, f"{name}.value_dict", value_dict)
+
+        return {'encoding': 'tags'}
+
+    @classmethod
+    def _save_column(cls, layer_dir, name, column):
+        """
+        Save a column of layer data in flat arrays.
+
+        :return: metadata of the column
+        :rtype: dict
+        """
+
+        if column.dtype.kind in 'biufcmM':  # Numbers, booleans and datetimes
+            np.save(os.path.join(layer_dir, f"{name}.values.npy"), column.to_numpy())
+            return {'encoding': 'array', 'dtype': str(column.dtype)}
+
+        is_categorical = isinstance(column.dtype, pd.CategoricalDtype)
+
+        column = column.astype(object)
+        values = column[column.notna()]
+        value_types = set(map(type, values))
+
+        if value_types and all(
+                issubclass(t, shapely.geometry.base.BaseGeometry) for t in value_types):
+            return cls._save_geometry(layer_dir, name, column)
+
+        if value_types == {dict} and name != 'geometry':  # e.g. the parsed 'other_tags'
+            if all(isinstance(v, str) or v is None for x in values for v in x.values()):
+                return cls._save_tags(layer_dir, name, column)
+
+        if value_types and all(issubclass(t, (int, np.integer)) for t in value_types) \
+                and len(values) == len(column):
+            np.save(os.path.join(layer_dir, f"{name}.values.npy"), column.to_numpy(np.int64))
+            return {'encoding': 'array', 'dtype': 'object'}
+
+        if all(issubclass(t, str) for t in value_types):
+            encoding, column_ = 'dictionary', column
+        else:  # e.g. lists and numbers mixed with None
+            first_item = values.iloc[0]
+            if isinstance(first_item, list) and first_item and isinstance(first_item[0], tuple):
+                encoding = 'json_tuples'
+            else:
+                encoding = 'json'
+            column_ = column.map(lambda x: None if x is None else json.dumps(x), na_action='ignore')
+
+        codes, dictionary = pd.factorize(column_)  # Missing values are coded as -1
+        np.save(os.path.join(layer_dir, f"{name}.codes.npy"), codes.astype(np.int32))
+        cls._save_strings(layer_dir, f"{name}.dict", dictionary)
+
+        col_meta = {'encoding': encoding}
+        if is_categorical:
+            col_meta.update({'dtype': 'category'})
+
+        return col_meta
+
+    @classmethod
+    def _save_layers(cls, store_dir, data, source_pathname=None):
+        """
+        Write (checked) data of multiple layers and the metadata into a directory.
+
+        :param store_dir: pathname of an (empty) directory
+        :type store_dir: str
+        :param data: data of multiple layers
+        :type data: dict
+        :param source_pathname: pathname of the source data file, defaults to ``None``
+        :type source_pathname: str | None
+        """
+
+        layers_meta = {}
+
+        for layer_name, layer_data in data.items():
+            layer_dir = os.path.join(store_dir, layer_name)
+            os.makedirs(layer_dir)
+
+            layer_data = layer_data.reset_index(drop=True)
+            columns_meta = {
+                col: cls._save_column(layer_dir, col, layer_data[col])
+                for col in layer_data.columns}
+
+            layer_meta = {'length': len(layer_data), 'columns': columns_meta}
+            for key, cols in [('id_column', ['id', 'osm_id']), ('geometry_column', ['geometry'])]:
+                layer_meta[key] = next(
+                    (x for x in cols if columns_meta.get(x, {}).get('encoding') in (
+                        {'array'} if key == 'id_column' else {'ragged', 'wkb'})),
+                    None)
+
+            if layer_meta['id_column'] is not None:  # For looking up features by IDs
+                ids = layer_data[layer_meta['id_column']].to_numpy()
+                layer_meta['id_sorted'] = bool(np.all(ids[1:] >= ids[:-1]))
+                if not layer_meta['id_sorted']:
+                    np.save(os.path.join(layer_dir, f"{layer_meta['id_column']}.order.npy"),
+                            np.argsort(ids, kind='stable'))
+
+            layers_meta[layer_name] = layer_meta
+
+        source = None if source_pathname is None else LayerCache.get_fingerprint(source_pathname)
+
+        # The metadata is written last so that an incomplete store is never opened
+        with open(os.path.join(store_dir, cls.META_FILENAME), mode='w') as f:
+            json.dump({'source': source, 'layers': layers_meta}, f, indent=4)
+
+    def save(self, data, source_pathname=None, verbose=False):
+        """
+        Save parsed OSM data (in a tabular format) into the store,
+        replacing any data that has been stored.
+
+        :param data: data of multiple layers, with keys and values being layer names and
+            layer data (in the format of `pandas.DataFrame`_), respectively
+        :type data: dict
+        :param source_pathname: pathname of the source data file, defaults to ``None``
+        :type source_pathname: str | None
+        :param verbose: whether to print relevant information in console, defaults to ``False``
+        :type verbose: bool | int
+        :raises TypeError: if the data of any layer is not a `pandas.DataFrame`_
+        :raises ValueError: if any layer name cannot be used as the name of a directory
+
+        .. _`pandas.DataFrame`:
+            https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
+
+        .. seealso::
+
+            - Examples for the class :class:`~pydriosm.reader.store.LayerStore`.
+        """
+
+        for layer_name, layer_data in data.items():  # Checked before anything is written
+            if not isinstance(layer_name, str) or not layer_name or \
+                    layer_name != os.path.basename(layer_name) or layer_name in {'.', '..'}:
+                raise ValueError(f"The layer name {layer_name!r} is not a valid directory name.")
+            if not isinstance(layer_data, pd.DataFrame):
+                raise TypeError(
+                    f"The data of the layer '{layer_name}' is not in a tabular format "
+                    f"(i.e. pandas.DataFrame), but {type(layer_data).__name__}.")
+
+        if verbose:
+            store_dir_, store_dirname = os.path.split(self.store_dir)
+            print(f"Saving \"{store_dirname}\" to \"{check_relpath(store_dir_)}\\\"", end=" ... ")
+
+        # The data is written into a temporary directory, which replaces the store (if any)
+        # only when all the data has been written
+        path_to_store = os.path.abspath(self.store_dir)
+        os.makedirs(os.path.dirname(path_to_store), exist_ok=True)
+        temp_dir = tempfile.mkdtemp(
+            prefix=f".{os.path.basename(path_to_store)}-", dir=os.path.dirname(path_to_store))
+
+        try:
+            new_store_dir = os.path.join(temp_dir, "new")
+            os.makedirs(new_store_dir)
+            self._save_layers(new_store_dir, data, source_pathname=source_pathname)
+
+            if os.path.exists(path_to_store):  # Moved aside, and deleted with the temporary dir
+                os.replace(path_to_store, os.path.join(temp_dir, "old"))
+            os.replace(new_store_dir, path_to_store)
+
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        if verbose:
+            print("Done.")
+
+    def load(self, layer_names=None, columns=None):
+        """
+        Load (i.e. decode) the stored data into data frames.
+
+        :param layer_names: name of a layer, or names of multiple layers, to be loaded;
+            if ``None`` (default), all stored layers
+        :type layer_names: str | list | None
+        :param columns: names of columns to be loaded from each layer;
+            if ``None`` (default), all columns
+        :type columns: list | None
+        :return: data of the specified layers,
+            with keys and values being layer names and layer data, respectively
+        :rtype: dict
+        """
+
+        if layer_names is None:
+            layer_names_ = self.layer_names
+        else:
+            layer_names_ = [layer_names] if isinstance(layer_names, str) else layer_names
+            layer_names_ = [x for x in self.layer_names if x in layer_names_]
+
+        data = {x: self[x].to_frame(columns=columns) for x in layer_names_}
+
+        return data
@@ -29,6 +29,13 @@ class Transformer:
         'POINT (-0.5134241 52.6555853)'
     """
 
+    #: re.Pattern: Pattern of a ``"key"=>"value"`` pair in the data of ``'other_tags'``,
+    #: allowing for backslash-escaped characters within the quoted keys and values.
+    _OTHER_TAGS_PAIR = re.compile(
+        r'"((?:[^"\\]|\\.)*)"=>(?:"((?:[^"\\]|\\.)*)"|([^,"]*))', flags=re.DOTALL)
+    #: re.Pattern: Pattern of a backslash-escaped character in the data of ``'other_tags'``.
+    _OTHER_TAGS_ESCAPE = re.compile(r'\\(.)', flags=re.DOTALL)
+
     @classmethod
     def point_as_polygon(cls, multi_poly_coords):
         """
@@ -339,11 +346,54 @@ class Transformer:
 
         return geom_data
 
+    @classmethod
+    def _tokenize_other_tags(cls, other_tags):
+        """
+        Tokenize a ``'other_tags'`` string into ``(key, value)`` pairs in a single pass.
+
+        :param other_tags: data of ``'other_tags'`` of a single feature in a PBF data file
+        :type other_tags: str
+        :return: pairs of keys and values, with escapes resolved and ``'<br>'`` in values
+            replaced by a space
+        :rtype: list
+        :raises OtherTagsReformatError: if any part of ``other_tags`` is not a ``"key"=>"value"``
+            pair separated by commas
+        """
+
+        pairs, pos = [], 0
+
+        for match in cls._OTHER_TAGS_PAIR.finditer(other_tags):
+            if match.start() != pos:  # e.g. leftover text between (or before) the pairs
+                raise OtherTagsReformatError(other_tags=other_tags)
+            pos = match.end()
+            if other_tags.startswith(',', pos) and pos + 1 < len(other_tags):
+                pos += 1
+
+            k, v, v_ = match.groups(default='')
+            if not v:
+                v = v_
+            if '\\' in k:
+                k = cls._OTHER_TAGS_ESCAPE.sub(r'\1', k)
+            if '\\' in v:
+                v = cls._OTHER_TAGS_ESCAPE.sub(r'\1', v)
+            if '<br>' in v:
+                v = v.replace('<br>', ' ')
+            pairs.append((k, v))
+
+        if not pairs or pos != len(other_tags):  # e.g. a trailing key without a value
+            raise OtherTagsReformatError(other_tags=other_tags)
+
+        return pairs
+
     @classmethod
     def transform_other_tags(cls, other_tags):
         """
         Reformat a ``'other_tags'`` from string into dictionary type.
 
+        The hstore-style string (e.g. ``'"key1"=>"value1","key2"=>"value2"'``) is tokenized
+        in one pass, and quotes or backslashes escaped (by a backslash) in the keys and values
+        are resolved.
+
         :param other_tags: data of ``'other_tags'`` of a single feature in a PBF data file
         :type other_tags: str | None
         :return: reformatted data of ``'other_tags'``
@@ -357,6 +407,11 @@ class Transformer:
             >>> other_tags_dat
             {'odbl': 'clean'}
 
+            >>> other_tags_dat = Transformer.transform_other_tags(
+            ...     other_tags=r'"name:en"=>"The \\"Ram\\", Oakham","note"=>"a<br>b"')
+            >>> other_tags_dat
+            {'name:en': 'The "Ram", Oakham', 'note': 'a b'}
+
         .. seealso::
 
             - Examples for the method
@@ -364,19 +419,65 @@ class Transformer:
         """
 
         if other_tags:
-            tags = [re.sub(r'^"|"$', '', x) for x in re.split('(?<="),(?=")', other_tags)]
-            try:
-                fltr = (re.split(r'"=>"?', x, maxsplit=1) for x in filter(None, tags))
-            except OtherTagsReformatError:
-                fltr = filter(
-                    lambda x: len(x) == 2, (re.split(r'"=>"?', x) for x in filter(None, tags)))
-            other_tags_ = {k: v.replace('<br>', ' ') for k, v in fltr}
+            other_tags_ = dict(cls._tokenize_other_tags(other_tags))
 
         else:  # e.g. the data of 'other_tags' is None
             other_tags_ = other_tags
 
         return other_tags_
 
+    @classmethod
+    def transform_other_tags_series(cls, other_tags):
+        """
+        Reformat a column of ``'other_tags'`` from strings into dictionaries.
+
+        Each distinct string is tokenized only once, and repeated keys and values are interned
+        so that the parsed dictionaries share the same string objects.
+
+        :param other_tags: data of ``'other_tags'`` of features in a PBF data file
+        :type other_tags: pandas.Series
+        :return: reformatted data of ``'other_tags'``
+        :rtype: pandas.Series
+
+        **Examples**::
+
+            >>> from pydriosm.reader import Transformer
+            >>> import pandas as pd
+
+            >>> ot_dat = pd.Series(['"odbl"=>"clean"', None, '"odbl"=>"clean","ref"=>"A1"'])
+            >>> ot_dat_ = Transformer.transform_other_tags_series(ot_dat)
+            >>> ot_dat_
+            0                  {'odbl': 'clean'}
+            1                               None
+            2    {'odbl': 'clean', 'ref': 'A1'}
+            dtype: object
+
+        .. seealso::
+
+            - Examples for the method
+              :meth:`PBFReadParse.read_pbf()<pydriosm.reader.PBFReadParse.read_pbf>`.
+        """
+
+        tokenized, strings = {}, {}
+
+        def _transform(x):
+            if not x or not isinstance(x, str):
+                return None if x is None or x != x else x
+
+            pairs = tokenized.get(x)
+            if pairs is None:
+                pairs = tokenized[x] = [
+                    (strings.setdefault(k, k), strings.setdefault(v, v))
+                    for k, v in cls._tokenize_other_tags(x)]
+
+            return dict(pairs)
+
+        other_tags_ = pd.Series(
+            [_transform(x) for x in other_tags], index=other_tags.index, name=other_tags.name,
+            dtype=object)
+
+        return other_tags_
+
     @classmethod
     def update_other_tags(cls, prop_or_feat, mode=1):
         """
@@ -6,6 +6,7 @@ import importlib.resources
 import os
 import shutil
 
+import pandas as pd
 from pyhelpers._cache import _check_dependency, _format_err_msg
 from pyhelpers.dirs import cd
 
@@ -213,6 +214,141 @@ def check_json_engine(engine=None):
     return engine_
 
 
+def get_available_memory():
+    """
+    Get the size of the physical memory that is currently available.
+
+    It uses `psutil <https://pypi.org/project/psutil/>`_ if it is installed,
+    and otherwise queries the system configuration (on POSIX systems).
+
+    :return: size (in MB) of the available memory; ``None`` if it cannot be determined
+    :rtype: float | None
+
+    **Examples**::
+
+        >>> from pydriosm.utils import get_available_memory
+
+        >>> available_memory = get_available_memory()
+        >>> available_memory > 0
+        True
+    """
+
+    try:
+        import psutil
+        available_memory = psutil.virtual_memory().available
+
+    except ImportError:
+        try:
+            available_memory = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except (AttributeError, ValueError, OSError):  # e.g. on Windows
+            return None
+
+    return available_memory / 2 ** 20
+
+
+def sort_layer_data(layer_data, by='id'):
+    """
+    Sort layer data (in ascending order) by given columns unless it has already been sorted.
+
+    Data of PBF layers is normally sorted by ``'id'``, in which case only its index is reset
+    (instead of copying the whole data); otherwise, a stable sort is used, which merges
+    the sorted runs of the data, e.g. chunks that have been sorted separately.
+
+    :param layer_data: data of a layer
+    :type layer_data: pandas.DataFrame
+    :param by: name of a column, or names of multiple columns, defaults to ``'id'``
+    :type by: str | list
+    :return: sorted layer data, with a default index
+    :rtype: pandas.DataFrame
+
+    **Examples**::
+
+        >>> from pydriosm.utils import sort_layer_data
+        >>> import pandas as pd
+
+        >>> dat = pd.DataFrame({'id': [1, 3, 2], 'name': ['a', 'c', 'b']}, index=[5, 6, 7])
+        >>> sort_layer_data(dat)
+           id name
+        0   1    a
+        1   2    b
+        2   3    c
+
+        >>> dat_ = sort_layer_data(dat[:2])
+        >>> dat_.index.tolist()
+        [0, 1]
+    """
+
+    by_ = [by] if isinstance(by, str) else list(by)
+
+    if len(by_) == 1:
+        is_sorted = layer_data[by_[0]].is_monotonic_increasing
+    else:
+        is_sorted = pd.MultiIndex.from_frame(layer_data[by_]).is_monotonic_increasing
+
+    if is_sorted:
+        if not isinstance(layer_data.index, pd.RangeIndex) or layer_data.index.start != 0 \
+                or layer_data.index.step != 1:
+            layer_data = layer_data.copy(deep=False)  # The data is not copied
+            layer_data.index = pd.RangeIndex(len(layer_data))
+    else:
+        layer_data = layer_data.sort_values(by_, ignore_index=True, kind='stable')
+
+    return layer_data
+
+
+def drop_duplicate_ids(layer_data, seen_ids, by='id'):
+    """
+    Drop features of layer data whose IDs are duplicated or have already been seen.
+
+    The IDs of the features that are kept are added to ``seen_ids``, so that the data of a layer
+    that comes in chunks (e.g. from adjacent regions, which overlap at their borders) can be
+    deduplicated one chunk at a time, with only the IDs being held in memory.
+
+    :param layer_data: data of a layer
+    :type layer_data: pandas.DataFrame
+    :param seen_ids: IDs of the features that have been seen, which is updated in place
+    :type seen_ids: set
+    :param by: name of the column of IDs, defaults to ``'id'``
+    :type by: str
+    :return: layer data without the duplicated features, and the number of the dropped ones
+    :rtype: tuple[pandas.DataFrame, int]
+
+    **Examples**::
+
+        >>> from pydriosm.utils import drop_duplicate_ids
+        >>> import pandas as pd
+
+        >>> seen = set()
+        >>> dat1 = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+        >>> dat1_, n_dropped = drop_duplicate_ids(dat1, seen)
+        >>> n_dropped
+        0
+        >>> sorted(seen)
+        [1, 2, 3]
+
+        >>> dat2 = pd.DataFrame({'id': [3, 4, 4], 'name': ['c', 'd', 'd']})
+        >>> dat2_, n_dropped = drop_duplicate_ids(dat2, seen)
+        >>> n_dropped
+        2
+        >>> dat2_
+           id name
+        0   4    d
+    """
+
+    ids = layer_data[by]
+
+    is_dup = ids.duplicated().to_numpy()
+    is_dup |= [x in seen_ids for x in ids.tolist()]
+
+    n_dropped = int(is_dup.sum())
+    if n_dropped > 0:
+        layer_data = layer_data[~is_dup].reset_index(drop=True)
+
+    seen_ids.update(layer_data[by].tolist())
+
+    return layer_data, n_dropped
+
+
 def remove_osm_file(path_to_file, verbose=True):
     """
     Remove a downloaded OSM data file.
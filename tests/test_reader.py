@@ -1,15 +1,27 @@
 """Test the module :py:mod:`pydriosm.reader`."""
 
+import collections
+import concurrent.futures
 import glob
+import itertools
+import json
 import os
+import random
+import re
 import shutil
+import tracemalloc
 
+import numpy as np
 import pandas as pd
 import pytest
+import shapefile
 import shapely.geometry
+import shapely.wkb
 from pyhelpers.store import load_pickle
 
-from pydriosm.reader import PBFReadParse, SHPReadParse, Transformer
+from pydriosm.errors import OtherTagsReformatError
+from pydriosm.reader import FeatureIndex, LayerCache, LayerStore, LazyLayers, PBFReadParse, \
+    QuantizedGeometryArray, SHPReadParse, SpatialIndex, TagIndex, Transformer
 from pydriosm.reader._reader import _Reader
 
 
@@ -125,6 +137,73 @@ class TestTransformer:
         other_tags_dat = Transformer.transform_other_tags(other_tags='"odbl"=>"clean"')
         assert other_tags_dat == {'odbl': 'clean'}
 
+        other_tags_dat = Transformer.transform_other_tags(
+            other_tags=r'"name:en"=>"The \"Ram\", Oakham","note"=>"a<br>b","path"=>"c:\\d"')
+        assert other_tags_dat == {'name:en': 'The "Ram", Oakham', 'note': 'a b', 'path': 'c:\\d'}
+
+        assert Transformer.transform_other_tags(other_tags=None) is None
+
+        for other_tags in ['"a"=>"b","c"', 'x"a"=>"b"', '"a"=>"b",', '"a"=>"b" ,"c"=>"d"']:
+            with pytest.raises(OtherTagsReformatError):
+                Transformer.transform_other_tags(other_tags=other_tags)
+
+    @staticmethod
+    def _transform_other_tags_legacy(other_tags):
+        if other_tags:
+            tags = [re.sub(r'^"|"$', '', x) for x in re.split('(?<="),(?=")', other_tags)]
+            fltr = (re.split(r'"=>"?', x, maxsplit=1) for x in filter(None, tags))
+            other_tags_ = {k: v.replace('<br>', ' ') for k, v in fltr}
+        else:
+            other_tags_ = other_tags
+        return other_tags_
+
+    @classmethod
+    def test_transform_other_tags_series(cls):
+        rng = random.Random(0)
+        chars = list("abcxyz019 :;,=>_-.é中") + ['<br>', '"', '\\', '\\"', '"=>"', '","']
+
+        def make_token():
+            return ''.join(rng.choice(chars) for _ in range(rng.randint(0, 8))).strip(',')
+
+        def escape(x):
+            return x.replace('\\', '\\\\').replace('"', '\\"')
+
+        other_tags, expected = [], []
+        for _ in range(5000):
+            tags = {(make_token() or 'k'): make_token() for _ in range(rng.randint(1, 6))}
+            other_tags.append(','.join(f'"{escape(k)}"=>"{escape(v)}"' for k, v in tags.items()))
+            expected.append({k: v.replace('<br>', ' ') for k, v in tags.items()})
+        other_tags = pd.Series(other_tags * 2 + [None])
+
+        other_tags_dat = Transformer.transform_other_tags_series(other_tags)
+        assert isinstance(other_tags_dat, pd.Series)
+        assert other_tags_dat.to_list() == expected * 2 + [None]
+
+        # Without escapes, the result is the same as that of the previous (regex) parser
+        no_escape = ~other_tags.str.contains('\\', regex=False, na=True)
+        assert 0 < no_escape.sum() < len(other_tags) - 1
+        assert other_tags_dat[no_escape].to_list() == \
+            other_tags[no_escape].map(cls._transform_other_tags_legacy).to_list()
+
+        # Keys and values that are repeated across different strings are interned
+        other_tags_ = pd.Series([
+            '"highway"=>"primary road","ref"=>"A606"',
+            '"ref"=>"A606","name"=>"primary road"',
+            '"highway"=>"trunk"'])
+        other_tags_dat_ = Transformer.transform_other_tags_series(other_tags_)
+        (k1, v1), (k2, v2) = list(other_tags_dat_[0].items())
+        (k3, v3), (k4, v4) = list(other_tags_dat_[1].items())
+        k5 = list(other_tags_dat_[2].keys())[0]
+        assert k1 == k5 and k1 is k5
+        assert k2 == k3 and k2 is k3
+        assert v2 == v3 and v2 is v3
+        assert v1 == v4 and v1 is v4
+
+        strings = {}
+        for x in other_tags_dat.dropna():
+            for y in itertools.chain(x.keys(), x.values()):
+                assert strings.setdefault(y, y) is y
+
     @staticmethod
     def test_update_other_tags():
         prop_dat = {
@@ -156,6 +235,68 @@ class TestTransformer:
         }
 
 
+class TestQuantizedGeometryArray:
+    path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+
+    def test_from_geometry(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, layer_names=['multipolygons', 'other_relations'])
+
+        for layer_name, layer_data in rutland_pbf.items():
+            geoms = layer_data['geometry'].map(shapely.geometry.shape)
+            geoms_ = QuantizedGeometryArray.from_geometry(layer_data['geometry'])
+            assert len(geoms_) == len(geoms)
+            assert all(shapely.equals_exact(geoms_.to_geometry(), geoms.to_numpy(), 1e-7))
+            assert geoms_.nbytes < geoms.map(lambda x: len(x.wkb)).sum()
+
+        coords = [[(-0.5134241, 52.6555853), (-0.5313354, 52.6737716)], None]
+        coords_ = QuantizedGeometryArray.from_geometry(coords)
+        assert list(coords_) == coords
+
+        # e.g. projected coordinates (in metres), which would wrap around as 32-bit integers
+        for xy in [(530034.0, 180381.0), (-214.75, 52.0), (float('nan'), 52.0)]:
+            with pytest.raises(ValueError, match="32-bit integers"):
+                QuantizedGeometryArray.from_geometry([shapely.geometry.Point(xy)])
+        point = QuantizedGeometryArray.from_geometry([shapely.geometry.Point(-214.7, 85.0)])
+        assert point[0].equals(shapely.geometry.Point(-214.7, 85.0))
+
+    def test_layer_data(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_geometry=True, layer_names='points')
+        rutland_points = rutland_pbf['points']
+        rutland_points_ = PBFReadParse.compact_pbf_layer(
+            rutland_points, geometry_format='quantized')
+        assert rutland_points_['geometry'].dtype == 'quantized_geometry'
+
+        points = pd.concat([rutland_points_[::2], rutland_points_[1::2]]).sort_values('id')
+        assert points['geometry'].reset_index(drop=True).equals(rutland_points_['geometry'])
+        assert all(shapely.equals_exact(
+            points['geometry'].to_numpy(), rutland_points['geometry'].to_numpy(), 1e-7))
+
+        points_ = points['geometry'].reindex([0, -1])
+        assert points_.isna().tolist() == [False, True]
+
+        # Assign geometry objects to the quantized column
+        point = shapely.geometry.Point(-0.5134241, 52.6555853)
+        rutland_points_.loc[1, 'geometry'] = point
+        rutland_points_.loc[[3, 0], 'geometry'] = [point.buffer(1e-3), None]
+        assert rutland_points_['geometry'].dtype == 'quantized_geometry'
+        assert rutland_points_['geometry'][1].equals(point)
+        assert rutland_points_['geometry'][3].geom_type == 'Polygon'
+        assert rutland_points_['geometry'].isna()[[0, 1, 2, 3]].tolist() == \
+            [True, False, False, False]
+        assert all(shapely.equals_exact(
+            rutland_points_['geometry'][4:].to_numpy(),
+            rutland_points['geometry'][4:].to_numpy(), 1e-7))
+
+        geoms = QuantizedGeometryArray.from_geometry(rutland_points['geometry'][:3])
+        geoms[np.ones(3, dtype=bool)] = geoms[::-1]
+        assert all(shapely.equals_exact(
+            geoms.to_geometry(), rutland_points['geometry'][2::-1].to_numpy(), 1e-7))
+        with pytest.raises(ValueError):
+            geoms[[0, 1]] = [point]
+
+
 class TestPBFReadParse:
     path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
 
@@ -169,6 +310,51 @@ class TestPBFReadParse:
             'multipolygons': 'MultiPolygon',
             'other_relations': 'GeometryCollection'}
 
+    @staticmethod
+    def test_validate_pbf_layer_names():
+        assert PBFReadParse.validate_pbf_layer_names(None) == []
+        assert PBFReadParse.validate_pbf_layer_names('line') == ['lines']
+        assert PBFReadParse.validate_pbf_layer_names(['multipolygon', 'point']) == [
+            'points', 'multipolygons']
+        assert len(PBFReadParse.validate_pbf_layer_names('all')) == 5
+
+        for layer_names in ['roads', 'xyz', ['lines', 'bogus']]:
+            with pytest.raises(ValueError, match="Invalid PBF layer name"):
+                PBFReadParse.validate_pbf_layer_names(layer_names)
+
+    @staticmethod
+    def test_make_attribute_filter():
+        fields = ['osm_id', 'name', 'highway', 'railway', 'other_tags']
+
+        assert PBFReadParse.make_attribute_filter({'highway': None}, fields) == \
+               '"highway" IS NOT NULL'
+        assert PBFReadParse.make_attribute_filter({'railway': ['rail', 'tram']}, fields) == \
+               '"railway" IN (\'rail\', \'tram\')'
+        assert PBFReadParse.make_attribute_filter({'name': "O'Brien"}, fields) == \
+               '"name" = \'O\'\'Brien\''
+        assert PBFReadParse.make_attribute_filter({'highway': None, 'max_speed': '30'}, fields) == \
+               '"highway" IS NOT NULL OR ' \
+               '"other_tags" LIKE \'%"max\\_speed"=>"30"%\' ESCAPE \'\\\''
+        assert PBFReadParse.make_attribute_filter('"highway" = \'primary\'', fields) == \
+               '"highway" = \'primary\''
+
+    @staticmethod
+    def test_make_osm_config():
+        from osgeo import gdal
+
+        default_osm_conf = gdal.FindFile('gdal', 'osmconf.ini')
+
+        osm_conf = PBFReadParse.make_osm_config(
+            {'line': ['name', 'maxspeed', 'osm_timestamp']}, default_osm_conf)
+        osm_conf_sections = dict(re.findall(r'\[(\w+)]\n([^\[]*)', osm_conf))
+        lines_conf = osm_conf_sections['lines'].splitlines()
+        assert 'attributes=name,maxspeed' in lines_conf
+        assert 'osm_timestamp=yes' in lines_conf and 'osm_version=no' in lines_conf
+        assert 'attributes=name,maxspeed' not in osm_conf_sections['points'].splitlines()
+
+        osm_conf = PBFReadParse.make_osm_config(['name'], default_osm_conf)
+        assert osm_conf.count('\nattributes=name\n') == len(PBFReadParse.LAYER_GEOM)
+
     @staticmethod
     @pytest.mark.parametrize('layer_name', ['points', 'other_relations'])
     @pytest.mark.parametrize('dat_id', [1, 2])
@@ -196,6 +382,164 @@ class TestPBFReadParse:
         assert list(rutland_pbf.keys()) == [
             'points', 'lines', 'multilinestrings', 'multipolygons', 'other_relations']
 
+    @pytest.mark.parametrize('layer_names', ['lines', ['multipolygons', 'points']])
+    def test_read_pbf_layer_names(self, layer_names):
+        rutland_pbf = PBFReadParse.read_pbf(
+            pbf_pathname=self.path_to_osm_pbf, expand=True, layer_names=layer_names)
+
+        assert list(rutland_pbf.keys()) == PBFReadParse.validate_pbf_layer_names(layer_names)
+
+    def test_read_pbf_tag_filter(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            pbf_pathname=self.path_to_osm_pbf, expand=True, parse_properties=True,
+            layer_names='lines', tag_filter={'railway': 'rail'})
+
+        assert rutland_pbf['lines']['railway'].unique().tolist() == ['rail']
+
+    def test_read_pbf_spatial_filter(self):
+        bbox = (-0.76, 52.66, -0.70, 52.69)
+        rutland_pbf = PBFReadParse.read_pbf(
+            pbf_pathname=self.path_to_osm_pbf, expand=True, parse_geometry=True,
+            layer_names='lines')
+        rutland_pbf_bbox = PBFReadParse.read_pbf(
+            pbf_pathname=self.path_to_osm_pbf, expand=True, parse_geometry=True,
+            layer_names='lines', bbox=bbox)
+
+        assert 0 < len(rutland_pbf_bbox['lines']) < len(rutland_pbf['lines'])
+        assert rutland_pbf_bbox['lines']['geometry'].map(
+            shapely.geometry.box(*bbox).intersects).all()
+
+        mask = shapely.geometry.Point(-0.73, 52.67).buffer(0.01)
+        rutland_pbf_mask = PBFReadParse.read_pbf(
+            pbf_pathname=self.path_to_osm_pbf, expand=True, parse_geometry=True,
+            layer_names='lines', mask=mask)
+
+        assert 0 < len(rutland_pbf_mask['lines']) < len(rutland_pbf_bbox['lines'])
+        assert rutland_pbf_mask['lines']['geometry'].map(mask.intersects).all()
+
+    def test_read_pbf_layer_attributes(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            pbf_pathname=self.path_to_osm_pbf, expand=True, parse_properties=True,
+            layer_names=['points', 'lines'], layer_attributes={'lines': ['name', 'maxspeed']})
+
+        rutland_lines = rutland_pbf['lines']
+        assert 'maxspeed' in rutland_lines.columns and 'railway' not in rutland_lines.columns
+        assert not rutland_lines['other_tags'].str.contains('"maxspeed"=>', na=False).any()
+        assert 'barrier' in rutland_pbf['points'].columns
+
+    @staticmethod
+    def test_iter_chunks_adaptively():
+        features = [{'id': i, 'name': f'feature_{i}'} for i in range(10000)]
+
+        chunks = list(PBFReadParse.iter_chunks_adaptively(
+            features, pd.DataFrame, max_chunk_memory=0.05, initial_chunk_size=100))
+        assert pd.concat(chunks, ignore_index=True).equals(pd.DataFrame(features))
+        assert len(chunks[1]) > len(chunks[0])
+        assert all(x.memory_usage(index=False, deep=True).sum() <= 0.05 * 2 ** 20 * 1.1
+                   for x in chunks[1:])
+
+        # The budget holds for features with many vertices, which are nested in the parsed data
+        coords = [[-0.4528259 + i * 1e-5, 52.6993113] for i in range(500)]
+        features = [
+            {'id': i, 'geometry': {'type': 'LineString', 'coordinates': coords}}
+            for i in range(400)]
+        chunk_sizes = []
+
+        def parse_chunk(chunk):
+            tracemalloc.start()
+            chunk_data = pd.DataFrame(json.loads(json.dumps(chunk)))  # Without shared objects
+            chunk_sizes.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            return chunk_data
+
+        chunks = list(PBFReadParse.iter_chunks_adaptively(
+            iter(features), parse_chunk, max_chunk_memory=0.5, initial_chunk_size=10))
+        assert sum(len(x) for x in chunks) == len(features)
+        assert chunks[0].memory_usage(index=False, deep=True).sum() < 0.5 * 2 ** 20 / 50
+        assert all(x <= 0.5 * 2 ** 20 * 1.1 for x in chunk_sizes[1:])
+        assert max(chunk_sizes[1:]) > 0.5 * 2 ** 20 * 0.5
+
+        chunks = list(PBFReadParse.iter_chunks_adaptively(
+            iter(features), max_chunk_memory=0.5, initial_chunk_size=10,
+            parse_chunk=lambda chunk: pd.Series(
+                [shapely.geometry.shape(x['geometry']) for x in chunk])))
+        assert all(len(x) * 500 * 16 <= 0.5 * 2 ** 20 for x in chunks[1:])
+
+    def test_read_pbf_max_chunk_memory(self):
+        pbf_args = {
+            'pbf_pathname': self.path_to_osm_pbf, 'expand': True, 'parse_geometry': True,
+            'layer_names': 'lines',
+        }
+        rutland_lines = PBFReadParse.read_pbf(**pbf_args)['lines']
+        rutland_lines_ = PBFReadParse.read_pbf(max_chunk_memory=1, **pbf_args)['lines']
+
+        assert rutland_lines_.astype(str).equals(rutland_lines.astype(str))
+
+    def test_compact_pbf_layer(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, layer_names=['points', 'multipolygons'])
+        rutland_points = rutland_pbf['points']
+        rutland_points_ = PBFReadParse.compact_pbf_layer(rutland_points, geometry_format='wkb')
+        assert 'osm_id' not in rutland_points_['properties'][0]
+        assert shapely.wkb.loads(rutland_points_['geometry'][0]).equals(
+            shapely.geometry.shape(rutland_points['geometry'][0]))
+
+        rutland_pbf_ = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_properties=True, parse_other_tags=True,
+            layer_names=['points', 'multipolygons'], compact=True)
+        rutland_mp = rutland_pbf_['multipolygons']
+        assert rutland_mp['id'].dtype == 'int64' and rutland_mp['osm_way_id'].dtype == 'Int64'
+        assert rutland_mp['building'].dtype == 'category'
+
+        rutland_points = PBFReadParse.transform_pbf_layer_field(
+            rutland_pbf['points'], 'points', parse_properties=True, parse_other_tags=True)
+        rutland_points_ = rutland_pbf_['points']
+        assert rutland_points_['other_tags'].equals(rutland_points['other_tags'])
+        assert rutland_points_.astype(object).where(rutland_points_.notna(), None).astype(
+            str).equals(rutland_points.astype(str))
+
+        mem_usage, mem_usage_ = [
+            x.drop(columns=['geometry', 'other_tags']).memory_usage(deep=True).sum()
+            for x in (rutland_points, rutland_points_)]
+        assert mem_usage_ < mem_usage / 2
+
+    def test_read_pbf_workers(self):
+        pbf_args = {
+            'pbf_pathname': self.path_to_osm_pbf, 'expand': True, 'parse_geometry': True,
+            'parse_properties': True, 'parse_other_tags': True, 'layer_names': 'points',
+        }
+        rutland_points = PBFReadParse.read_pbf(**pbf_args)['points']
+        rutland_points_ = PBFReadParse.read_pbf(workers=2, **pbf_args)['points']
+
+        assert rutland_points_['id'].is_monotonic_increasing
+        assert rutland_points_.astype(str).equals(rutland_points.astype(str))
+
+        # Each worker process reads its own range of the (filtered) features
+        pbf_args.update({'layer_names': 'lines', 'tag_filter': {'highway': None}})
+        rutland_lines = PBFReadParse.read_pbf(**pbf_args)['lines']
+        rutland_lines_ = PBFReadParse.read_pbf(workers=2, number_of_chunks=3, **pbf_args)['lines']
+        assert rutland_lines_.astype(str).equals(rutland_lines.astype(str))
+
+        rutland_lines_range = PBFReadParse._read_pbf_layer_range(
+            self.path_to_osm_pbf, 'lines', 10, 20, open_args={'tag_filter': {'highway': None}},
+            readable=True, expand=True, parse_geometry=False, parse_properties=False,
+            parse_other_tags=False)
+        assert rutland_lines_range['id'].tolist() == rutland_lines['id'][10:20].tolist()
+
+    def test_read_pbf_workers_uncounted(self, monkeypatch):
+        osgeo_ogr = pytest.importorskip('osgeo.ogr')
+
+        pbf_args = {
+            'pbf_pathname': self.path_to_osm_pbf, 'expand': True, 'layer_names': 'lines',
+            'tag_filter': {'highway': None}}
+        rutland_lines = PBFReadParse.read_pbf(**pbf_args)['lines']
+
+        # The features are exported and split here if the driver cannot count them
+        monkeypatch.setattr(osgeo_ogr.Layer, 'GetFeatureCount', lambda self, force=1: -1)
+        rutland_lines_ = PBFReadParse.read_pbf(workers=2, number_of_chunks=3, **pbf_args)['lines']
+        assert len(rutland_lines_) == len(rutland_lines) > 0
+        assert rutland_lines_.astype(str).equals(rutland_lines.astype(str))
+
 
 class TestSHPReadParse:
     path_to_shp_zip = "tests\\data\\rutland\\rutland-latest-free.shp.zip"
@@ -250,6 +594,219 @@ class TestSHPReadParse:
         geom1, geom2 = map(lambda x: x['geometry'].map(lambda y: y.wkt), railways_data)
         assert geom1.equals(geom2)
 
+    def test_read_shp_spatial_filter(self):
+        rutland_shp_dir = SHPReadParse.unzip_shp_zip(
+            self.path_to_shp_zip, extract_to=self.extract_to_dir, ret_extract_dir=True)
+        path_to_railways_shp = glob.glob(os.path.join(rutland_shp_dir, "*railways*.shp"))[0]
+
+        bbox = (-0.7, 52.6, -0.5, 52.7)
+        rutland_railways = SHPReadParse.read_shp(path_to_railways_shp, emulate_gpd=True)
+        rutland_railways_bbox = SHPReadParse.read_shp(path_to_railways_shp, bbox=bbox)
+        assert 0 < len(rutland_railways_bbox) < len(rutland_railways)
+        assert rutland_railways_bbox.columns.tolist()[-2:] == ['coordinates', 'shape_type']
+
+        mask = shapely.geometry.box(*bbox).buffer(-0.02)
+        rutland_railways_mask = SHPReadParse.read_shp(
+            path_to_railways_shp, emulate_gpd=True, mask=mask)
+        assert 0 < len(rutland_railways_mask) < len(rutland_railways_bbox)
+        assert rutland_railways_mask['geometry'].map(mask.intersects).all()
+
+        rutland_railways_mask_ = SHPReadParse.read_shp(
+            path_to_railways_shp, engine='geopandas', mask=mask)
+        assert sorted(rutland_railways_mask['osm_id']) == sorted(rutland_railways_mask_['osm_id'])
+
+    @pytest.mark.parametrize('shp_filename', [
+        "gis_osm_natural_free_1.shp", "gis_osm_pois_free_1.shp", "gis_osm_places_free_1.shp"])
+    def test_read_shp_bbox_points(self, shp_filename):
+        bbox = (-0.75, 52.6, -0.6, 52.7)
+        read_args = {'shp_zip_pathname': self.path_to_shp_zip, 'bbox': bbox}
+
+        points = SHPReadParse.read_shp(shp_filename, shp_zip_pathname=self.path_to_shp_zip)
+        points_bbox = SHPReadParse.read_shp(shp_filename, **read_args)
+        points_bbox_ = SHPReadParse.read_shp(shp_filename, engine='numpy', **read_args)
+        assert 0 < len(points_bbox) == len(points_bbox_) < len(points)
+        assert points_bbox['osm_id'].tolist() == points_bbox_['osm_id'].tolist()
+        assert points_bbox['coordinates'].map(
+            lambda x: shapely.geometry.box(*bbox).intersects(shapely.geometry.Point(x[0]))).all()
+
+    @pytest.mark.parametrize('layer_name', ['railways', 'buildings_a', 'pois'])
+    def test_read_shp_numpy(self, layer_name):
+        shp_filename = f"gis_osm_{layer_name}_free_1.shp"
+        read_args = {'shp_zip_pathname': self.path_to_shp_zip}
+
+        for emulate_gpd in [False, True]:
+            shp_data = SHPReadParse.read_shp(shp_filename, emulate_gpd=emulate_gpd, **read_args)
+            shp_data_ = SHPReadParse.read_shp(
+                shp_filename, engine='numpy', emulate_gpd=emulate_gpd, **read_args)
+            assert shp_data_.equals(shp_data)
+            assert shp_data_.dtypes.equals(shp_data.dtypes)
+
+        mask = shapely.geometry.box(-0.7, 52.6, -0.5, 52.7)
+        shp_data_mask = SHPReadParse.read_shp(
+            shp_filename, engine='numpy', emulate_gpd=True, mask=mask, **read_args)
+        assert shp_data_mask['geometry'].map(mask.intersects).all()
+
+    def test_pyogrio_engine(self):
+        railways_shp = "gis_osm_railways_free_1.shp"
+        read_args = {'shp_zip_pathname': self.path_to_shp_zip}
+
+        rutland_railways = SHPReadParse.read_shp(railways_shp, emulate_gpd=True, **read_args)
+        rutland_railways_ = SHPReadParse.read_shp(railways_shp, engine='pyogrio', **read_args)
+        assert rutland_railways_['geometry'].equals(rutland_railways['geometry'])
+
+        rutland_railways_ = SHPReadParse.read_shp(
+            railways_shp, engine='pyogrio', columns=['osm_id', 'fclass'],
+            bbox=(-0.7, 52.6, -0.5, 52.7), **read_args)
+        assert rutland_railways_.columns.to_list() == ['osm_id', 'fclass', 'geometry']
+        assert 0 < len(rutland_railways_) < len(rutland_railways)
+
+        os.makedirs(self.extract_to_dir, exist_ok=True)
+        rutland_railways = SHPReadParse.read_shp(railways_shp, **read_args)
+        railways_shp_ = SHPReadParse.write_to_shapefile(
+            rutland_railways, self.extract_to_dir, shp_filename="railways", engine='pyogrio',
+            ret_shp_pathname=True)
+        assert SHPReadParse.read_shp(railways_shp_).equals(rutland_railways)
+
+        SHPReadParse.merge_shps(
+            [railways_shp_, railways_shp_], path_to_merged_dir=self.extract_to_dir,
+            engine='pyogrio')
+        merged_railways = SHPReadParse.read_shp(
+            os.path.join(self.extract_to_dir, "linestring.shp"), engine='pyogrio')
+        assert len(merged_railways) == 2 * len(rutland_railways)
+
+        shutil.rmtree(self.extract_to_dir)
+
+    @pytest.mark.parametrize('layer_name', ['railways', 'pois'])
+    def test_write_to_shapefile(self, layer_name):
+        shp_filename = f"gis_osm_{layer_name}_free_1.shp"
+        shp_data = SHPReadParse.read_shp(shp_filename, shp_zip_pathname=self.path_to_shp_zip)
+
+        os.makedirs(self.extract_to_dir, exist_ok=True)
+        shp_pathname = SHPReadParse.write_to_shapefile(
+            shp_data, self.extract_to_dir, shp_filename=layer_name, ret_shp_pathname=True)
+        assert SHPReadParse.read_shp(shp_pathname).equals(shp_data)
+
+        fields = SHPReadParse._specify_pyshp_fields(
+            shp_data, shp_data.columns[:-2], decimal_precision=5)
+        chunks = (shp_data[i:i + 50] for i in range(0, len(shp_data), 50))
+        shp_pathname_ = SHPReadParse.write_to_shapefile(
+            chunks, self.extract_to_dir, shp_filename=f"{layer_name}_chunks", fields=fields,
+            ret_shp_pathname=True)
+        for ext in [".shp", ".shx"]:
+            with open(shp_pathname.replace(".shp", ext), 'rb') as f1, \
+                    open(shp_pathname_.replace(".shp", ext), 'rb') as f2:
+                assert f1.read() == f2.read()
+
+        SHPReadParse.merge_shps([shp_pathname, shp_pathname_], self.extract_to_dir)
+        geo_typ = shp_data['shape_type'].map(SHPReadParse.SHAPE_TYPE_GEOM_NAME)[0].lower()
+        merged_data = SHPReadParse.read_shp(os.path.join(self.extract_to_dir, f"{geo_typ}.shp"))
+        assert merged_data.equals(pd.concat([shp_data, shp_data], ignore_index=True))
+
+        shutil.rmtree(self.extract_to_dir)
+
+    @pytest.mark.parametrize('geometry', [
+        [shapely.geometry.LineString([(0, 0), (1, 1)]),
+         shapely.geometry.MultiLineString([[(0, 0), (1, 0)], [(2, 2), (3, 3)]])],
+        [shapely.geometry.Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (1, 2), (2, 2)]]),
+         shapely.geometry.MultiPolygon([
+             shapely.geometry.box(0, 0, 1, 1), shapely.geometry.box(2, 2, 3, 3)])],
+        [shapely.geometry.MultiPoint([(0, 0), (1, 1)]), None],
+    ])
+    def test_write_to_shapefile_geometry(self, geometry):
+        shp_data = pd.DataFrame({'name': ['a', 'bc'], 'geometry': geometry})
+
+        os.makedirs(self.extract_to_dir, exist_ok=True)
+        shp_pathname = SHPReadParse.write_to_shapefile(
+            shp_data, self.extract_to_dir, shp_filename="geometry", ret_shp_pathname=True)
+
+        # All the parts (and holes) of the geometries are kept
+        with shapefile.Reader(shp_pathname) as f:
+            assert [r[0] for r in f.records()] == ['a', 'bc']
+            geometry_ = [
+                None if x.shapeType == shapefile.NULL else shapely.geometry.shape(x)
+                for x in f.shapes()]
+        assert all(
+            y is None if x is None else shapely.equals(x, y) for x, y in zip(geometry, geometry_))
+
+        pyogrio = pytest.importorskip('pyogrio')
+        shp_data_ = pyogrio.read_dataframe(shp_pathname)
+        assert shp_data_['name'].tolist() == ['a', 'bc']
+        assert all(
+            y is None if x is None else shapely.equals(x, y)
+            for x, y in zip(geometry, shp_data_['geometry']))
+
+        shutil.rmtree(self.extract_to_dir)
+
+    @pytest.mark.parametrize('workers', [None, 2])
+    @pytest.mark.parametrize('drop_duplicates', [True, False])
+    def test_merge_layer_shps(self, workers, drop_duplicates, capfd):
+        merge_dir = "tests\\data\\rutland\\temp-merge"
+        os.makedirs(merge_dir, exist_ok=True)
+        shp_zip_pathnames = [
+            shutil.copy(self.path_to_shp_zip, os.path.join(merge_dir, x))
+            for x in ["rutland-latest-free.shp.zip", "leicestershire-latest-free.shp.zip"]]
+
+        merged_shp_pathnames = SHPReadParse.merge_layer_shps(
+            shp_zip_pathnames, layer_name='transport', ret_shp_pathname=True, verbose=True,
+            workers=workers, drop_duplicates=drop_duplicates)
+        assert sorted(map(os.path.basename, merged_shp_pathnames)) == ['point.shp', 'polygon.shp']
+        assert sorted(os.listdir(merge_dir)) == sorted(
+            ["rut-lei-transport"] + list(map(os.path.basename, shp_zip_pathnames)))
+
+        transport_shp = "gis_osm_transport_free_1.shp"
+        rutland_transport = SHPReadParse.read_shp(
+            transport_shp, shp_zip_pathname=self.path_to_shp_zip)
+        merged_transport = SHPReadParse.read_shp(
+            [x for x in merged_shp_pathnames if x.endswith("point.shp")][0])
+
+        out, _ = capfd.readouterr()
+        if drop_duplicates:
+            # All features of the second (identical) region are at the "border"
+            assert merged_transport.equals(rutland_transport)
+            n_transport = sum(
+                len(SHPReadParse.read_shp(x, shp_zip_pathname=self.path_to_shp_zip))
+                for x in [transport_shp, "gis_osm_transport_a_free_1.shp"])
+            assert f"Dropped {n_transport} duplicated feature(s)" in out
+        else:
+            assert merged_transport.equals(
+                pd.concat([rutland_transport, rutland_transport], ignore_index=True))
+            assert "Dropped" not in out
+
+        shutil.rmtree(merge_dir)
+
+    def test_read_shp_from_zip(self):
+        shp_members = SHPReadParse.find_shp_zip_members(self.path_to_shp_zip, 'railways')
+        assert list(shp_members.keys()) == ['railways']
+        railways_shp = shp_members['railways'][0]
+        assert railways_shp == "gis_osm_railways_free_1.shp"
+
+        rutland_railways = SHPReadParse.read_shp(
+            railways_shp, shp_zip_pathname=self.path_to_shp_zip, emulate_gpd=True)
+
+        rutland_shp_dir = SHPReadParse.unzip_shp_zip(
+            self.path_to_shp_zip, extract_to=self.extract_to_dir, ret_extract_dir=True)
+        rutland_railways_ = SHPReadParse.read_shp(
+            os.path.join(rutland_shp_dir, railways_shp), emulate_gpd=True)
+        assert rutland_railways.equals(rutland_railways_)
+
+    @pytest.mark.parametrize('engine', ['pyshp', 'numpy', 'pyogrio'])
+    def test_read_shp_feature_names(self, engine):
+        transport_shp = "gis_osm_transport_free_1.shp"
+        read_args = {'shp_zip_pathname': self.path_to_shp_zip, 'emulate_gpd': True}
+
+        rutland_transport = SHPReadParse.read_shp(transport_shp, **read_args)
+        bus_stops = rutland_transport.query('fclass == "bus_stop"').reset_index(drop=True)
+
+        bus_stops_ = SHPReadParse.read_shp(
+            transport_shp, engine=engine, feature_names='bus_stop', **read_args)
+        assert bus_stops_['osm_id'].tolist() == bus_stops['osm_id'].tolist()
+        if engine != 'pyogrio':
+            assert bus_stops_.equals(bus_stops)
+
+        bus_stops_ = SHPReadParse.read_layer_shps(
+            transport_shp, feature_names='bus stop', engine=engine, **read_args)
+        assert bus_stops_['osm_id'].tolist() == bus_stops['osm_id'].tolist()
+
     def test_read_layer_shps(self):
         rutland_shp_dir = SHPReadParse.unzip_shp_zip(
             self.path_to_shp_zip, extract_to=self.extract_to_dir, ret_extract_dir=True)
@@ -267,6 +824,310 @@ class TestSHPReadParse:
         shutil.rmtree(self.extract_to_dir)
 
 
+class TestLayerCache:
+    path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+    cache_dir = "tests\\data\\rutland\\temp-cache"
+
+    @staticmethod
+    def test_make_cache_key():
+        cache_key = LayerCache.make_cache_key(readable=True, expand=True)
+        assert re.match(r'^[0-9a-f]{8}$', cache_key)
+        assert cache_key == LayerCache.make_cache_key(expand=True, readable=True)
+        assert cache_key != LayerCache.make_cache_key(readable=True, expand=True, parse_geometry=True)
+
+    @pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+    def test_save_load(self, file_format):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_geometry=True, parse_properties=True,
+            parse_other_tags=True, layer_names=['points', 'lines'])
+
+        layer_cache = LayerCache(f"{self.cache_dir}.{file_format}")
+        assert layer_cache.file_format == file_format
+        assert not layer_cache.is_valid(self.path_to_osm_pbf)
+
+        layer_cache.save(rutland_pbf, source_pathname=self.path_to_osm_pbf)
+        assert layer_cache.is_valid(self.path_to_osm_pbf)
+        assert layer_cache.layer_names == ['points', 'lines']
+
+        rutland_pbf_ = layer_cache.load()
+        for layer_name, layer_data in rutland_pbf.items():
+            layer_data_ = rutland_pbf_[layer_name]
+            assert layer_data_.columns.equals(layer_data.columns)
+            assert layer_data_['geometry'].map(lambda x: x.wkt).equals(
+                layer_data['geometry'].map(lambda x: x.wkt))
+            assert layer_data_['other_tags'].equals(layer_data['other_tags'])
+
+        rutland_lines = layer_cache.load(layer_names='lines', columns=['name', 'highway'])
+        assert list(rutland_lines.keys()) == ['lines']
+        assert rutland_lines['lines'].columns.tolist() == ['name', 'highway']
+
+        shutil.rmtree(layer_cache.cache_dir)
+
+    @pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+    def test_save_load_nan(self, file_format):
+        points = pd.DataFrame({
+            'id': [1, 2, 3],
+            'geometry': [shapely.geometry.Point(0, 1), np.nan, None],
+            'other_tags': [{'a': 'b'}, np.nan, None],
+        })
+
+        layer_cache = LayerCache(f"{self.cache_dir}-nan.{file_format}")
+        layer_cache.save({'points': points})
+
+        points_ = layer_cache.load()['points']
+        assert points_['geometry'].map(lambda x: x and x.wkt).tolist() == \
+            ['POINT (0 1)', None, None]
+        assert points_['other_tags'].tolist() == [{'a': 'b'}, None, None]
+
+        shutil.rmtree(layer_cache.cache_dir)
+
+
+class TestLayerStore:
+    path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+    store_dir = "tests\\data\\rutland\\temp.store"
+
+    def test_save_load(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_geometry=True, parse_properties=True,
+            parse_other_tags=True, layer_names=['points', 'lines'])
+
+        layer_store = LayerStore(self.store_dir)
+        assert not layer_store.is_valid(self.path_to_osm_pbf)
+
+        layer_store.save(rutland_pbf, source_pathname=self.path_to_osm_pbf)
+        assert layer_store.is_valid(self.path_to_osm_pbf)
+        assert layer_store.layer_names == ['points', 'lines']
+
+        rutland_lines = layer_store['lines']
+        assert len(rutland_lines) == len(rutland_pbf['lines'])
+        assert isinstance(rutland_lines.coordinates, np.memmap)
+
+        lines_geom = rutland_lines.column('geometry', start=10, stop=13)
+        assert lines_geom.index.tolist() == [10, 11, 12]
+        assert lines_geom.map(lambda x: x.wkt).tolist() == \
+            rutland_pbf['lines']['geometry'][10:13].map(lambda x: x.wkt).tolist()
+
+        # Only the strings (of the dictionaries) that are referred to are decoded, and only once
+        rutland_lines = layer_store['lines']
+        rows = [5, 3, 5, 100]
+        lines_ = rutland_lines.take(rows, columns=['name', 'other_tags'])
+        assert lines_['name'].tolist() == rutland_pbf['lines']['name'][rows].tolist()
+        assert lines_['other_tags'].tolist() == rutland_pbf['lines']['other_tags'][rows].tolist()
+        names, is_decoded = rutland_lines._strings['name.dict']
+        assert is_decoded.sum() == rutland_pbf['lines']['name'][rows].nunique()
+        assert is_decoded.sum() < len(is_decoded)
+        names[:-1][is_decoded] = 'cached'  # The decoded strings are reused
+        assert set(rutland_lines.take(rows, columns=['name'])['name'].dropna()) <= {'cached'}
+
+        rutland_pbf_ = layer_store.load()
+        for layer_name, layer_data in rutland_pbf.items():
+            layer_data_ = rutland_pbf_[layer_name]
+            assert layer_data_.columns.equals(layer_data.columns)
+            assert layer_data_['geometry'].map(lambda x: x.wkt).equals(
+                layer_data['geometry'].map(lambda x: x.wkt))
+            assert layer_data_['other_tags'].equals(layer_data['other_tags'])
+            assert layer_data_['name'].equals(layer_data['name'])
+
+        shutil.rmtree(layer_store.store_dir)
+
+    def test_save_failed(self):
+        layer_store = LayerStore(f"{self.store_dir}-failed")
+        points = pd.DataFrame({'id': [1, 2], 'name': ['a', None]})
+        layer_store.save({'points': points})
+
+        # Invalid data is rejected before the stored data is touched
+        with pytest.raises(TypeError):
+            layer_store.save({'points': points, 'lines': points.to_dict()})
+        with pytest.raises(ValueError):
+            layer_store.save({os.path.join('..', 'points'): points})
+
+        # Data that fails to be written (e.g. values that cannot be encoded) replaces nothing
+        with pytest.raises(TypeError):
+            layer_store.save({'points': points, 'lines': pd.DataFrame({'tags': [{1, 2}]})})
+
+        assert layer_store.layer_names == ['points']
+        assert layer_store.load()['points'].equals(points)
+        store_dir, store_dirname = os.path.split(os.path.abspath(layer_store.store_dir))
+        assert [x for x in os.listdir(store_dir) if store_dirname in x] == [store_dirname]
+
+        shutil.rmtree(layer_store.store_dir)
+
+
+class TestFeatureIndex:
+    path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+    store_dir = "tests\\data\\rutland\\temp-index.store"
+
+    def test_get_features(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_geometry=True, parse_properties=True,
+            parse_other_tags=True, layer_names=['points', 'lines'])
+        rutland_lines = rutland_pbf['lines']
+        ids = rutland_lines['id'].sample(n=50, random_state=0).tolist()
+        rutland_lines_ = rutland_lines.set_index('id').loc[ids]
+
+        feature_index = FeatureIndex(rutland_pbf)
+        assert feature_index.layer_names == ['points', 'lines']
+        assert feature_index.locate('lines', ids[:2] + [-1]).tolist() == \
+            [rutland_lines['id'].tolist().index(x) for x in ids[:2]] + [-1]
+
+        features = feature_index.get_features('lines', ids + [-1], columns=['geometry'])
+        assert features.columns.tolist() == ['id', 'geometry']
+        assert features['id'].tolist() == ids
+
+        features = feature_index.get_features(None, [rutland_pbf['points']['id'][0], ids[0]])
+        assert list(features.keys()) == ['points', 'lines']
+
+        # Look up the features in a store where the IDs are not sorted
+        layer_store = LayerStore(self.store_dir)
+        layer_store.save({'lines': rutland_lines.sample(frac=1, random_state=0)})
+        assert layer_store['lines'].id_order is not None
+
+        features = FeatureIndex(layer_store).get_features(
+            'lines', ids + [-1], columns=['geometry', 'other_tags'])
+        assert features['id'].tolist() == ids
+        assert features['geometry'].map(lambda x: x.wkt).tolist() == \
+            rutland_lines_['geometry'].map(lambda x: x.wkt).tolist()
+        assert features['other_tags'].tolist() == rutland_lines_['other_tags'].tolist()
+
+        shutil.rmtree(layer_store.store_dir)
+
+
+class TestTagIndex:
+    path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+    store_dir = "tests\\data\\rutland\\temp-tags.store"
+
+    def test_query(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_properties=True, parse_other_tags=True,
+            layer_names=['points'])
+        rutland_points = rutland_pbf['points']
+
+        amenities = rutland_points['other_tags'].map(lambda x: (x or {}).get('amenity'))
+        has_ref = rutland_points['ref'].notna() | \
+            rutland_points['other_tags'].map(lambda x: 'ref' in (x or {}))
+
+        tag_index = TagIndex(rutland_pbf)
+        rows = tag_index.query('points', all_of=['amenity=post_box'], none_of=['ref'])
+        assert rows.tolist() == np.flatnonzero((amenities == 'post_box') & ~has_ref).tolist()
+
+        rows = tag_index.query('points', any_of=['amenity=pub', ('amenity', 'bar')])
+        assert rows.tolist() == np.flatnonzero(amenities.isin(['pub', 'bar'])).tolist()
+        assert tag_index.query('points', all_of=['amenity', 'amenity=unknown']).size == 0
+
+        layer_store = LayerStore(self.store_dir)
+        layer_store.save(rutland_pbf)
+        TagIndex(layer_store).save()
+        assert os.path.isfile(os.path.join(self.store_dir, TagIndex.DIRNAME, "points.npz"))
+
+        features = TagIndex(layer_store).get_features(
+            'points', all_of=['highway=traffic_signals'], columns=['highway'])
+        assert features.index.tolist() == \
+            np.flatnonzero(rutland_points['highway'] == 'traffic_signals').tolist()
+        assert features['highway'].unique().tolist() == ['traffic_signals']
+
+        shutil.rmtree(layer_store.store_dir)
+
+    @staticmethod
+    def test_query_mixed_rows():
+        points = pd.DataFrame({
+            'id': [1, 2, 3, 4],
+            'highway': ['primary', 5, None, 'primary'],
+            'other_tags': ['"a"=>"b"', '', '"a"=>"b","c"', None],
+            'properties': [None, {'other_tags': '"a"=>"c"', 'lanes': 2}, None, {'name': 'x'}],
+        })
+
+        tag_index = TagIndex({'points': points})
+        assert tag_index.query('points', all_of=['a=b']).tolist() == [0]
+        assert tag_index.query('points', all_of=['a']).tolist() == [0, 1]
+        assert tag_index.query('points', all_of=['highway=primary']).tolist() == [0, 3]
+        assert tag_index.query('points', all_of=['highway']).tolist() == [0, 3]
+        assert tag_index.query('points', all_of=['name=x']).tolist() == [3]
+        assert tag_index.query('points', any_of=['lanes', 'c']).size == 0
+
+
+class TestSpatialIndex:
+    path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+    store_dir = "tests\\data\\rutland\\temp-spatial.store"
+
+    def test_query(self):
+        rutland_pbf = PBFReadParse.read_pbf(
+            self.path_to_osm_pbf, expand=True, parse_geometry=True, layer_names=['lines'])
+        lines_geom = rutland_pbf['lines']['geometry'].to_numpy()
+
+        spatial_index = SpatialIndex(rutland_pbf)
+
+        bbox = (-0.74, 52.66, -0.72, 52.68)
+        rows = spatial_index.query('lines', bbox)
+        assert rows.tolist() == np.flatnonzero(
+            shapely.intersects(shapely.envelope(lines_geom), shapely.box(*bbox))).tolist()
+
+        point = shapely.geometry.Point(-0.7278, 52.6703)
+        area = point.buffer(0.002)
+        for predicate in ['intersects', 'contains']:
+            rows = spatial_index.query('lines', area, predicate=predicate)
+            assert rows.tolist() == \
+                np.flatnonzero(getattr(shapely, predicate)(area, lines_geom)).tolist()
+
+        rows, distances = spatial_index.nearest('lines', point, k=5, return_distance=True)
+        assert rows.tolist() == \
+            np.argsort(shapely.distance(point, lines_geom), kind='stable')[:5].tolist()
+        assert np.all(np.diff(distances) >= 0)
+
+        # Build the tree from the bounding boxes saved with a store
+        layer_store = LayerStore(self.store_dir)
+        layer_store.save(rutland_pbf)
+        SpatialIndex(layer_store).save()
+        assert os.path.isfile(os.path.join(self.store_dir, SpatialIndex.DIRNAME, "lines.npz"))
+
+        spatial_index_ = SpatialIndex(layer_store)
+        assert spatial_index_.query('lines', area, predicate='intersects').tolist() == \
+            spatial_index.query('lines', area, predicate='intersects').tolist()
+        assert spatial_index_.nearest('lines', point, k=5).tolist() == rows.tolist()
+
+        shutil.rmtree(layer_store.store_dir)
+
+    @staticmethod
+    def test_nearest_empty():
+        point = shapely.geometry.Point(0, 1)
+        for geometry in [[], [None, np.nan]]:
+            spatial_index = SpatialIndex({'points': pd.DataFrame({'geometry': geometry})})
+            assert spatial_index.nearest('points', point).size == 0
+
+            rows, distances = spatial_index.nearest('points', point, k=3, return_distance=True)
+            assert rows.dtype == np.int64 and rows.size == 0 and distances.size == 0
+            assert spatial_index.query('points', point.buffer(1)).size == 0
+
+
+class TestLazyLayers:
+
+    @staticmethod
+    def test_lazy_layers():
+        read_layers = []
+
+        def read_layer(layer_name):
+            read_layers.append(layer_name)
+            return layer_name.upper()
+
+        lazy_layers = LazyLayers(['points', 'lines'], read_layer)
+        assert list(lazy_layers.keys()) == ['points', 'lines']
+        assert len(lazy_layers) == 2 and 'lines' in lazy_layers
+        assert read_layers == []
+
+        assert lazy_layers['lines'] == 'LINES'
+        assert lazy_layers['lines'] == 'LINES'
+        assert read_layers == ['lines']
+        assert lazy_layers.loaded_layer_names == ['lines']
+
+        with pytest.raises(KeyError):
+            _ = lazy_layers['multipolygons']
+
+        lazy_layers.release('lines')
+        assert lazy_layers.loaded_layer_names == []
+
+        assert dict(lazy_layers.items()) == {'points': 'POINTS', 'lines': 'LINES'}
+        assert read_layers == ['lines', 'points', 'lines']
+
+
 class TestReader:
 
     @staticmethod
@@ -298,6 +1159,210 @@ class TestReader:
         r = _Reader()
         assert r.data_paths == []
 
+    @staticmethod
+    def test_make_pbf_pkl_pathname():
+        pbf_pathname = "rutland-latest.osm.pbf"
+
+        assert _Reader.make_pbf_pkl_pathname(pbf_pathname, True, []) == 'rutland-latest-pbf.pkl'
+        assert _Reader.make_pbf_pkl_pathname(pbf_pathname, False, ['lines']) == \
+               'rutland-latest-lines-raw.pkl'
+        assert _Reader.make_pbf_pkl_pathname(
+            pbf_pathname, True, PBFReadParse.validate_pbf_layer_names('all')) == \
+               'rutland-latest-pbf.pkl'
+
+        pkl_pathnames = [
+            _Reader.make_pbf_pkl_pathname(pbf_pathname, True, ['lines'], **kwargs)
+            for kwargs in ({'tag_filter': {'highway': None}}, {'bbox': (-0.76, 52.66, -0.7, 52.69)},
+                           {'mask': shapely.geometry.box(-0.76, 52.66, -0.7, 52.69)},
+                           {'layer_attributes': {'lines': ['name', 'maxspeed']}})]
+        assert len(set(pkl_pathnames)) == 4
+        assert all(re.match(r'rutland-latest-lines-[0-9a-f]{8}-pbf\.pkl', x) for x in pkl_pathnames)
+
+        parse_options = {
+            'expand': False, 'parse_geometry': False, 'parse_properties': False,
+            'parse_other_tags': False, 'compact': False}
+        assert _Reader.make_pbf_pkl_pathname(pbf_pathname, True, [], **parse_options) == \
+               'rutland-latest-pbf.pkl'
+        pkl_pathnames = [
+            _Reader.make_pbf_pkl_pathname(pbf_pathname, True, [], **{**parse_options, k: True})
+            for k in parse_options.keys()]
+        assert len(set(pkl_pathnames)) == 5
+        assert all(re.match(r'rutland-latest-[0-9a-f]{8}-pbf\.pkl', x) for x in pkl_pathnames)
+
+    @staticmethod
+    def test_read_osm_pbf_pickle_parse_options():
+        from pydriosm.reader import GeofabrikReader
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        read_args = {
+            'readable': True, 'layer_names': 'other_relations', 'download': False,
+            'pickle_it': True, 'ret_pickle_path': True}
+
+        rutland_pbf, path_to_pickle = gfr.read_osm_pbf('rutland', data_dir, **read_args)
+        rutland_pbf_, path_to_pickle_ = gfr.read_osm_pbf(
+            'rutland', data_dir, expand=True, **read_args)
+        assert path_to_pickle != path_to_pickle_
+        # The data parsed with different options is not loaded from the same pickle file
+        assert isinstance(rutland_pbf['other_relations'], pd.Series)
+        assert isinstance(rutland_pbf_['other_relations'], pd.DataFrame)
+        assert 'id' in rutland_pbf_['other_relations'].columns
+
+        rutland_pbf__, _ = gfr.read_osm_pbf('rutland', data_dir, expand=True, **read_args)
+        assert rutland_pbf__['other_relations'].equals(rutland_pbf_['other_relations'])
+
+        # The format of the compacted geometry is also a part of the pathname
+        compact_args = {'expand': True, 'parse_geometry': True, 'compact': True, **read_args}
+        rutland_pbf_c, path_to_pickle_c = gfr.read_osm_pbf('rutland', data_dir, **compact_args)
+        rutland_pbf_q, path_to_pickle_q = gfr.read_osm_pbf(
+            'rutland', data_dir, geometry_format='quantized', **compact_args)
+        assert path_to_pickle_q not in {path_to_pickle_c, path_to_pickle_}
+        assert rutland_pbf_c['other_relations']['geometry'].dtype == object
+        assert rutland_pbf_q['other_relations']['geometry'].dtype == 'quantized_geometry'
+        rutland_pbf_q_, _ = gfr.read_osm_pbf(
+            'rutland', data_dir, geometry_format='quantized', **compact_args)
+        assert rutland_pbf_q_['other_relations']['geometry'].dtype == 'quantized_geometry'
+
+        for x in [path_to_pickle, path_to_pickle_, path_to_pickle_c, path_to_pickle_q]:
+            os.remove(x)
+
+    @staticmethod
+    def test_make_cache_dir():
+        cache_dir = _Reader.make_cache_dir(
+            "rutland-latest-pbf.pkl", 'parquet', readable=True, expand=True)
+        assert re.match(r'^rutland-latest-pbf-[0-9a-f]{8}\.parquet$', cache_dir)
+        assert cache_dir != _Reader.make_cache_dir(
+            "rutland-latest-pbf.pkl", 'parquet', readable=True, expand=True, parse_geometry=True)
+
+    @staticmethod
+    def test_read_osm_pbf_many():
+        from pydriosm.reader import GeofabrikReader
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        read_args = {'expand': True, 'layer_names': 'other_relations', 'download': False}
+
+        rutland_pbf = gfr.read_osm_pbf_many(['rutland'], data_dir, workers=1, **read_args)
+        assert list(rutland_pbf.keys()) == ['Rutland']
+        assert rutland_pbf['Rutland']['other_relations'].equals(
+            gfr.read_osm_pbf('rutland', data_dir, **read_args)['other_relations'])
+
+        layer_sizes = []
+        rutland_pbf_ = gfr.read_osm_pbf_many(
+            ['rutland'], data_dir, callback=lambda x, dat: layer_sizes.append((x, len(dat))),
+            workers=1, max_memory=1, **read_args)
+        assert rutland_pbf_ is None
+        assert layer_sizes == [('Rutland', 1)]
+
+        rutland_pbf_ = gfr.read_osm_pbf_many(
+            ['rutland'], data_dir, workers=1, pickle_it=True, readable=True, **read_args)
+        assert os.path.isfile(rutland_pbf_['Rutland'])
+        os.remove(rutland_pbf_['Rutland'])
+
+    @staticmethod
+    def test_read_osm_pbf_many_killed_worker(monkeypatch):
+        from pydriosm.reader import GeofabrikReader
+
+        def _read_osm_pbf_file(cls, subregion_name, **kwargs):
+            os._exit(1)  # e.g. the worker process is killed for running out of memory
+
+        monkeypatch.setattr(GeofabrikReader, '_read_osm_pbf_file', classmethod(_read_osm_pbf_file))
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+            gfr.read_osm_pbf_many(['rutland'], data_dir, workers=1, download=False)
+
+    @staticmethod
+    def test_read_osm_pbf_many_failed(monkeypatch, capsys):
+        from pydriosm.reader import GeofabrikReader
+
+        def read_pbf(*args, **kwargs):
+            raise ImportError("No module named 'osgeo'")
+
+        monkeypatch.setattr(PBFReadParse, 'read_pbf', read_pbf)
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        layer_sizes = []
+        for callback in [None, lambda x, dat: layer_sizes.append((x, len(dat)))]:
+            with pytest.raises(RuntimeError, match='Rutland') as e:
+                gfr.read_osm_pbf_many(
+                    ['rutland'], data_dir, callback=callback, workers=1, download=False,
+                    expand=True, layer_names='points')
+            assert isinstance(e.value.__cause__, ImportError)
+            assert 'Failed. No module named' in capsys.readouterr().out  # Without verbose
+        assert layer_sizes == []
+
+    @staticmethod
+    def test_drop_duplicate_features():
+        from pydriosm.reader import GeofabrikReader
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        read_args = {'expand': True, 'layer_names': 'other_relations', 'download': False}
+        rutland_pbf = gfr.read_osm_pbf('rutland', data_dir, **read_args)
+        other_relations = rutland_pbf['other_relations']
+
+        seen_ids = {}
+        rutland_pbf, n_dropped = _Reader._drop_duplicate_features(rutland_pbf, seen_ids)
+        assert n_dropped == 0
+        assert rutland_pbf['other_relations'] is other_relations
+        assert seen_ids == {'other_relations': set(other_relations['id'])}
+
+        rutland_pbf_ = {'other_relations': other_relations, 'points': None}
+        rutland_pbf_, n_dropped = _Reader._drop_duplicate_features(rutland_pbf_, seen_ids)
+        assert n_dropped == len(other_relations)
+        assert rutland_pbf_['other_relations'].empty and rutland_pbf_['points'] is None
+
+    @staticmethod
+    def test_read_osm_pbf_lazily():
+        path_to_osm_pbf = "tests\\data\\rutland\\rutland-latest.osm.pbf"
+
+        rutland_pbf = _Reader()._read_osm_pbf_lazily(
+            path_to_osm_pbf, chunk_size_limit=50, layer_names=None, readable=False, expand=True)
+        assert list(rutland_pbf.keys()) == PBFReadParse.validate_pbf_layer_names('all')
+        assert rutland_pbf.loaded_layer_names == []
+
+        rutland_pbf_lines = rutland_pbf['lines']
+        assert rutland_pbf.loaded_layer_names == ['lines']
+        assert rutland_pbf_lines.equals(
+            PBFReadParse.read_pbf(path_to_osm_pbf, expand=True, layer_names='lines')['lines'])
+
+    @staticmethod
+    def test_read_shp_zip():
+        from pydriosm.reader import GeofabrikReader
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        extract_dir = os.path.join(data_dir, "rutland", "rutland-latest-free-shp")
+
+        rutland_shp = gfr.read_shp_zip(
+            'rutland', layer_names='railways', data_dir=data_dir, download=False)
+        assert list(rutland_shp.keys()) == ['railways']
+        assert not os.path.exists(extract_dir)
+
+        rutland_shp_ = gfr.read_shp_zip(
+            'rutland', layer_names='railways', data_dir=data_dir, download=False,
+            rm_extracts=False)
+        assert os.path.isdir(extract_dir)
+        assert rutland_shp['railways'].equals(rutland_shp_['railways'])
+
+        shutil.rmtree(extract_dir)
+
+    @staticmethod
+    def test_read_shp_zip_workers():
+        from pydriosm.reader import GeofabrikReader
+
+        gfr, data_dir = GeofabrikReader(), os.path.join("tests", "data")
+        read_args = {'layer_names': ['railways', 'transport', 'roads'], 'download': False}
+
+        rutland_shp = gfr.read_shp_zip('rutland', data_dir=data_dir, **read_args)
+        rutland_shp_ = gfr.read_shp_zip('rutland', data_dir=data_dir, workers=2, **read_args)
+        assert isinstance(rutland_shp_, collections.OrderedDict)
+        assert list(rutland_shp_.keys()) == ['railways', 'transport', 'roads']
+        assert all(rutland_shp[k].equals(rutland_shp_[k]) for k in rutland_shp.keys())
+
+        shp_zip_pathname = os.path.join(data_dir, "rutland", "rutland-latest-free.shp.zip")
+        shp_members = SHPReadParse.find_shp_zip_members(shp_zip_pathname, ['railways', 'roads'])
+        railways_memory, roads_memory = gfr._estimate_shp_memory(
+            list(shp_members.values()), shp_zip_pathname=shp_zip_pathname)
+        assert 0 < railways_memory < roads_memory
+
 
 if __name__ == '__main__':
     pytest.main()
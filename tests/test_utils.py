@@ -55,6 +55,53 @@ def test_check_json_engine(engine):
     assert isinstance(result, types.ModuleType)
 
 
+def test_get_available_memory():
+    from pydriosm.utils import get_available_memory
+
+    available_memory = get_available_memory()
+
+    assert available_memory is None or available_memory > 0
+
+
+def test_sort_layer_data():
+    from pydriosm.utils import sort_layer_data
+    import numpy as np
+    import pandas as pd
+
+    layer_data = pd.DataFrame({'id': [1, 2, 5], 'name': ['a', 'b', 'c']}, index=[3, 4, 5])
+    sorted_data = sort_layer_data(layer_data)
+    assert sorted_data.index.equals(pd.RangeIndex(3))
+    assert np.shares_memory(sorted_data['id'].to_numpy(), layer_data['id'].to_numpy())
+    assert layer_data.index.tolist() == [3, 4, 5]
+
+    layer_data = pd.DataFrame({'id': [5, 1, 2], 'name': ['c', 'a', 'b']})
+    sorted_data = sort_layer_data(layer_data)
+    assert sorted_data['id'].tolist() == [1, 2, 5]
+    assert sorted_data['name'].tolist() == ['a', 'b', 'c']
+    assert layer_data['id'].tolist() == [5, 1, 2]
+
+    sorted_data = sort_layer_data(layer_data, by=['name', 'id'])
+    assert sorted_data['name'].tolist() == ['a', 'b', 'c']
+
+
+def test_drop_duplicate_ids():
+    from pydriosm.utils import drop_duplicate_ids
+    import pandas as pd
+
+    seen_ids = set()
+    layer_data = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+    layer_data_, n_dropped = drop_duplicate_ids(layer_data, seen_ids)
+    assert layer_data_ is layer_data and n_dropped == 0
+    assert seen_ids == {1, 2, 3}
+
+    layer_data = pd.DataFrame({'osm_id': [3, 4, 4, 5], 'name': ['c', 'd', 'd', 'e']})
+    layer_data_, n_dropped = drop_duplicate_ids(layer_data, seen_ids, by='osm_id')
+    assert n_dropped == 2
+    assert layer_data_['osm_id'].tolist() == [4, 5]
+    assert layer_data_.index.tolist() == [0, 1]
+    assert seen_ids == {1, 2, 3, 4, 5}
+
+
 def test_remove_osm_file(capfd):
     from pydriosm.utils import remove_osm_file
 